@@ -0,0 +1,300 @@
+"""Benchmarks for geometrica's trigonometry and transformation hot paths.
+
+Run from the repository root with::
+
+    $ python benchmarks/benchmark.py
+    $ python benchmarks/benchmark.py --sizes small 1e4 --save baseline.json
+    $ python benchmarks/benchmark.py --compare baseline.json
+
+Every workload is timed (best of several repeats) and reported as operations
+per second - points per second for transformations, triangles per second for
+trigonometry - along with the peak memory allocated while it runs. Results can
+be saved as a JSON baseline, and later runs compared against it - the script
+exits with status 1 if any workload has become slower by more than the
+tolerance.
+
+Import time is benchmarked too, by importing geometrica in fresh interpreters
+and using one of its functions - this is what a short-lived script pays before
+it does any work. So are single calls with their inputs checked and inside
+``trusted_inputs()``, to show what skipping the checks saves per call."""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+from random import Random
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import geometrica
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SIZES = {"small": 10, "1e4": 10 ** 4, "1e6": 10 ** 6, "1e7": 10 ** 7}
+TUPLE_LIMIT = 10 ** 6
+VALIDATION_CALLS = 1000
+IMPORTS = {
+ "import/geometrica": "import geometrica",
+ "import/sine_law": "import geometrica; geometrica.sine_law",
+ "import/rotate": "import geometrica; geometrica.rotate",
+ "import/everything": "from geometrica import *"
+}
+IMPORT_SCRIPT = """import sys, time, tracemalloc
+sys.path.insert(0, %r)
+if %r:
+    tracemalloc.start()
+start = time.perf_counter()
+%s
+print(time.perf_counter() - start, tracemalloc.get_traced_memory()[1])"""
+
+def make_points(kind, size):
+    """Creates a set of random points of a given kind - ``"tuples"``,
+    ``"pointset"`` or ``"array"``."""
+
+    random = Random(size)
+    values = array("d", (random.uniform(-100, 100) for _ in range(size * 3)))
+    if kind == "pointset":
+        return geometrica.PointSet.from_buffer(values)
+    if kind == "array":
+        return numpy.frombuffer(values, dtype=float).reshape(-1, 3).copy()
+    values = iter(values)
+    return list(zip(values, values, values))
+
+
+def make_triangles(size):
+    """Creates side-angle-angle and side-side-angle triangles for the trig
+    laws."""
+
+    random = Random(size)
+    return (
+     [random.uniform(1, 10) for _ in range(size)],
+     [random.uniform(10, 80) for _ in range(size)],
+     [random.uniform(10, 80) for _ in range(size)]
+    )
+
+
+def workloads(sizes):
+    """Yields (name, operations, function) for every workload to run at the
+    given sizes."""
+
+    kinds = ["tuples", "pointset"] + (["array"] if numpy is not None else [])
+    for size_name in sizes:
+        size = SIZES[size_name]
+        for kind in kinds:
+            if kind == "tuples" and size > TUPLE_LIMIT:
+                continue
+            points = make_points(kind, size)
+            yield (
+             "translate/%s/%s" % (kind, size_name), size,
+             lambda points=points: geometrica.translate(points, 1, 2, 3)
+            )
+            yield (
+             "rotate/%s/%s" % (kind, size_name), size,
+             lambda points=points: geometrica.rotate(points, "x", 37)
+            )
+        if size > TUPLE_LIMIT:
+            continue
+        sides, angles1, angles2 = make_triangles(size)
+
+        def scalar_sine(sides=sides, angles1=angles1, angles2=angles2):
+            sine_law = geometrica.sine_law
+            for side, angle1, angle2 in zip(sides, angles1, angles2):
+                sine_law(side1=side, angle1=angle1, angle2=angle2)
+
+        def scalar_cosine(sides=sides, angles=angles1):
+            cosine_law = geometrica.cosine_law
+            for side, angle in zip(sides, angles):
+                cosine_law(side, side, angle=angle)
+
+        def batched_sine(sides=sides, angles1=angles1, angles2=angles2):
+            geometrica.sine_laws(side1=sides, angle1=angles1, angle2=angles2)
+
+        def batched_cosine(sides=sides, angles=angles1):
+            geometrica.cosine_laws(sides, sides, angle=angles)
+
+        yield "sine_law/scalar/%s" % size_name, size, scalar_sine
+        yield "sine_law/batched/%s" % size_name, size, batched_sine
+        yield "cosine_law/scalar/%s" % size_name, size, scalar_cosine
+        yield "cosine_law/batched/%s" % size_name, size, batched_cosine
+        if numpy is not None:
+            sides, angles1, angles2 = [
+             numpy.array(values) for values in (sides, angles1, angles2)
+            ]
+            yield "sine_law/array/%s" % size_name, size, (
+             lambda sides=sides, angles1=angles1, angles2=angles2:
+             geometrica.sine_laws(sides, angles1, None, angles2)
+            )
+            yield "cosine_law/array/%s" % size_name, size, (
+             lambda sides=sides, angles=angles1:
+             geometrica.cosine_laws(sides, sides, angle=angles)
+            )
+
+
+def validation_workloads():
+    """Yields (name, operations, function) for single calls of the scalar
+    functions, once with their inputs checked and once inside
+    ``trusted_inputs()`` - each operation is one call, with one point for the
+    transformations."""
+
+    calls = {
+     "sine_law": lambda: geometrica.sine_law(
+      side1=7, angle1=35, angle2=105
+     ),
+     "cosine_law": lambda: geometrica.cosine_law(12, 9, angle=87),
+     "translate": lambda: geometrica.translate([(1, 2, 3)], 4, 5, 6),
+     "rotate": lambda: geometrica.rotate([(1, 2, 3)], "x", 37)
+    }
+    for name, call in calls.items():
+
+        def checked(call=call):
+            for _ in range(VALIDATION_CALLS):
+                call()
+
+        def trusted(call=call):
+            with geometrica.trusted_inputs():
+                for _ in range(VALIDATION_CALLS):
+                    call()
+
+        yield "%s/checked" % name, VALIDATION_CALLS, checked
+        yield "%s/trusted" % name, VALIDATION_CALLS, trusted
+
+
+def measure(function, operations, repeats, minimum=0.05):
+    """Times a function, returning its best rate in operations per second and
+    the peak memory in bytes it allocates. Quick functions are called in a loop
+    enough times to take at least ``minimum`` seconds, so that timer noise does
+    not dominate."""
+
+    number = 1
+    while True:
+        elapsed = time_calls(function, number)
+        if elapsed >= minimum:
+            break
+        number *= 10
+    best = elapsed
+    for _ in range(repeats - 1):
+        best = min(best, time_calls(function, number))
+    gc.collect()
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return operations * number / best, peak
+
+
+def time_calls(function, number):
+    """Returns how long it takes to call a function some number of times."""
+
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return time.perf_counter() - start
+
+
+def measure_import(statement, repeats):
+    """Runs an import statement in fresh interpreters, returning its best rate
+    in imports per second and the peak memory in bytes it allocates."""
+
+    best = min(run_import(statement)[0] for _ in range(repeats))
+    return 1 / best, run_import(statement, trace=True)[1]
+
+
+def run_import(statement, trace=False):
+    """Runs an import statement in a new interpreter, returning how long it
+    took and (if traced) its peak memory."""
+
+    output = subprocess.run(
+     [sys.executable, "-c", IMPORT_SCRIPT % (ROOT, trace, statement)],
+     stdout=subprocess.PIPE, universal_newlines=True, check=True
+    ).stdout
+    elapsed, peak = output.split()
+    return float(elapsed), int(peak)
+
+
+def compare(results, baseline, tolerance):
+    """Compares results against a baseline, returning the names of workloads
+    which have become slower by more than the tolerance."""
+
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            if result["ops"] < baseline[name]["ops"] * (1 - tolerance):
+                regressions.append(name)
+    return regressions
+
+
+def report(name, ops, peak, baseline):
+    """Prints one workload's results, and how they compare with the baseline."""
+
+    change = ""
+    if name in baseline:
+        change = "%+.1f%%" % ((ops / baseline[name]["ops"] - 1) * 100)
+    print("%-32s %16.1f %12.1f %10s" % (name, ops, peak / 1024, change))
+    return {"ops": ops, "peak": peak}
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark geometrica.")
+    parser.add_argument(
+     "--sizes", nargs="+", choices=list(SIZES), default=list(SIZES),
+     help="the workload sizes to run"
+    )
+    parser.add_argument(
+     "--repeats", type=int, default=3, help="timing repeats per workload"
+    )
+    parser.add_argument(
+     "--no-imports", action="store_true", help="skip the import benchmarks"
+    )
+    parser.add_argument(
+     "--no-validation", action="store_true",
+     help="skip the checked and trusted call benchmarks"
+    )
+    parser.add_argument("--save", help="save the results to this JSON file")
+    parser.add_argument("--compare", help="compare with this JSON baseline")
+    parser.add_argument(
+     "--tolerance", type=float, default=0.2,
+     help="the slowdown allowed before a workload counts as a regression"
+    )
+    args = parser.parse_args(args)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    results = {}
+    print("%-32s %16s %12s %10s" % (
+     "Workload", "ops/sec", "peak KiB", "change"
+    ))
+    for name, operations, function in workloads(args.sizes):
+        ops, peak = measure(function, operations, args.repeats)
+        results[name] = report(name, ops, peak, baseline)
+    if not args.no_validation:
+        for name, operations, function in validation_workloads():
+            ops, peak = measure(function, operations, args.repeats)
+            results[name] = report(name, ops, peak, baseline)
+    if not args.no_imports:
+        for name, statement in IMPORTS.items():
+            ops, peak = measure_import(statement, args.repeats)
+            results[name] = report(name, ops, peak, baseline)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+             "geometrica": geometrica.__version__,
+             "python": sys.version.split()[0],
+             "numpy": numpy.__version__ if numpy is not None else None,
+             "results": results
+            }, f, indent=1, sort_keys=True)
+    regressions = compare(results, baseline, args.tolerance)
+    for name in regressions:
+        print("REGRESSION: %s" % name)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,50 @@
+"""geometrica is a pure-Python library for handling geometry and
+trigonometry.
+
+The names below are loaded from their modules the first time they are used,
+so that ``import geometrica`` is quick, and a program which only uses
+``geometrica.sine_law`` never imports the transformation code."""
+
 __version__ = "0.2.0"
 __author__ = "Sam Ireland"
 
-from .trig import sine_law, cosine_law
-from .transform import translate, rotate
+_LOCATIONS = {
+ "sine_law": "trig", "cosine_law": "trig",
+ "sine_laws": "trig", "cosine_laws": "trig", "solve_triangle": "trig",
+ "translate": "transform", "rotate": "transform",
+ "scale": "transform", "reflect": "transform", "shear": "transform",
+ "apply_matrix": "transform",
+ "itranslate": "transform", "irotate": "transform",
+ "Transform": "transform", "write_points": "transform",
+ "atranslate": "asynchronous", "arotate": "asynchronous",
+ "atransform": "asynchronous",
+ "transform_frames": "trajectory",
+ "PointSet": "pointset", "KDTree": "spatial",
+ "distances": "measure", "angles": "measure", "dihedrals": "measure",
+ "distance_matrix": "measure",
+ "find_bounds": "bounds", "inside_box": "bounds", "inside_sphere": "bounds",
+ "inside_planes": "bounds",
+ "superpose": "align", "superpose_frames": "align", "rmsd": "align",
+ "Quaternion": "quaternion", "slerp": "quaternion",
+ "load_points": "files", "save_points": "files",
+ "transform_file": "files",
+ "set_validation": "checks", "trusted_inputs": "checks",
+ "set_instrumentation": "instrument"
+}
+
+__all__ = list(_LOCATIONS)
+
+def __getattr__(name):
+    if name not in _LOCATIONS:
+        raise AttributeError(
+         "module '%s' has no attribute '%s'" % (__name__, name)
+        )
+    from importlib import import_module
+    module = import_module("." + _LOCATIONS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,196 @@
+"""Contains functions for superposing one set of points onto another."""
+
+from math import sqrt
+from . import kernel
+from .quaternion import Quaternion
+from .transform import accept_objects, is_array, Transform
+from .transform import _as_array, _collect
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@accept_objects
+def superpose(points, reference):
+    """Finds the rotation and translation which best lines a set of points up
+    with a reference set of the same length - that is, which minimises the
+    root-mean-square deviation (RMSD) between each point and the reference
+    point in the same position.
+
+    Horn's quaternion method is used, so the result is always a proper
+    rotation, never a reflection. The Transform can be passed to anything
+    which takes one - ``transform.apply(points)`` gives the superposed points.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects, to be moved.
+    :param reference: The collection of points to line them up with.
+    :raises ValueError: if the collections are different lengths or empty.
+    :returns: The :py:class:`.Transform` and the RMSD after applying it."""
+
+    transforms, deviations = _superpose_all([points], _prepare(reference))
+    return transforms[0], deviations[0]
+
+
+def superpose_frames(frames, reference):
+    """Superposes many frames - for example, the snapshots of a trajectory -
+    onto one reference, as :py:func:`.superpose` does for one. The reference's
+    centroid and centred coordinates are only worked out once, and if NumPy is
+    installed the frames are all superposed in a few vectorised operations.
+
+    :param frames: An (F, N, 3) NumPy array, or an iterable of collections of\
+    points.
+    :param reference: The collection of N points to line them up with.
+    :raises ValueError: if any frame is a different length to the reference.
+    :returns: A ``tuple`` of Transforms and the RMSD of each frame (an array\
+    if NumPy is installed, otherwise a ``tuple``)."""
+
+    return _superpose_all(frames, _prepare(reference))
+
+
+@accept_objects
+def rmsd(points, reference):
+    """Measures the root-mean-square deviation between two sets of points of
+    the same length, as they are - without superposing them first.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param reference: The collection of points to compare them with.
+    :raises ValueError: if the collections are different lengths or empty.
+    :rtype: ``float``"""
+
+    reference = _collect(reference)
+    _check_lengths(points, reference)
+    if numpy is not None:
+        difference = _as_array(points) - _as_array(reference)
+        return float(numpy.sqrt((difference ** 2).sum() / len(difference)))
+    total = 0
+    for (x1, y1, z1), (x2, y2, z2) in zip(points, reference):
+        total += (x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2
+    return sqrt(total / len(points))
+
+
+def _check_lengths(points, reference):
+    if len(points) != len(reference):
+        raise ValueError("%i points cannot be compared with %i points" % (
+         len(points), len(reference)
+        ))
+    if not len(points):
+        raise ValueError("There must be at least one point")
+
+
+def _prepare(reference):
+    """Works out the parts of the superposition which only depend on the
+    reference - its centroid, its coordinates relative to the centroid, and
+    the sum of their squares."""
+
+    reference = _collect(reference)
+    if not len(reference):
+        raise ValueError("There must be at least one point")
+    if numpy is not None:
+        reference = _as_array(reference)
+        centroid = reference.mean(axis=0)
+        centred = reference - centroid
+        return centroid, centred, float((centred ** 2).sum())
+    reference = tuple(reference)
+    centroid = tuple([sum(values) / len(reference) for values in zip(
+     *reference
+    )])
+    centred = [tuple([
+     value - middle for value, middle in zip(point, centroid)
+    ]) for point in reference]
+    return centroid, centred, sum([
+     x * x + y * y + z * z for x, y, z in centred
+    ])
+
+
+def _superpose_all(frames, prepared):
+    if numpy is not None:
+        if not is_array(frames):
+            frames = [_as_array(_collect(frame)) for frame in frames]
+            for frame in frames:
+                _check_lengths(frame, prepared[1])
+            frames = numpy.array(frames, dtype=float).reshape(
+             -1, len(prepared[1]), 3
+            )
+        elif frames.ndim != 3 or frames.shape[1:] != prepared[1].shape:
+            raise ValueError("Frames must have shape (F, %i, 3), not %s" % (
+             len(prepared[1]), str(frames.shape)
+            ))
+        return _superpose_arrays(frames.astype(float, copy=False), *prepared)
+    results = [_superpose_points(
+     tuple(_collect(frame)), *prepared
+    ) for frame in frames]
+    return (
+     tuple([result[0] for result in results]),
+     tuple([result[1] for result in results])
+    )
+
+
+def _superpose_arrays(frames, target_centroid, target, target_squares):
+    centroids = frames.mean(axis=1)
+    centred = frames - centroids[:, None, :]
+    squares = (centred ** 2).sum(axis=(1, 2))
+    covariance = numpy.einsum("fni,nj->fij", centred, target)
+    values, vectors = numpy.linalg.eigh(_horn_matrix(covariance))
+    deviations = numpy.sqrt(numpy.maximum(
+     squares + target_squares - 2 * values[:, -1], 0
+    ) / len(target))
+    transforms = tuple([_transform(
+     quaternion, centroid, target_centroid
+    ) for quaternion, centroid in zip(
+     vectors[:, :, -1].tolist(), centroids.tolist()
+    )])
+    return transforms, deviations
+
+
+def _superpose_points(points, target_centroid, target, target_squares):
+    _check_lengths(points, target)
+    length = len(points)
+    centroid = tuple([sum(values) / length for values in zip(*points)])
+    cx, cy, cz = centroid
+    squares = 0
+    covariance = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+    for (x, y, z), target_point in zip(points, target):
+        x, y, z = x - cx, y - cy, z - cz
+        squares += x * x + y * y + z * z
+        for row, value in zip(covariance, (x, y, z)):
+            for column, target_value in enumerate(target_point):
+                row[column] += value * target_value
+    values, vectors = kernel.symmetric_eigen(_horn_matrix(covariance))
+    deviation = sqrt(
+     max(squares + target_squares - 2 * values[-1], 0) / length
+    )
+    return _transform(vectors[-1], centroid, target_centroid), deviation
+
+
+def _horn_matrix(covariance):
+    """Builds the symmetric 4x4 matrix whose eigenvector with the largest
+    eigenvalue is the quaternion of the best rotation - either from one 3x3
+    covariance matrix, or from an (F, 3, 3) array of them."""
+
+    if is_array(covariance):
+        (sxx, sxy, sxz), (syx, syy, syz), (szx, szy, szz) = [
+         [covariance[:, row, column] for column in range(3)]
+         for row in range(3)
+        ]
+    else:
+        (sxx, sxy, sxz), (syx, syy, syz), (szx, szy, szz) = covariance
+    rows = [
+     [sxx + syy + szz, syz - szy, szx - sxz, sxy - syx],
+     [syz - szy, sxx - syy - szz, sxy + syx, szx + sxz],
+     [szx - sxz, sxy + syx, syy - sxx - szz, syz + szy],
+     [sxy - syx, szx + sxz, syz + szy, szz - sxx - syy]
+    ]
+    if is_array(covariance):
+        return numpy.stack([numpy.stack(row, axis=-1) for row in rows], axis=1)
+    return rows
+
+
+def _transform(quaternion, centroid, target_centroid):
+    """Creates the Transform which moves a centroid to the origin, rotates by
+    a quaternion, and moves the origin to the target centroid."""
+
+    matrix = Quaternion(*quaternion).matrix()
+    return Transform(*[row + (target - sum([
+     value * middle for value, middle in zip(row, centroid)
+    ]),) for row, target in zip(matrix, target_centroid)])
@@ -0,0 +1,227 @@
+"""Contains asyncio versions of the transformation functions, for transforming
+large sets of points inside an event loop without blocking it.
+
+The points are transformed a chunk at a time. Between chunks, control is
+handed back to the event loop - or, if an executor is given, each chunk is
+transformed on the executor while the event loop carries on with other work.
+Either way, the coroutine can be cancelled between chunks, and the points it
+was given are never changed until every chunk is done. Collections of objects
+are also converted to coordinates, and have the results written back to them,
+a chunk at a time, with control handed back to the event loop in between."""
+
+import asyncio
+from . import checks
+from .pointset import PointSet, check_dtype
+from .transform import Transform, is_array, _cast, _ingest, _write_back
+from .transform import _item_kind, _convert, _check_mutable
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ASYNC_CHUNK_SIZE = 10000
+
+async def atranslate(points, x, y, z, chunk_size=ASYNC_CHUNK_SIZE,
+                     executor=None, progress=None, write_back=False,
+                     dtype=None):
+    """Translates a set of coordinates without blocking the event loop - see
+    :py:func:`.translate` and :py:func:`.atransform`.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param number x: The distance to move the points in the x direction.
+    :param number y: The distance to move the points in the y direction.
+    :param number z: The distance to move the points in the z direction.
+    :param int chunk_size: The number of points to translate at a time.
+    :param executor: A ``concurrent.futures`` executor to translate each chunk\
+    on.
+    :param progress: A function to call after each chunk with the number of\
+    points done so far and the total number of points.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points once every chunk is done.
+    :param str dtype: The precision to work in - see :py:func:`.translate`.
+    :returns: The translated coordinates."""
+
+    return await atransform(
+     points, Transform.translation(x, y, z), chunk_size=chunk_size,
+     executor=executor, progress=progress, write_back=write_back, dtype=dtype
+    )
+
+
+async def arotate(points, axis, angle, hand="right", pivot=None,
+                  chunk_size=ASYNC_CHUNK_SIZE, executor=None, progress=None,
+                  write_back=False, dtype=None):
+    """Rotates a set of coordinates without blocking the event loop - see
+    :py:func:`.rotate` and :py:func:`.atransform`.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`, or\
+    an (x, y, z) vector in any direction.
+    :param number angle: The angle in degrees to rotate by.
+    :param str hand: specifies whether the rotation should be right-handed or\
+    left-handed. The deafult is 'right'.
+    :param pivot: An (x, y, z) point which the axis passes through.
+    :param int chunk_size: The number of points to rotate at a time.
+    :param executor: A ``concurrent.futures`` executor to rotate each chunk\
+    on.
+    :param progress: A function to call after each chunk with the number of\
+    points done so far and the total number of points.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points once every chunk is done.
+    :param str dtype: The precision to work in - see :py:func:`.rotate`.
+    :returns: The rotated coordinates."""
+
+    return await atransform(
+     points, Transform.rotation(axis, angle, hand, pivot=pivot),
+     chunk_size=chunk_size, executor=executor, progress=progress,
+     write_back=write_back, dtype=dtype
+    )
+
+
+async def atransform(points, transform, chunk_size=ASYNC_CHUNK_SIZE,
+                     executor=None, progress=None, write_back=False,
+                     dtype=None):
+    """Applies a :py:class:`.Transform` to a set of coordinates a chunk at a
+    time, without blocking the event loop. The points can be given in any of
+    the forms that :py:meth:`.Transform.apply` accepts, and the result is the
+    same as it would give:
+
+        >>> rotated = await geometrica.arotate(points, "z", 30, progress=log)
+
+    If no executor is given, each chunk is transformed on the event loop's own
+    thread, and the event loop is given the chance to run other tasks between
+    chunks. If an executor is given, each chunk is transformed on it instead
+    - a ``ThreadPoolExecutor`` suits arrays and PointSets, as NumPy releases
+    the GIL while it works.
+
+    If the task is cancelled, no further chunks are started, and the original
+    points are left as they were.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param Transform transform: The Transform to apply.
+    :param int chunk_size: The number of points to transform at a time.
+    :param executor: A ``concurrent.futures`` executor to transform each chunk\
+    on.
+    :param progress: A function to call after each chunk with the number of\
+    points done so far and the total number of points.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points once every chunk is done.
+    :param str dtype: The precision to work in - see :py:func:`.translate`.
+    :raises TypeError: if the chunk size is not an integer.
+    :raises ValueError: if the chunk size is not positive.
+    :returns: The transformed coordinates."""
+
+    if checks.validating():
+        if not isinstance(transform, Transform):
+            raise TypeError("'%s' is not a Transform" % str(transform))
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+            raise TypeError("chunk_size must be int, not '%s'" % (
+             str(chunk_size)
+            ))
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive, not %i" % (
+             chunk_size
+            ))
+        if dtype is not None:
+            check_dtype(dtype)
+    objects, points, kind = await _ingest_chunks(
+     points, write_back, chunk_size
+    )
+    result, step = _prepare(points, transform, dtype)
+    loop = asyncio.get_running_loop()
+    length = len(points)
+    for start in range(0, length, chunk_size):
+        end = min(start + chunk_size, length)
+        if executor is None:
+            step(start, end)
+            await asyncio.sleep(0)
+        else:
+            await loop.run_in_executor(executor, step, start, end)
+        if progress is not None:
+            progress(end, length)
+    if isinstance(result, list):
+        result = tuple(result)
+    if write_back:
+        await _write_back_chunks(objects, points, kind, result, chunk_size)
+    return result
+
+
+async def _ingest_chunks(objects, write_back, chunk_size):
+    """Converts a collection to points like :py:func:`._ingest` does, but
+    converts collections of objects a chunk at a time, handing control back to
+    the event loop between chunks."""
+
+    if not isinstance(objects, (list, tuple)):
+        if is_array(objects) or isinstance(objects, PointSet):
+            return _ingest(objects, write_back)
+        try:
+            memoryview(objects)
+        except TypeError:
+            objects = list(objects)
+        else:
+            return _ingest(objects, write_back)
+    if not objects:
+        return objects, objects, "sequence"
+    kind = _item_kind(objects[0])
+    if kind == "sequence":
+        if write_back:
+            _check_mutable(objects)
+        return objects, objects, kind
+    points = []
+    for start in range(0, len(objects), chunk_size):
+        points += _convert(objects[start:start + chunk_size], kind)
+        await asyncio.sleep(0)
+    return objects, points, kind
+
+
+async def _write_back_chunks(objects, points, kind, result, chunk_size):
+    """Writes results back to a collection like :py:func:`._write_back` does,
+    but writes to collections of objects a chunk at a time, handing control
+    back to the event loop between chunks. If the task is cancelled part way
+    through, the remaining chunks are still written before it stops, so that
+    the objects are never left half updated."""
+
+    if kind not in ("sequence", "coordinates", "xyz"):
+        _write_back(objects, points, kind, result)
+        return
+    cancelled = False
+    for start in range(0, len(objects), chunk_size):
+        end = start + chunk_size
+        _write_back(objects[start:end], points, kind, result[start:end])
+        if not cancelled:
+            try:
+                await asyncio.sleep(0)
+            except asyncio.CancelledError:
+                cancelled = True
+    if cancelled:
+        raise asyncio.CancelledError()
+
+
+def _prepare(points, transform, dtype):
+    """Creates the object which the transformed points will be put in, and a
+    function which transforms the points between two indices into it."""
+
+    rows = transform.rows()
+    if isinstance(points, PointSet):
+        result = points.astype(dtype or points.dtype())
+        data = result.buffer()
+
+        def step(start, end):
+            PointSet.from_buffer(data[start * 3:end * 3]).apply(transform)
+
+    elif is_array(points):
+        points = _cast(points, dtype)
+        result = numpy.empty_like(points)
+        matrix = numpy.array(rows, dtype=points.dtype)
+        linear, offset = matrix[:3, :3].T, matrix[:3, 3]
+
+        def step(start, end):
+            numpy.matmul(points[start:end], linear, out=result[start:end])
+            result[start:end] += offset
+
+    else:
+        result = list(points)
+
+        def step(start, end):
+            result[start:end] = transform.stream(points[start:end])
+
+    return result, step
@@ -0,0 +1,207 @@
+"""Contains functions for finding the volumes which enclose a set of points,
+and for finding which points lie inside a volume."""
+
+from collections import namedtuple
+from math import sqrt
+from operator import mul
+from . import kernel
+from .transform import accept_objects, _as_array
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Bounds = namedtuple("Bounds", ("box", "oriented_box", "sphere"))
+Bounds.__doc__ = """The volumes enclosing a set of points, as returned by
+:py:func:`.find_bounds` - an axis-aligned :py:class:`.Box`, an
+:py:class:`.OrientedBox` and a :py:class:`.Sphere`."""
+
+Box = namedtuple("Box", ("minimum", "maximum"))
+Box.__doc__ = """An axis-aligned box, given by its (x, y, z) corner with the
+smallest values and its corner with the largest values."""
+
+OrientedBox = namedtuple("OrientedBox", ("centre", "axes", "extents"))
+OrientedBox.__doc__ = """A box which can be turned in any direction, given by
+its (x, y, z) centre, the three unit vectors its edges run along, and how far
+it extends from the centre along each of them."""
+
+Sphere = namedtuple("Sphere", ("centre", "radius"))
+Sphere.__doc__ = """A sphere, given by its (x, y, z) centre and its radius."""
+
+@accept_objects
+def find_bounds(points):
+    """Finds three volumes which enclose a set of points:
+
+    * The axis-aligned bounding box - the smallest box with edges parallel to
+      the x, y and z axes.
+    * An oriented bounding box, whose edges run along the directions in which
+      the points are most and least spread out (their principal axes). This
+      is usually much tighter than the axis-aligned box for points which do
+      not happen to line up with the axes.
+    * A bounding sphere, centred on the middle of the axis-aligned box.
+
+    If NumPy is installed each volume takes a few vectorised operations -
+    otherwise the coordinates are split into columns once, and each volume
+    takes one pass over them.
+
+    The transformation functions can find these for their results in the same
+    call, with ``with_bounds=True``.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :raises ValueError: if there are no points.
+    :rtype: ``Bounds``"""
+
+    if not len(points):
+        raise ValueError("There must be at least one point")
+    if numpy is not None:
+        return _array_bounds(_as_array(points))
+    return _point_bounds(tuple(points))
+
+
+@accept_objects
+def inside_box(points, box):
+    """Finds which points are inside a box, including its surface. The box can
+    be an axis-aligned :py:class:`.Box` (or any (minimum, maximum) pair of
+    corners) or an :py:class:`.OrientedBox`.
+
+    If NumPy is installed the result is a boolean array, which can be used to
+    index an array of the points - otherwise it is a ``tuple`` of ``bool``.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param box: The box to check against.
+    :returns: Whether each point is inside the box."""
+
+    if isinstance(box, OrientedBox):
+        return _inside_oriented_box(points, box)
+    minimum, maximum = box
+    if numpy is not None:
+        points = _as_array(points)
+        return ((points >= minimum) & (points <= maximum)).all(axis=1)
+    (x1, y1, z1), (x2, y2, z2) = minimum, maximum
+    return tuple([
+     x1 <= x <= x2 and y1 <= y <= y2 and z1 <= z <= z2 for x, y, z in points
+    ])
+
+
+@accept_objects
+def inside_sphere(points, sphere):
+    """Finds which points are inside a sphere, including its surface. The
+    sphere can be a :py:class:`.Sphere` or any (centre, radius) pair.
+
+    If NumPy is installed the result is a boolean array - otherwise it is a
+    ``tuple`` of ``bool``.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param sphere: The sphere to check against.
+    :returns: Whether each point is inside the sphere."""
+
+    (cx, cy, cz), radius = sphere
+    limit = radius * radius
+    if numpy is not None:
+        points = _as_array(points)
+        return ((points - (cx, cy, cz)) ** 2).sum(axis=1) <= limit
+    return tuple([
+     (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= limit
+     for x, y, z in points
+    ])
+
+
+@accept_objects
+def inside_planes(points, planes):
+    """Finds which points are on the inner side of every one of a set of
+    planes - for example, the six planes of a viewing frustum. Each plane is
+    given as a (point, normal) pair, where the point is anywhere on the plane
+    and the normal points to its inner side. Points on a plane count as being
+    inside it.
+
+    If NumPy is installed the result is a boolean array - otherwise it is a
+    ``tuple`` of ``bool``.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param planes: The (point, normal) pairs of the planes.
+    :returns: Whether each point is inside all of the planes."""
+
+    planes = [
+     (tuple(normal), sum(map(mul, point, normal))) for point, normal in planes
+    ]
+    if numpy is not None:
+        points = _as_array(points)
+        inside = numpy.ones(len(points), dtype=bool)
+        for normal, offset in planes:
+            inside &= points @ numpy.array(normal, dtype=float) >= offset
+        return inside
+    return tuple([all([
+     x * a + y * b + z * c >= offset for (a, b, c), offset in planes
+    ]) for x, y, z in points])
+
+
+def _array_bounds(points):
+    minimum, maximum = points.min(axis=0), points.max(axis=0)
+    centroid = points.mean(axis=0)
+    centred = points - centroid
+    axes = numpy.linalg.eigh(centred.T @ centred)[1].T
+    projections = centred @ axes.T
+    low, high = projections.min(axis=0), projections.max(axis=0)
+    middle = (minimum + maximum) / 2
+    return Bounds(
+     Box(tuple(minimum.tolist()), tuple(maximum.tolist())),
+     OrientedBox(
+      tuple((centroid + ((low + high) / 2) @ axes).tolist()),
+      tuple([tuple(axis) for axis in axes.tolist()]),
+      tuple(((high - low) / 2).tolist())
+     ),
+     Sphere(tuple(middle.tolist()), float(numpy.sqrt(
+      ((points - middle) ** 2).sum(axis=1).max()
+     )))
+    )
+
+
+def _point_bounds(points):
+    columns = tuple(zip(*points))
+    length = len(points)
+    minimum = tuple([min(values) for values in columns])
+    maximum = tuple([max(values) for values in columns])
+    centroid = [sum(values) / length for values in columns]
+    covariance = [[
+     sum(map(mul, values1, values2)) - length * mean1 * mean2
+     for values2, mean2 in zip(columns, centroid)
+    ] for values1, mean1 in zip(columns, centroid)]
+    axes = kernel.symmetric_eigen(covariance)[1]
+    extents, middle = [], [0, 0, 0]
+    for a, b, c in axes:
+        projections = [a * x + b * y + c * z for x, y, z in points]
+        low, high = min(projections), max(projections)
+        mid = (low + high) / 2
+        middle = [value + mid * part for value, part in zip(middle, (a, b, c))]
+        extents.append((high - low) / 2)
+    cx, cy, cz = centre = tuple([
+     (low + high) / 2 for low, high in zip(minimum, maximum)
+    ])
+    radius = sqrt(max([
+     (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 for x, y, z in points
+    ]))
+    return Bounds(
+     Box(minimum, maximum),
+     OrientedBox(tuple(middle), axes, tuple(extents)),
+     Sphere(centre, radius)
+    )
+
+
+def _inside_oriented_box(points, box):
+    centre, axes, extents = box
+    if numpy is not None:
+        points = _as_array(points)
+        projections = numpy.abs((points - centre) @ numpy.array(axes).T)
+        return (projections <= numpy.array(extents) + 1e-9).all(axis=1)
+    results = []
+    for point in points:
+        offset = [value - middle for value, middle in zip(point, centre)]
+        results.append(all([
+         abs(sum(map(mul, offset, axis))) <= extent + 1e-9
+         for axis, extent in zip(axes, extents)
+        ]))
+    return tuple(results)
@@ -0,0 +1,81 @@
+"""Contains tools for checking inputs, and for controlling whether geometrica
+checks them at all."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+VALIDATE = True
+_trusted = ContextVar("trusted", default=False)
+
+def is_numeric(number):
+    """Checks if an object is a number - that is, an ``int`` or a ``float``.
+    Booleans are technically integers, but are not counted as numbers here.
+
+    :param number: The object to check.
+    :rtype: ``bool``"""
+
+    return isinstance(number, (int, float)) and not isinstance(number, bool)
+
+
+def are_numeric(*values):
+    """Checks if all the arguments it receives are numeric (according to
+    :py:func:`is_numeric`).
+
+    :param \\*values: The objects to check.
+    :rtype: ``bool``"""
+
+    for value in values:
+        if not is_numeric(value):
+            return False
+    return True
+
+
+def validating():
+    """Checks whether inputs should be checked in the current context - that
+    is, whether checking has been left on with :py:func:`.set_validation`, and
+    the code calling this is not inside :py:func:`.trusted_inputs`.
+
+    :rtype: ``bool``"""
+
+    return VALIDATE and not _trusted.get()
+
+
+def set_validation(validate):
+    """Turns input checking on or off for the whole of geometrica.
+
+    By default, functions such as :py:func:`.translate` and :py:func:`.sine_law`
+    check that their arguments are numbers, strings etc. before doing anything
+    with them. If your inputs have already been checked, this is wasted time,
+    and you can turn it off here. With checking off, invalid inputs will give
+    undefined results or obscure exceptions.
+
+    The setting applies to every thread - to turn checking off for one block
+    of code only, use :py:func:`.trusted_inputs`.
+
+    :param bool validate: Whether inputs should be checked."""
+
+    global VALIDATE
+    if not isinstance(validate, bool):
+        raise TypeError("validate must be bool, not '%s'" % str(validate))
+    VALIDATE = validate
+
+
+@contextmanager
+def trusted_inputs():
+    """A context manager which turns input checking off for the code inside
+    it, and restores the previous setting afterwards:
+
+        >>> with geometrica.trusted_inputs():
+        ...     for triangle in triangles:
+        ...         geometrica.sine_law(**triangle)
+
+    Only the current thread, or the current asyncio task, is affected - other
+    threads and tasks carry on checking their inputs, even while this one is
+    waiting inside the block. See :py:func:`.set_validation` for more
+    details."""
+
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
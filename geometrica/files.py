@@ -0,0 +1,173 @@
+"""Contains functions for reading and writing binary coordinate files.
+
+Two formats are supported. A raw file is nothing but little-endian x, y, z
+values one after another, either as float64 or float32. A headed file starts
+with a 16 byte header - the four bytes ``GXYZ``, a version byte (currently 1), a
+type byte (``d`` for float64 or ``f`` for float32), two zero bytes, and the
+number of points as a little-endian unsigned 64 bit integer - followed by the
+same values as a raw file."""
+
+import mmap
+import struct
+import sys
+from array import array
+from .pointset import PointSet, CHUNK_SIZE, TYPES, check_dtype
+from .transform import Transform, is_array, iter_points
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MAGIC = b"GXYZ"
+HEADER = struct.Struct("<4sBc2xQ")
+
+def load_points(path, dtype=None, writable=False):
+    """Opens a binary coordinate file and memory-maps it, so that its
+    coordinates can be used without reading the file into memory. Headed files
+    are recognised automatically - otherwise the file is read as raw values.
+
+    The coordinates are returned as a :py:class:`.PointSet` of the file's
+    type, which uses the mapped file as its memory, and which can be passed
+    straight to the transformation functions. To use them as an (N, 3) NumPy
+    array instead, view it as one without copying it:
+
+        >>> array = load_points("scan.xyz").as_array()
+
+    :param str path: The location of the file.
+    :param str dtype: For raw files, whether the values are ``"float64"``\
+    (the default) or ``"float32"``. This is ignored for headed files.
+    :param bool writable: If ``True``, changes made to the returned\
+    coordinates are written to the file. Otherwise they are read-only.
+    :raises ValueError: if the file is not a whole number of points.
+    :returns: The file's coordinates."""
+
+    offset, code = 0, check_dtype(dtype or "float64")
+    with open(path, "r+b" if writable else "rb") as f:
+        f.seek(0, 2)
+        size = f.tell()
+        if size == 0:
+            return PointSet(dtype=dtype or "float64")
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        memory = mmap.mmap(f.fileno(), 0, access=access)
+    if size >= HEADER.size and memory[:4] == MAGIC:
+        offset, code, count = _read_header(memory[:HEADER.size])
+        if size - offset != count * 3 * struct.calcsize(code):
+            raise ValueError("%s should have %i points but is %i bytes" % (
+             path, count, size
+            ))
+    values = memoryview(memory)[offset:]
+    if len(values) % (3 * struct.calcsize(code)):
+        raise ValueError("%s is not a whole number of %s points" % (
+         path, "float64" if code == "d" else "float32"
+        ))
+    values = values.cast(code)
+    if sys.byteorder != "little":
+        values = array(code, values)
+        values.byteswap()
+    return PointSet.from_buffer(values)
+
+
+def save_points(path, points, dtype="float64", header=True,
+                chunk_size=CHUNK_SIZE):
+    """Writes coordinates to a binary coordinate file. The points are written
+    in chunks, so an iterable which produces points lazily (such as
+    :py:func:`.itranslate`) is never held in memory all at once.
+
+    :param str path: The location of the file.
+    :param points: The coordinates to write - any of the forms the\
+    transformation functions accept, or an iterable of them.
+    :param str dtype: ``"float64"`` (the default) or ``"float32"``.
+    :param bool header: If ``False``, a raw file is written.
+    :param int chunk_size: The number of points to write at a time.
+    :returns: The number of points written."""
+
+    code = check_dtype(dtype)
+    with open(path, "wb") as f:
+        if header:
+            f.write(HEADER.pack(MAGIC, 1, code.encode(), 0))
+        count = 0
+        for chunk in _chunks(points, chunk_size):
+            count += _write_chunk(f, chunk, code)
+        if header:
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, 1, code.encode(), count))
+    return count
+
+
+def transform_file(source, destination, transform, dtype=None, header=True,
+                   chunk_size=CHUNK_SIZE):
+    """Applies a :py:class:`.Transform` to every point in a binary coordinate
+    file, and writes the results to another file. The source file is
+    memory-mapped and the results are written a chunk at a time, so the
+    coordinates are never all in memory at once.
+
+    :param str source: The location of the file to read.
+    :param str destination: The location of the file to write.
+    :param Transform transform: The Transform to apply.
+    :param str dtype: The type of the source values, if it is a raw file.\
+    The output is written with the same type as the input.
+    :param bool header: If ``False``, a raw file is written.
+    :param int chunk_size: The number of points to transform at a time.
+    :returns: The number of points written."""
+
+    if not isinstance(transform, Transform):
+        raise TypeError("'%s' is not a Transform" % str(transform))
+    points = load_points(source, dtype=dtype)
+    return save_points(
+     destination, (transform.apply(chunk) for chunk in _slices(
+      points, chunk_size
+     )), dtype=points.dtype(), header=header, chunk_size=None
+    )
+
+
+def _read_header(data):
+    magic, version, code, count = HEADER.unpack(data)
+    if version != 1:
+        raise ValueError("Unknown coordinate file version %i" % version)
+    code = code.decode()
+    if code not in TYPES.values():
+        raise ValueError("Unknown coordinate file type '%s'" % code)
+    return HEADER.size, code, count
+
+
+def _slices(points, chunk_size):
+    for start in range(0, len(points), chunk_size):
+        yield points[start:start + chunk_size]
+
+
+def _chunks(points, chunk_size):
+    """Splits points into chunks to write. PointSets and arrays are sliced
+    without copying, and an iterable of chunks (when ``chunk_size`` is
+    ``None``) is passed through as it is."""
+
+    if chunk_size is None:
+        yield from points
+    elif isinstance(points, PointSet) or is_array(points):
+        yield from _slices(points, chunk_size)
+    else:
+        chunk = array("d")
+        for point in iter_points(points):
+            chunk.extend(point)
+            if len(chunk) >= chunk_size * 3:
+                yield PointSet.from_buffer(chunk)
+                chunk = array("d")
+        if chunk:
+            yield PointSet.from_buffer(chunk)
+
+
+def _write_chunk(f, chunk, code):
+    if is_array(chunk):
+        values = numpy.ascontiguousarray(
+         chunk, dtype="<f8" if code == "d" else "<f4"
+        )
+        f.write(values)
+        return len(values)
+    if not isinstance(chunk, PointSet):
+        chunk = PointSet(chunk)
+    values = chunk.buffer()
+    if values.format != code or sys.byteorder != "little":
+        values = array(code, values)
+        if sys.byteorder != "little":
+            values.byteswap()
+    f.write(values)
+    return len(chunk)
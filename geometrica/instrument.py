@@ -0,0 +1,185 @@
+"""Contains tools for recording where time goes inside geometrica.
+
+Instrumentation is off by default. When it is turned on with
+:py:func:`set_instrumentation`, every call to a public function built on
+:py:func:`.accept_objects` (such as :py:func:`.translate` and
+:py:func:`.rotate`), to :py:meth:`.Transform.apply`, and to
+:py:func:`.sine_law` and :py:func:`.cosine_law` is recorded - how many points
+(or triangles) it was given, and how long it spent in each phase of its work:
+
+* ``ingestion`` - working out what kind of collection was given, and
+  converting it to points.
+* ``validation`` - checking the other arguments.
+* ``matrix`` - building (or fetching from the cache) the matrix to apply.
+* ``apply`` - doing the calculation.
+* ``output`` - anything after that, such as writing results back to the
+  original objects.
+
+Only the outermost call is recorded - when :py:func:`.rotate` uses
+:py:meth:`.Transform.apply` internally, its time counts towards ``rotate``.
+
+Totals are available from :py:func:`stats`, and callbacks added with
+:py:func:`add_callback` are given each call's record as it finishes, for
+passing on to some other metrics system. When instrumentation is off, the only
+cost is checking a flag."""
+
+import sys
+import threading
+from time import perf_counter
+
+ENABLED = False
+
+_local = threading.local()
+_lock = threading.Lock()
+_stats = {}
+_callbacks = []
+
+def set_instrumentation(enabled):
+    """Turns instrumentation on or off for the whole of geometrica.
+
+    :param bool enabled: Whether calls should be recorded."""
+
+    global ENABLED
+    if not isinstance(enabled, bool):
+        raise TypeError("enabled must be bool, not '%s'" % str(enabled))
+    ENABLED = enabled
+
+
+def stats():
+    """Returns the totals recorded for each function since instrumentation was
+    turned on (or the totals were last reset). Each function's totals are a
+    ``dict`` with the number of ``calls``, the total ``size`` of their inputs
+    (the number of points, or of triangles), the total ``time`` in seconds, and
+    the time spent in each of the ``phases``.
+
+    :rtype: ``dict``"""
+
+    with _lock:
+        return {name: {
+         "calls": totals["calls"], "size": totals["size"],
+         "time": totals["time"], "phases": dict(totals["phases"])
+        } for name, totals in _stats.items()}
+
+
+def cache_stats():
+    """Returns the hits, misses, current size and hit rate of geometrica's
+    caches - the rotation matrix cache (see :py:func:`.rotation_cache_info`)
+    and the triangle cache (see :py:func:`.triangle_cache_info`). Caches in
+    modules which have not been imported yet are left out.
+
+    :rtype: ``dict``"""
+
+    caches = {}
+    for name, module, function in (
+     ("rotation", "geometrica.transform", "rotation_cache_info"),
+     ("triangle", "geometrica.trig", "triangle_cache_info")
+    ):
+        if module in sys.modules:
+            info = getattr(sys.modules[module], function)()
+            lookups = info.hits + info.misses
+            caches[name] = {
+             "hits": info.hits, "misses": info.misses,
+             "size": info.currsize,
+             "hit_rate": info.hits / lookups if lookups else None
+            }
+    return caches
+
+
+def reset_stats():
+    """Clears the totals returned by :py:func:`stats`."""
+
+    with _lock:
+        _stats.clear()
+
+
+def add_callback(callback):
+    """Adds a function to be called after every recorded call. It is given the
+    name of the function which was called, and a ``dict`` of that call's input
+    ``size``, total ``time`` and ``phases``.
+
+    Callbacks are called in the thread which made the call, so they should be
+    quick - passing the record on to a queue, for example.
+
+    :param callback: The function to call."""
+
+    if not callable(callback):
+        raise TypeError("'%s' is not callable" % str(callback))
+    _callbacks.append(callback)
+
+
+def remove_callback(callback):
+    """Removes a function added with :py:func:`add_callback`.
+
+    :param callback: The function to remove."""
+
+    _callbacks.remove(callback)
+
+
+def active():
+    """Returns ``True`` if a call is currently being recorded in this thread.
+
+    :rtype: ``bool``"""
+
+    return getattr(_local, "record", None) is not None
+
+
+def call(name, size, function, *args, **kwargs):
+    """Calls a function and records the call under some name. This is how
+    geometrica's own functions record themselves - they call themselves again
+    through this if instrumentation is on and nothing is being recorded yet,
+    and mark the end of each phase with :py:func:`phase`. Any time after the
+    last phase is counted as ``output``.
+
+    :param str name: The name to record the call under.
+    :param int size: The size of the input, if it is known already.
+    :param function: The function to call.
+    :returns: Whatever the function returns."""
+
+    start = perf_counter()
+    record = {"size": size, "phases": {}, "mark": start}
+    _local.record = record
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        _local.record = None
+    _mark(record, "output")
+    del record["mark"]
+    record["time"] = perf_counter() - start
+    record["size"] = record["size"] or 0
+    with _lock:
+        totals = _stats.setdefault(
+         name, {"calls": 0, "size": 0, "time": 0, "phases": {}}
+        )
+        totals["calls"] += 1
+        totals["size"] += record["size"]
+        totals["time"] += record["time"]
+        for phase_name, seconds in record["phases"].items():
+            totals["phases"][phase_name] = (
+             totals["phases"].get(phase_name, 0) + seconds
+            )
+    for callback in list(_callbacks):
+        callback(name, record)
+    return result
+
+
+def phase(name, size=None):
+    """Marks the end of a phase of the call being recorded in this thread - the
+    time since the last phase ended is added to this one. Nothing happens if
+    no call is being recorded.
+
+    :param str name: The phase which has just ended.
+    :param int size: The size of the input, if it is now known."""
+
+    record = getattr(_local, "record", None)
+    if record is not None:
+        _mark(record, name)
+        if size is not None and record["size"] is None:
+            record["size"] = size
+
+
+def _mark(record, name):
+    now = perf_counter()
+    record["phases"][name] = (
+     record["phases"].get(name, 0) + now - record["mark"]
+    )
+    record["mark"] = now
@@ -0,0 +1,147 @@
+"""Contains the small matrix routines which geometrica's transformations are
+built on.
+
+Matrices here are plain tuples of rows - a 3x3 matrix is three rows of three
+numbers, and a 4x4 affine matrix is four rows of four numbers whose last row is
+(0, 0, 0, 1). Points are (x, y, z) sequences. Nothing is wrapped in an object,
+so transforming a point costs only the nine multiplications and additions it
+needs."""
+
+from math import copysign, sqrt
+
+def multiply(matrix1, matrix2):
+    """Multiplies two square matrices of the same size.
+
+    :param matrix1: The rows of the left matrix.
+    :param matrix2: The rows of the right matrix.
+    :returns: The rows of the product, as a ``tuple`` of ``tuple``."""
+
+    columns = tuple(zip(*matrix2))
+    return tuple([tuple([
+     sum([a * b for a, b in zip(row, column)]) for column in columns
+    ]) for row in matrix1])
+
+
+def transform_points(points, matrix):
+    """Multiplies every point in a collection by a 3x3 matrix, or by a 4x4
+    affine matrix (in which case the translation in its last column is added
+    too).
+
+    :param points: An iterable of (x, y, z) coordinates.
+    :param matrix: The rows of the matrix.
+    :returns: The transformed coordinates, as a ``tuple`` of ``tuple``."""
+
+    return tuple(iter_transformed(points, matrix))
+
+
+def iter_transformed(points, matrix):
+    """The lazy version of :py:func:`transform_points` - each transformed
+    point is yielded as soon as it is worked out.
+
+    :param points: An iterable of (x, y, z) coordinates.
+    :param matrix: The rows of the 3x3 or 4x4 matrix.
+    :returns: A generator of ``tuple``."""
+
+    if len(matrix) == 3:
+        (a, b, c), (d, e, f), (g, h, i) = matrix
+        for x, y, z in points:
+            yield (
+             a * x + b * y + c * z,
+             d * x + e * y + f * z,
+             g * x + h * y + i * z
+            )
+    else:
+        (a, b, c, tx), (d, e, f, ty), (g, h, i, tz) = matrix[:3]
+        for x, y, z in points:
+            yield (
+             a * x + b * y + c * z + tx,
+             d * x + e * y + f * z + ty,
+             g * x + h * y + i * z + tz
+            )
+
+
+def transform_values(values, matrix):
+    """Transforms a flat, writable sequence of x, y, z, x, y, z... values in
+    place by a 3x3 or 4x4 affine matrix, without creating a tuple for each
+    point.
+
+    :param values: The values to transform - a ``memoryview``, ``array``,\
+    ``list`` etc.
+    :param matrix: The rows of the matrix."""
+
+    if len(matrix) == 3:
+        (a, b, c), (d, e, f), (g, h, i) = matrix
+        tx = ty = tz = 0
+    else:
+        (a, b, c, tx), (d, e, f, ty), (g, h, i, tz) = matrix[:3]
+    for index in range(0, len(values), 3):
+        x, y, z = values[index], values[index + 1], values[index + 2]
+        values[index] = a * x + b * y + c * z + tx
+        values[index + 1] = d * x + e * y + f * z + ty
+        values[index + 2] = g * x + h * y + i * z + tz
+
+
+def invert_affine(matrix):
+    """Inverts a 4x4 affine matrix, using the adjugate of its 3x3 linear part.
+
+    :param matrix: The rows of the matrix.
+    :raises ValueError: if the matrix is singular.
+    :returns: The three top rows of the inverse, as a ``tuple`` of ``tuple``."""
+
+    (a, b, c, tx), (d, e, f, ty), (g, h, i, tz) = matrix[:3]
+    cofactors = (
+     (e * i - f * h, c * h - b * i, b * f - c * e),
+     (f * g - d * i, a * i - c * g, c * d - a * f),
+     (d * h - e * g, b * g - a * h, a * e - b * d)
+    )
+    determinant = (
+     a * cofactors[0][0] + b * cofactors[1][0] + c * cofactors[2][0]
+    )
+    if determinant == 0:
+        raise ValueError("Matrix is singular")
+    linear = [[value / determinant for value in row] for row in cofactors]
+    return tuple([tuple(row) + (
+     -(row[0] * tx + row[1] * ty + row[2] * tz),
+    ) for row in linear])
+
+
+def symmetric_eigen(matrix, sweeps=50):
+    """Finds the eigenvalues and eigenvectors of a small symmetric matrix,
+    using the cyclic Jacobi method.
+
+    :param matrix: The rows of the matrix.
+    :param int sweeps: The most passes over the matrix to make.
+    :returns: The eigenvalues in ascending order, and the eigenvector for each\
+    of them, as two ``tuple``."""
+
+    size = len(matrix)
+    a = [list(row) for row in matrix]
+    v = [[float(row == column) for column in range(size)] for row in range(size)]
+    for _ in range(sweeps):
+        if not any(a[p][q] for p in range(size) for q in range(p + 1, size)):
+            break
+        for p in range(size - 1):
+            for q in range(p + 1, size):
+                if a[p][q] == 0:
+                    continue
+                theta = (a[q][q] - a[p][p]) / (2 * a[p][q])
+                t = copysign(1, theta) / (abs(theta) + sqrt(theta * theta + 1))
+                c = 1 / sqrt(t * t + 1)
+                s = t * c
+                for row in a:
+                    row[p], row[q] = c * row[p] - s * row[q], (
+                     s * row[p] + c * row[q]
+                    )
+                a[p], a[q] = [c * x - s * y for x, y in zip(a[p], a[q])], [
+                 s * x + c * y for x, y in zip(a[p], a[q])
+                ]
+                a[p][q] = a[q][p] = 0
+                for row in v:
+                    row[p], row[q] = c * row[p] - s * row[q], (
+                     s * row[p] + c * row[q]
+                    )
+    order = sorted(range(size), key=lambda index: a[index][index])
+    return (
+     tuple([a[index][index] for index in order]),
+     tuple([tuple([row[index] for row in v]) for index in order])
+    )
@@ -0,0 +1,229 @@
+"""Contains functions for measuring distances, angles and torsions between many
+points at once."""
+
+from math import degrees, atan2, sqrt
+from .transform import accept_objects, _as_array, _collect
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@accept_objects
+def distances(points, pairs=None):
+    """Measures the distances between pairs of points.
+
+    The pairs are given as (i, j) indices into the points - a list of tuples or
+    an (M, 2) NumPy array. If no pairs are given, the distance from each point
+    to the next one is measured, as along a chain.
+
+    If NumPy is installed the distances are returned as an array - otherwise a
+    ``tuple`` is returned.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param pairs: The indices of the points to measure between.
+    :raises ValueError: if the pairs do not each have two indices."""
+
+    if numpy is not None:
+        first, second = _index_points(points, pairs, 2)
+        return numpy.sqrt(((second - first) ** 2).sum(axis=1))
+    return tuple([_distance(point1, point2) for point1, point2 in _groups(
+     points, pairs, 2
+    )])
+
+
+@accept_objects
+def angles(points, triples=None):
+    """Measures the angles, in degrees, made by triples of points - the angle
+    at the middle point of each triple.
+
+    The triples are given as (i, j, k) indices into the points - a list of
+    tuples or an (M, 3) NumPy array. If no triples are given, the angle at
+    every point other than the first and last is measured, as along a chain.
+
+    If NumPy is installed the angles are returned as an array - otherwise a
+    ``tuple`` is returned.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param triples: The indices of the points to measure.
+    :raises ValueError: if the triples do not each have three indices."""
+
+    if numpy is not None:
+        first, middle, last = _index_points(points, triples, 3)
+        vector1, vector2 = first - middle, last - middle
+        return numpy.degrees(numpy.arctan2(
+         numpy.sqrt((numpy.cross(vector1, vector2) ** 2).sum(axis=1)),
+         (vector1 * vector2).sum(axis=1)
+        ))
+    results = []
+    for first, middle, last in _groups(points, triples, 3):
+        vector1, vector2 = _subtract(first, middle), _subtract(last, middle)
+        results.append(degrees(atan2(
+         _length(_cross(vector1, vector2)), _dot(vector1, vector2)
+        )))
+    return tuple(results)
+
+
+@accept_objects
+def dihedrals(points, quads=None):
+    """Measures the dihedral (torsion) angles, in degrees, made by sets of four
+    points - the angle between the plane of the first three points and the
+    plane of the last three, looking along the bond between the middle two.
+    Angles are between -180° and 180°, and are positive when the far bond is
+    turned clockwise from the near one.
+
+    The quads are given as (i, j, k, l) indices into the points - a list of
+    tuples or an (M, 4) NumPy array. If no quads are given, the dihedral of
+    every four consecutive points is measured, as along a chain.
+
+    If NumPy is installed the angles are returned as an array - otherwise a
+    ``tuple`` is returned.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param quads: The indices of the points to measure.
+    :raises ValueError: if the quads do not each have four indices."""
+
+    if numpy is not None:
+        point1, point2, point3, point4 = _index_points(points, quads, 4)
+        bond1, bond2, bond3 = point1 - point2, point3 - point2, point4 - point3
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            bond2 = bond2 / numpy.sqrt((bond2 ** 2).sum(axis=1))[:, None]
+        near = bond1 - (bond1 * bond2).sum(axis=1)[:, None] * bond2
+        far = bond3 - (bond3 * bond2).sum(axis=1)[:, None] * bond2
+        return numpy.degrees(numpy.arctan2(
+         (numpy.cross(bond2, near) * far).sum(axis=1), (near * far).sum(axis=1)
+        ))
+    results = []
+    for point1, point2, point3, point4 in _groups(points, quads, 4):
+        bond1, bond2 = _subtract(point1, point2), _subtract(point3, point2)
+        bond3 = _subtract(point4, point3)
+        length = _length(bond2)
+        if length == 0:
+            results.append(float("nan"))
+            continue
+        bond2 = [value / length for value in bond2]
+        near = _subtract(bond1, [_dot(bond1, bond2) * v for v in bond2])
+        far = _subtract(bond3, [_dot(bond3, bond2) * v for v in bond2])
+        results.append(degrees(atan2(
+         _dot(_cross(bond2, near), far), _dot(near, far)
+        )))
+    return tuple(results)
+
+
+@accept_objects
+def distance_matrix(points, other=None, chunk_size=None):
+    """Measures the distance between every pair of points in one collection,
+    or between every point in one collection and every point in another.
+
+    Row ``i`` of the matrix holds the distances from point ``i``. The whole
+    matrix takes memory proportional to the number of points squared, so
+    ``chunk_size`` can be given to have the rows produced lazily, that many at
+    a time, instead - only one chunk is in memory at once:
+
+        >>> for start, rows in distance_matrix(points, chunk_size=1000):
+        ...     process(start, rows)
+
+    If NumPy is installed the matrix (or each chunk) is an array - otherwise
+    it is a ``tuple`` of ``tuple``.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param other: A second collection of points to measure to. If not given,\
+    the points are measured to each other.
+    :param int chunk_size: If given, a generator of (start, rows) pairs is\
+    returned, where ``start`` is the index of the chunk's first row.
+    :raises TypeError: if the chunk size is not an integer.
+    :raises ValueError: if the chunk size is not positive.
+    :returns: The distance matrix."""
+
+    if chunk_size is not None:
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+            raise TypeError("chunk_size must be int, not '%s'" % (
+             str(chunk_size)
+            ))
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive, not %i" % (
+             chunk_size
+            ))
+    other = points if other is None else _collect(other)
+    if numpy is not None:
+        points, other = _as_array(points), _as_array(other)
+    else:
+        points, other = tuple(points), tuple(other)
+    if chunk_size is None:
+        return _distance_rows(points, other)
+    return _distance_chunks(points, other, chunk_size)
+
+
+def _distance_chunks(points, other, chunk_size):
+    for start in range(0, len(points), chunk_size):
+        yield start, _distance_rows(points[start:start + chunk_size], other)
+
+
+def _distance_rows(points, other):
+    if numpy is not None:
+        return numpy.sqrt(
+         ((points[:, None, :] - other[None, :, :]) ** 2).sum(axis=2)
+        )
+    return tuple([tuple([
+     _distance(point1, point2) for point2 in other
+    ]) for point1 in points])
+
+
+def _index_points(points, indices, size):
+    """Converts points to an array, and returns one array of points for each
+    position in the groups of indices."""
+
+    points = _as_array(points)
+    if indices is None:
+        count = max(len(points) - size + 1, 0)
+        indices = numpy.arange(count)[:, None] + numpy.arange(size)
+    else:
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        if indices.size == 0:
+            indices = indices.reshape(0, size)
+        if indices.ndim != 2 or indices.shape[1] != size:
+            raise ValueError("Indices must be in groups of %i, not %s" % (
+             size, str(indices.shape)
+            ))
+    return [points[indices[:, position]] for position in range(size)]
+
+
+def _groups(points, indices, size):
+    """Returns the groups of points to measure, as a list of tuples."""
+
+    points = tuple(points)
+    if indices is None:
+        return list(zip(*[points[start:] for start in range(size)]))
+    groups = []
+    for group in indices:
+        group = tuple(group)
+        if len(group) != size:
+            raise ValueError("Indices must be in groups of %i, not %s" % (
+             size, str(group)
+            ))
+        groups.append(tuple([points[index] for index in group]))
+    return groups
+
+
+def _subtract(vector1, vector2):
+    return [a - b for a, b in zip(vector1, vector2)]
+
+
+def _dot(vector1, vector2):
+    return sum([a * b for a, b in zip(vector1, vector2)])
+
+
+def _cross(vector1, vector2):
+    (x1, y1, z1), (x2, y2, z2) = vector1, vector2
+    return [y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2]
+
+
+def _length(vector):
+    return sqrt(_dot(vector, vector))
+
+
+def _distance(point1, point2):
+    return _length(_subtract(point1, point2))
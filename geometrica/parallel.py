@@ -0,0 +1,137 @@
+"""Contains tools for spreading large transformations over several cores."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from . import checks
+from .pointset import PointSet
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+PARALLEL_THRESHOLD = 100000
+
+def should_parallelise(points, workers=None, executor=None):
+    """Decides whether a transformation of some points should be done in
+    parallel - that is, whether it was asked for, whether NumPy is installed,
+    and whether there are at least ``PARALLEL_THRESHOLD`` points. Below this,
+    the cost of starting the work on other cores outweighs the benefit, so it
+    is done serially. Without NumPy the points would have to be sent to other
+    processes and back, which costs more than transforming them, so the work
+    is always done serially.
+
+    :param points: The points to be transformed.
+    :param int workers: The number of workers asked for.
+    :param executor: The executor asked for.
+    :raises TypeError: if workers is not an integer.
+    :raises ValueError: if workers is not positive.
+    :rtype: ``bool``"""
+
+    if workers is not None and checks.validating():
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise TypeError("workers must be int, not '%s'" % str(workers))
+        if workers < 1:
+            raise ValueError("workers must be positive, not %i" % workers)
+    if numpy is None or (workers is None and executor is None):
+        return False
+    return len(points) >= PARALLEL_THRESHOLD
+
+
+def apply_in_parallel(points, rows, workers=None, executor=None):
+    """Applies an affine transformation to a set of points by splitting them
+    into chunks, transforming the chunks on several workers, and putting the
+    results back together in their original order.
+
+    NumPy arrays and :py:class:`.PointSet` objects are transformed with NumPy
+    on a thread pool - NumPy releases the GIL while multiplying matrices, so
+    the threads really do run at the same time, and they write straight into
+    one shared output buffer. Other collections of points are converted to an
+    array first, and the results converted back. NumPy must be installed.
+
+    If an executor is given which is not a ``ThreadPoolExecutor`` - a
+    ``ProcessPoolExecutor``, for example - the points are still transformed
+    with NumPy, but each worker returns its transformed chunk to be copied
+    into the output, as other processes cannot write into this one's
+    memory.
+
+    :param points: The points, as a list of (x, y, z) coordinates, an (N, 3)\
+    NumPy array, or a PointSet.
+    :param rows: The rows of the 4x4 affine matrix to apply.
+    :param int workers: The number of workers to use. If not given, the\
+    number of CPUs is used.
+    :param executor: A ``concurrent.futures`` executor to use instead of\
+    creating a new pool.
+    :returns: The transformed points, in the same form as they were given."""
+
+    workers = workers or os.cpu_count() or 1
+    pool = executor or ThreadPoolExecutor(max_workers=workers)
+    shared = executor is None or isinstance(executor, ThreadPoolExecutor)
+    try:
+        if isinstance(points, (PointSet, numpy.ndarray)):
+            return _apply_threaded(points, rows, workers, pool, shared)
+        result = _apply_threaded(
+         numpy.array(points, dtype=float).reshape(-1, 3), rows, workers, pool,
+         shared
+        )
+        values = iter(result.ravel().tolist())
+        return tuple(zip(values, values, values))
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+def chunk_bounds(length, chunks):
+    """Splits a length into (start, end) pairs of roughly equal size.
+
+    :param int length: The length to split.
+    :param int chunks: The number of chunks to split it into.
+    :rtype: ``list``"""
+
+    chunks = max(1, min(chunks, length))
+    size, extra = divmod(length, chunks)
+    bounds, start = [], 0
+    for chunk in range(chunks):
+        end = start + size + (1 if chunk < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _apply_threaded(points, rows, workers, pool, shared):
+    if isinstance(points, PointSet):
+        result = points.copy()
+        source = target = result.as_array()
+    else:
+        result = target = numpy.empty(points.shape, dtype=points.dtype)
+        source = points
+    matrix = numpy.array(rows, dtype=source.dtype)
+    linear, offset = matrix[:3, :3].T.copy(), matrix[:3, 3].copy()
+    bounds = chunk_bounds(len(source), workers)
+    if shared:
+        futures = [pool.submit(
+         _apply_to_block, source[start:end], target[start:end], linear, offset
+        ) for start, end in bounds]
+        for future in futures:
+            future.result()
+    else:
+        futures = [pool.submit(
+         _transform_block, source[start:end], linear, offset
+        ) for start, end in bounds]
+        for (start, end), future in zip(bounds, futures):
+            target[start:end] = future.result()
+    return result
+
+
+def _apply_to_block(source, target, linear, offset):
+    if numpy.shares_memory(source, target):
+        target[:] = source @ linear
+    else:
+        numpy.matmul(source, linear, out=target)
+    target += offset
+
+
+def _transform_block(source, linear, offset):
+    block = source @ linear
+    block += offset
+    return block
+
@@ -0,0 +1,264 @@
+"""Contains the PointSet class, a compact container for coordinates."""
+
+from array import array
+from . import kernel
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CHUNK_SIZE = 65536
+TYPES = {"float64": "d", "float32": "f"}
+
+class PointSet:
+    """A PointSet is a collection of (x, y, z) coordinates stored in a single
+    contiguous buffer of doubles, rather than as a tuple of tuples. This takes
+    24 bytes per point, compared to well over 100 bytes for a tuple of three
+    Python floats. The values can also be stored as float32, at 12 bytes per
+    point, where seven significant figures are enough.
+
+    PointSets can be iterated over like any other collection of coordinates,
+    and passed to :py:func:`.translate`, :py:func:`.rotate` and
+    :py:meth:`.Transform.apply`, which will return a new PointSet. They can
+    also be transformed in place with their own :py:meth:`translate`,
+    :py:meth:`rotate` and :py:meth:`apply` methods.
+
+    Slicing a PointSet (with a step of 1) creates a new PointSet which shares
+    the same memory, so changes made through one are seen by the other.
+
+    :param points: A collection of (x, y, z) coordinates, or of objects with\
+    x(), y() and z() methods.
+    :param str dtype: How to store the values - ``"float64"`` (the default)\
+    or ``"float32"``."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, points=(), dtype="float64"):
+        data = array(check_dtype(dtype))
+        for obj in points:
+            try:
+                x, y, z = obj
+            except TypeError:
+                x, y, z = obj.x(), obj.y(), obj.z()
+            data.extend((x, y, z))
+        self._data = memoryview(data)
+
+
+    def __repr__(self):
+        length = len(self)
+        return "<PointSet (%i point%s)>" % (length, "" if length == 1 else "s")
+
+
+    def __len__(self):
+        return len(self._data) // 3
+
+
+    def __iter__(self):
+        values = iter(self._data)
+        return zip(values, values, values)
+
+
+    def __eq__(self, other):
+        if not isinstance(other, PointSet):
+            return NotImplemented
+        return self._data == other._data
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                pointset = PointSet.__new__(PointSet)
+                pointset._data = self._data[start * 3:max(start, stop) * 3]
+                return pointset
+            return PointSet(
+             [self[i] for i in range(start, stop, step)], dtype=self.dtype()
+            )
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("PointSet index out of range")
+        return tuple(self._data[index * 3:index * 3 + 3])
+
+
+    @staticmethod
+    def from_buffer(buffer, dtype=None):
+        """Creates a PointSet which uses an existing buffer of doubles (or
+        float32 values) as its memory, without copying it. The buffer can be
+        anything which supports the buffer protocol - an ``array("d")``, a
+        ``bytearray``, a ``memoryview``, a NumPy float64 array etc. The values
+        are read as x, y, z, x, y, z...
+
+        :param buffer: The buffer to use.
+        :param str dtype: The type of the values - ``"float64"`` or\
+        ``"float32"``. By default this is worked out from the buffer, and raw\
+        bytes are read as float64.
+        :raises TypeError: if the buffer contains some other type of value.
+        :raises ValueError: if the buffer's length is not a multiple of three\
+        values.
+        :rtype: ``PointSet``"""
+
+        data = memoryview(buffer)
+        if data.format not in ("d", "f", "B", "b", "c"):
+            raise TypeError("Buffer must contain doubles, not '%s'" % (
+             data.format
+            ))
+        if dtype is None:
+            code = data.format if data.format in ("d", "f") else "d"
+        else:
+            code = check_dtype(dtype)
+            if data.format in ("d", "f") and data.format != code:
+                raise TypeError("Buffer contains '%s' values, not %s" % (
+                 data.format, dtype
+                ))
+        if data.format != code or data.ndim != 1:
+            data = data.cast("B").cast(code)
+        if len(data) % 3:
+            raise ValueError(
+             "Buffer has %i values, which is not a multiple of 3" % len(data)
+            )
+        pointset = PointSet.__new__(PointSet)
+        pointset._data = data
+        return pointset
+
+
+    def buffer(self):
+        """Returns the PointSet's underlying memory, as a ``memoryview`` of
+        doubles (or float32 values). This is not a copy.
+
+        :rtype: ``memoryview``"""
+
+        return self._data
+
+
+    def dtype(self):
+        """Returns how the PointSet's values are stored - ``"float64"`` or
+        ``"float32"``.
+
+        :rtype: ``str``"""
+
+        return "float32" if self._data.format == "f" else "float64"
+
+
+    def points(self):
+        """Returns the PointSet's coordinates as a ``tuple`` of (x, y, z)
+        tuples.
+
+        :rtype: ``tuple``"""
+
+        return tuple(self)
+
+
+    def as_array(self):
+        """Returns an (N, 3) NumPy array which uses the PointSet's memory
+        rather than a copy of it, so that changes to either are seen in both.
+        NumPy must be installed.
+
+        :rtype: ``numpy.ndarray``"""
+
+        return numpy.frombuffer(
+         self._data, dtype=self._data.format
+        ).reshape(-1, 3)
+
+
+    def copy(self):
+        """Returns a PointSet with the same coordinates as this one, but its
+        own memory.
+
+        :rtype: ``PointSet``"""
+
+        data = array(self._data.format)
+        data.frombytes(self._data.cast("B"))
+        return PointSet.from_buffer(data)
+
+
+    def astype(self, dtype):
+        """Returns a copy of the PointSet with its values stored as another
+        type. Converting to float32 rounds each value to about seven
+        significant figures.
+
+        :param str dtype: ``"float64"`` or ``"float32"``.
+        :rtype: ``PointSet``"""
+
+        code = check_dtype(dtype)
+        if code == self._data.format:
+            return self.copy()
+        if numpy is not None:
+            return PointSet.from_buffer(
+             numpy.frombuffer(self._data, dtype=self._data.format).astype(code)
+            )
+        return PointSet.from_buffer(array(code, self._data))
+
+
+    def translate(self, x, y, z):
+        """Translates the PointSet in place - see :py:func:`.translate`.
+
+        :param number x: The distance to move the points in the x direction.
+        :param number y: The distance to move the points in the y direction.
+        :param number z: The distance to move the points in the z direction.
+        :returns: The PointSet itself."""
+
+        from .transform import Transform
+        return self.apply(Transform.translation(x, y, z))
+
+
+    def rotate(self, axis, angle, hand="right", pivot=None):
+        """Rotates the PointSet in place - see :py:func:`.rotate`.
+
+        :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`,\
+        or an (x, y, z) vector in any direction.
+        :param number angle: The angle in degrees to rotate by.
+        :param str hand: specifies whether the rotation should be right-handed\
+        or left-handed. The deafult is 'right'.
+        :param pivot: An (x, y, z) point which the axis passes through.
+        :returns: The PointSet itself."""
+
+        from .transform import Transform
+        return self.apply(Transform.rotation(axis, angle, hand, pivot=pivot))
+
+
+    def apply(self, transform):
+        """Applies a :py:class:`.Transform` to the PointSet in place, in a
+        single pass over its memory. No temporary copy of the whole PointSet is
+        made - if NumPy is used, it works through the points in chunks of
+        ``CHUNK_SIZE``. The arithmetic is done in the PointSet's own
+        precision.
+
+        :param Transform transform: The Transform to apply.
+        :returns: The PointSet itself."""
+
+        rows = transform.rows()
+        data = self._data
+        if data.readonly:
+            raise TypeError("PointSet's buffer is read-only")
+        if numpy is not None:
+            values = self.as_array()
+            matrix = numpy.array(rows, dtype=values.dtype)
+            linear, offset = matrix[:3, :3], matrix[:3, 3]
+            if not (linear == numpy.identity(3)).all():
+                for start in range(0, len(values), CHUNK_SIZE):
+                    chunk = values[start:start + CHUNK_SIZE]
+                    chunk[:] = chunk @ linear.T
+            if offset.any():
+                values += offset
+            return self
+        kernel.transform_values(data, rows)
+        return self
+
+
+
+def check_dtype(dtype):
+    """Checks that a dtype is one that geometrica can store coordinates as,
+    and returns its ``array`` type code.
+
+    :param str dtype: ``"float64"`` or ``"float32"``.
+    :raises ValueError: if the dtype is anything else.
+    :rtype: ``str``"""
+
+    try:
+        return TYPES[dtype]
+    except (KeyError, TypeError):
+        raise ValueError(
+         "dtype must be 'float64' or 'float32', not %s" % str(dtype)
+        )
@@ -0,0 +1,174 @@
+"""Contains the Quaternion class, for representing orientations."""
+
+from math import radians, sin, cos, acos, sqrt
+from .checks import are_numeric, is_numeric
+
+class Quaternion:
+    """A Quaternion is a four-part number, ``w + xi + yj + zk``. Unit
+    quaternions are a compact way of representing a rotation in three
+    dimensional space, and unlike matrices they can be smoothly interpolated
+    between with :py:func:`.slerp`.
+
+    Multiplying two Quaternions combines their rotations - as with
+    :py:class:`.Transform`, ``q2 * q1`` is the rotation ``q1`` followed by
+    ``q2``. A Quaternion can be turned into a Transform with
+    :py:meth:`.Transform.from_quaternion`.
+
+    :param number w: The real part.
+    :param number x: The i part.
+    :param number y: The j part.
+    :param number z: The k part."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, w, x, y, z):
+        if not are_numeric(w, x, y, z):
+            raise TypeError("Quaternion values must be numeric, not '%s'" % (
+             str((w, x, y, z))
+            ))
+        self._values = (w, x, y, z)
+
+
+    def __repr__(self):
+        return "<Quaternion %s>" % str(self._values)
+
+
+    def __eq__(self, other):
+        return isinstance(other, Quaternion) and self._values == other._values
+
+
+    def __mul__(self, other):
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+        w1, x1, y1, z1 = self._values
+        w2, x2, y2, z2 = other._values
+        return Quaternion(
+         w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+         w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+         w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+         w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+        )
+
+
+    @staticmethod
+    def from_axis_angle(axis, angle, hand="right"):
+        """Creates the unit Quaternion which rotates by some angle around an
+        axis through the origin.
+
+        :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`,\
+        or an (x, y, z) vector in any direction.
+        :param number angle: The angle in degrees to rotate by.
+        :param str hand: specifies whether the rotation should be right-handed\
+        or left-handed. The deafult is 'right'.
+        :rtype: ``Quaternion``"""
+
+        from .transform import unit_axis
+        x, y, z = unit_axis(axis)
+        if not is_numeric(angle):
+            raise TypeError("angle must be numeric, not '%s'" % str(angle))
+        if hand not in ("left", "right"):
+            raise ValueError("hand must be 'left' or 'right', not %s" % hand)
+        half = radians(-angle if hand == "left" else angle) / 2
+        sine = sin(half)
+        return Quaternion(cos(half), x * sine, y * sine, z * sine)
+
+
+    def values(self):
+        """Returns the Quaternion's four values, as (w, x, y, z).
+
+        :rtype: ``tuple``"""
+
+        return self._values
+
+
+    def magnitude(self):
+        """Returns the Quaternion's magnitude, which is 1 for Quaternions which
+        represent rotations.
+
+        :rtype: ``float``"""
+
+        return sqrt(sum(value ** 2 for value in self._values))
+
+
+    def normalised(self):
+        """Returns the unit Quaternion pointing the same way as this one.
+
+        :raises ValueError: if the Quaternion is zero.
+        :rtype: ``Quaternion``"""
+
+        magnitude = self.magnitude()
+        if magnitude == 0:
+            raise ValueError("The zero Quaternion cannot be normalised")
+        return Quaternion(*[value / magnitude for value in self._values])
+
+
+    def conjugate(self):
+        """Returns the Quaternion's conjugate. For a unit Quaternion this is
+        the opposite rotation.
+
+        :rtype: ``Quaternion``"""
+
+        w, x, y, z = self._values
+        return Quaternion(w, -x, -y, -z)
+
+
+    def matrix(self):
+        """Returns the 3x3 rotation matrix that this Quaternion represents. The
+        Quaternion is normalised first.
+
+        :returns: The matrix's three rows, as a ``tuple`` of ``tuple``."""
+
+        w, x, y, z = self.normalised()._values
+        return (
+         (1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)),
+         (2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)),
+         (2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y))
+        )
+
+
+
+def slerp(start, end, t):
+    """Spherical linear interpolation between two orientations. This gives the
+    rotation some fraction of the way along the shortest, constant-speed path
+    from one orientation to another.
+
+    ``t`` can also be a sequence of fractions, in which case all the
+    orientations are worked out in one call - useful for generating the frames
+    of an animation:
+
+        >>> frames = slerp(start, end, [n / 24 for n in range(25)])
+
+    :param Quaternion start: The orientation at ``t = 0``.
+    :param Quaternion end: The orientation at ``t = 1``.
+    :param t: The fraction of the way from start to end, or a sequence of them.
+    :returns: A ``Quaternion``, or a ``tuple`` of them if ``t`` is a sequence."""
+
+    if not isinstance(start, Quaternion) or not isinstance(end, Quaternion):
+        raise TypeError("slerp needs two Quaternions, not '%s' and '%s'" % (
+         str(start), str(end)
+        ))
+    start, end = start.normalised().values(), end.normalised().values()
+    dot = sum(a * b for a, b in zip(start, end))
+    if dot < 0:
+        end, dot = [-value for value in end], -dot
+    dot = min(dot, 1)
+    theta = acos(dot)
+    sin_theta = sin(theta)
+
+    def interpolate(fraction):
+        if not is_numeric(fraction):
+            raise TypeError("t must be numeric, not '%s'" % str(fraction))
+        if sin_theta < 1e-9:
+            weights = (1 - fraction, fraction)
+        else:
+            weights = (
+             sin((1 - fraction) * theta) / sin_theta,
+             sin(fraction * theta) / sin_theta
+            )
+        return Quaternion(*[
+         weights[0] * a + weights[1] * b for a, b in zip(start, end)
+        ]).normalised()
+
+    if is_numeric(t):
+        return interpolate(t)
+    return tuple([interpolate(fraction) for fraction in t])
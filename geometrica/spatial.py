@@ -0,0 +1,259 @@
+"""Contains the KDTree class, for finding points near other points."""
+
+from heapq import heappush, heappushpop
+from . import checks, kernel
+from .checks import are_numeric, is_numeric
+from .pointset import PointSet
+from .transform import accept_objects, is_array, Transform
+
+LEAF_SIZE = 16
+
+class KDTree:
+    """A KDTree is an index of a set of (x, y, z) coordinates, which finds the
+    points within some distance of a location, or the nearest points to it,
+    without measuring the distance to every point.
+
+    The tree is built in one go from any of the collections that
+    :py:func:`.translate` and :py:func:`.rotate` accept - including the
+    tuples, PointSets and arrays that they return. Points are identified by
+    their position in that collection.
+
+    The tree can be moved with :py:meth:`apply`, :py:meth:`translate` and
+    :py:meth:`rotate`. As long as the movement is rigid (it does not stretch
+    or skew the points), the tree is not rebuilt - it just records the new
+    frame its points are in, and converts query locations back into the
+    original frame.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate\
+    objects.
+    :param int leaf_size: The number of points below which the tree stops\
+    splitting and checks every point instead."""
+
+    __slots__ = ("_values", "_order", "_root", "_frame", "_inverse")
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        if checks.validating():
+            if not isinstance(leaf_size, int) or isinstance(leaf_size, bool):
+                raise TypeError("leaf_size must be int, not '%s'" % (
+                 str(leaf_size)
+                ))
+            if leaf_size < 1:
+                raise ValueError("leaf_size must be positive, not %i" % (
+                 leaf_size
+                ))
+        self._values = _columns(points)
+        self._order = list(range(len(self._values[0])))
+        self._root = self._build(0, len(self._order), leaf_size)
+        self._frame = self._inverse = None
+
+
+    def __repr__(self):
+        length = len(self)
+        return "<KDTree (%i point%s)>" % (length, "" if length == 1 else "s")
+
+
+    def __len__(self):
+        return len(self._order)
+
+
+    def _build(self, start, end, leaf_size):
+        """Splits the points between two positions in the tree's ordering in
+        half, along whichever axis they are most spread out in, and carries on
+        splitting each half until there are few enough points left."""
+
+        if end - start <= leaf_size:
+            return (None, start, end)
+        order = self._order[start:end]
+        spreads = [
+         max([values[index] for index in order]) -
+         min([values[index] for index in order]) for values in self._values
+        ]
+        axis = spreads.index(max(spreads))
+        values = self._values[axis]
+        order.sort(key=values.__getitem__)
+        self._order[start:end] = order
+        middle = (start + end) // 2
+        return (
+         axis, values[self._order[middle]],
+         self._build(start, middle, leaf_size),
+         self._build(middle, end, leaf_size)
+        )
+
+
+    def points(self):
+        """Returns the indexed coordinates, in their current positions, as a
+        ``tuple`` of (x, y, z) tuples.
+
+        :rtype: ``tuple``"""
+
+        points = zip(*self._values)
+        if self._frame is None:
+            return tuple(points)
+        return kernel.transform_points(points, self._frame.rows())
+
+
+    def within(self, point, radius):
+        """Finds every point within some distance of a location.
+
+        :param point: The (x, y, z) location to search around.
+        :param number radius: The greatest distance to include.
+        :raises ValueError: if the radius is negative.
+        :returns: The indices of the points found, in ascending order, as a\
+        ``tuple``."""
+
+        point = self._local(point)
+        if checks.validating():
+            if not is_numeric(radius):
+                raise TypeError("radius must be numeric, not '%s'" % (
+                 str(radius)
+                ))
+            if radius < 0:
+                raise ValueError("radius cannot be negative, not %s" % (
+                 str(radius)
+                ))
+        xs, ys, zs = self._values
+        x, y, z = point
+        limit = radius * radius
+        found, nodes = [], [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node[0] is None:
+                for index in self._order[node[1]:node[2]]:
+                    dx, dy, dz = xs[index] - x, ys[index] - y, zs[index] - z
+                    if dx * dx + dy * dy + dz * dz <= limit:
+                        found.append(index)
+            else:
+                offset = point[node[0]] - node[1]
+                if offset <= radius:
+                    nodes.append(node[2])
+                if offset >= -radius:
+                    nodes.append(node[3])
+        return tuple(sorted(found))
+
+
+    def nearest(self, point, k=1):
+        """Finds the points closest to a location.
+
+        :param point: The (x, y, z) location to search around.
+        :param int k: The number of points to find.
+        :raises ValueError: if k is not positive.
+        :returns: A ``tuple`` of (index, distance) pairs, nearest first. There\
+        will be fewer than k if the tree has fewer than k points."""
+
+        point = self._local(point)
+        if checks.validating():
+            if not isinstance(k, int) or isinstance(k, bool):
+                raise TypeError("k must be int, not '%s'" % str(k))
+            if k < 1:
+                raise ValueError("k must be positive, not %i" % k)
+        xs, ys, zs = self._values
+        x, y, z = point
+        heap = []
+
+        def search(node):
+            if node[0] is None:
+                for index in self._order[node[1]:node[2]]:
+                    dx, dy, dz = xs[index] - x, ys[index] - y, zs[index] - z
+                    item = (-(dx * dx + dy * dy + dz * dz), -index)
+                    if len(heap) < k:
+                        heappush(heap, item)
+                    elif item > heap[0]:
+                        heappushpop(heap, item)
+                return
+            offset = point[node[0]] - node[1]
+            near, far = (node[2], node[3]) if offset <= 0 else (
+             node[3], node[2]
+            )
+            search(near)
+            if len(heap) < k or offset * offset <= -heap[0][0]:
+                search(far)
+
+        search(self._root)
+        return tuple([
+         (-index, (-distance) ** 0.5) for distance, index in sorted(
+          heap, reverse=True
+         )
+        ])
+
+
+    def apply(self, transform):
+        """Moves the tree's points with a rigid :py:class:`.Transform` - one
+        made of rotations, reflections and translations only. The tree is not
+        rebuilt.
+
+        :param Transform transform: The Transform to apply.
+        :raises ValueError: if the Transform is not rigid.
+        :returns: The KDTree itself."""
+
+        if not isinstance(transform, Transform):
+            raise TypeError("'%s' is not a Transform" % str(transform))
+        linear = [row[:3] for row in transform.rows()[:3]]
+        product = kernel.multiply(linear, tuple(zip(*linear)))
+        for row_index, row in enumerate(product):
+            for column_index, value in enumerate(row):
+                if abs(value - (row_index == column_index)) > 1e-9:
+                    raise ValueError(
+                     "%s is not a rigid transformation" % str(transform)
+                    )
+        frame = transform if self._frame is None else transform @ self._frame
+        self._frame, self._inverse = frame, frame.inverse()
+        return self
+
+
+    def translate(self, x, y, z):
+        """Moves the tree's points - see :py:func:`.translate`.
+
+        :param number x: The distance to move the points in the x direction.
+        :param number y: The distance to move the points in the y direction.
+        :param number z: The distance to move the points in the z direction.
+        :returns: The KDTree itself."""
+
+        return self.apply(Transform.translation(x, y, z))
+
+
+    def rotate(self, axis, angle, hand="right", pivot=None):
+        """Rotates the tree's points - see :py:func:`.rotate`.
+
+        :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`,\
+        or an (x, y, z) vector in any direction.
+        :param number angle: The angle in degrees to rotate by.
+        :param str hand: specifies whether the rotation should be right-handed\
+        or left-handed. The deafult is 'right'.
+        :param pivot: An (x, y, z) point which the axis passes through.
+        :returns: The KDTree itself."""
+
+        return self.apply(Transform.rotation(axis, angle, hand, pivot=pivot))
+
+
+    def _local(self, point):
+        """Converts a query location into the frame the tree was built in."""
+
+        if checks.validating():
+            try:
+                x, y, z = point
+            except (TypeError, ValueError):
+                raise TypeError("point must be (x, y, z), not '%s'" % (
+                 str(point)
+                ))
+            if not are_numeric(x, y, z):
+                raise TypeError("point must be numeric, not '%s'" % (
+                 str(point)
+                ))
+        if self._inverse is None:
+            return tuple(point)
+        return kernel.transform_points((point,), self._inverse.rows())[0]
+
+
+
+@accept_objects
+def _columns(points):
+    """Returns the x, y and z values of a set of points as three lists."""
+
+    if is_array(points):
+        return tuple(points.T.tolist())
+    if isinstance(points, PointSet):
+        data = points.buffer()
+        return tuple([data[axis::3].tolist() for axis in range(3)])
+    if not points:
+        return ([], [], [])
+    return tuple([list(values) for values in zip(*points)])
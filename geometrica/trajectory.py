@@ -0,0 +1,178 @@
+"""Contains functions for transforming trajectories - many frames of the same
+set of points, such as the snapshots of a molecular dynamics simulation."""
+
+from itertools import repeat
+from . import checks
+from .pointset import check_dtype
+from .transform import Transform, is_array
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def transform_frames(frames, transforms, out=None, chunk_size=None,
+                     dtype=None):
+    """Transforms every frame of a trajectory in one call - either with one
+    :py:class:`.Transform` for all of them, or with a different Transform for
+    each frame.
+
+    If the frames are a (T, N, 3) NumPy array, each Transform's matrix is
+    only built once, and the frames are transformed together with one batched
+    matrix multiplication per chunk rather than one call per frame. The array
+    can be memory-mapped (with ``numpy.memmap``, or by reshaping the
+    :py:meth:`~.PointSet.as_array` view of a PointSet from
+    :py:func:`.load_points`), and with ``chunk_size`` only that many frames
+    are read and transformed at a time - so trajectories larger than memory
+    can be transformed into another memory-mapped array with ``out``:
+
+        >>> frames = numpy.memmap("run.dat", dtype="float64", shape=(T, N, 3))
+        >>> moved = numpy.memmap("moved.dat", mode="w+", shape=frames.shape)
+        >>> transform_frames(frames, transforms, out=moved, chunk_size=100)
+
+    Any other iterable of frames (such as a generator reading them from a file
+    one at a time) is transformed lazily if ``chunk_size`` is given. Each
+    frame can be any collection that :py:meth:`.Transform.apply` accepts, and
+    is returned in the same form that it gives.
+
+    :param frames: A (T, N, 3) NumPy array, or an iterable of collections of\
+    points.
+    :param transforms: A Transform to apply to every frame, or one Transform\
+    per frame - either a sequence of Transforms, or a (T, 4, 4) or (T, 3, 4)\
+    NumPy array of their matrices.
+    :param out: A writable (T, N, 3) NumPy array to put the transformed frames\
+    in, instead of creating a new one. The frames must be an array too.
+    :param int chunk_size: If given, the frames are transformed this many at a\
+    time, and (unless ``out`` is given) a generator of (start, frames) pairs\
+    is returned, where ``start`` is the index of the chunk's first frame.
+    :param str dtype: The precision to work in - see :py:func:`.translate`.\
+    Arrays of frames are worked on as float64 by default.
+    :raises ValueError: if there is not one Transform per frame.
+    :raises TypeError: if the chunk size is not an integer.
+    :returns: The transformed frames - an array if an array was given,\
+    otherwise a ``tuple`` of frames."""
+
+    if checks.validating():
+        if chunk_size is not None:
+            if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+                raise TypeError("chunk_size must be int, not '%s'" % (
+                 str(chunk_size)
+                ))
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be positive, not %i" % (
+                 chunk_size
+                ))
+        if dtype is not None:
+            check_dtype(dtype)
+    if is_array(frames):
+        if frames.ndim != 3 or frames.shape[2] != 3:
+            raise ValueError("Frames must have shape (T, N, 3), not %s" % (
+             str(frames.shape)
+            ))
+        dtype = dtype or "float64"
+        linear, offset = _matrices(transforms, len(frames), dtype)
+        if out is not None:
+            if not is_array(out) or out.shape != frames.shape:
+                raise ValueError("out must be an array of shape %s" % (
+                 str(frames.shape)
+                ))
+            for start in range(0, len(frames), chunk_size or len(frames)):
+                end = start + (chunk_size or len(frames))
+                out[start:end] = _transform_block(
+                 frames, start, end, linear, offset, dtype
+                )
+            return out
+        if chunk_size is None:
+            return _transform_block(
+             frames, 0, len(frames), linear, offset, dtype
+            )
+        return _array_chunks(frames, linear, offset, dtype, chunk_size)
+    if out is not None:
+        raise TypeError("out can only be given with an array of frames")
+    transformed = _iter_frames(frames, transforms, dtype)
+    if chunk_size is None:
+        return tuple(transformed)
+    return _frame_chunks(transformed, chunk_size)
+
+
+def _matrices(transforms, count, dtype):
+    """Returns the transposed 3x3 linear part and the translation of a
+    Transform, or a (T, 3, 3) array and (T, 1, 3) array of them for one
+    Transform per frame - ready for multiplying rows of points by."""
+
+    if isinstance(transforms, Transform):
+        matrix = numpy.array(transforms.rows(), dtype=dtype)
+        return matrix[:3, :3].T, matrix[:3, 3]
+    if not is_array(transforms):
+        transforms = [
+         _check_transform(transform).rows()[:3] for transform in transforms
+        ]
+    matrices = numpy.asarray(transforms, dtype=dtype)
+    if matrices.shape not in ((count, 4, 4), (count, 3, 4)):
+        raise ValueError(
+         "Need %i transforms for %i frames, as (4, 4) or (3, 4) matrices, not"
+         " %s" % (count, count, str(matrices.shape))
+        )
+    _check_affine(matrices)
+    return matrices[:, :3, :3].transpose(0, 2, 1), matrices[:, None, :3, 3]
+
+
+def _check_affine(matrices):
+    """Checks that every matrix in a (T, 4, 4) array has (0, 0, 0, 1) as its
+    last row, as a :py:class:`.Transform` must."""
+
+    if checks.validating() and matrices.shape[1] == 4:
+        if not (matrices[:, 3] == (0, 0, 0, 1)).all():
+            raise ValueError(
+             "The last row of every matrix must be (0, 0, 0, 1)"
+            )
+
+
+def _check_transform(transform):
+    if not isinstance(transform, Transform):
+        raise TypeError("'%s' is not a Transform" % str(transform))
+    return transform
+
+
+def _transform_block(frames, start, end, linear, offset, dtype):
+    if linear.ndim == 3:
+        linear, offset = linear[start:end], offset[start:end]
+    block = frames[start:end].astype(dtype, copy=False) @ linear
+    block += offset
+    return block
+
+
+def _array_chunks(frames, linear, offset, dtype, chunk_size):
+    for start in range(0, len(frames), chunk_size):
+        yield start, _transform_block(
+         frames, start, start + chunk_size, linear, offset, dtype
+        )
+
+
+def _iter_frames(frames, transforms, dtype):
+    if isinstance(transforms, Transform):
+        transforms = repeat(transforms)
+    if hasattr(frames, "__len__") and hasattr(transforms, "__len__"):
+        if len(frames) != len(transforms):
+            raise ValueError("Need %i transforms for %i frames, not %i" % (
+             len(frames), len(frames), len(transforms)
+            ))
+    if is_array(transforms):
+        _check_affine(transforms)
+        transforms = (Transform(*matrix[:3].tolist()) for matrix in transforms)
+    transforms = iter(transforms)
+    for frame in frames:
+        transform = next(transforms, None)
+        if transform is None:
+            raise ValueError("There are more frames than transforms")
+        yield _check_transform(transform).apply(frame, dtype=dtype)
+
+
+def _frame_chunks(transformed, chunk_size):
+    start, chunk = 0, []
+    for frame in transformed:
+        chunk.append(frame)
+        if len(chunk) == chunk_size:
+            yield start, tuple(chunk)
+            start, chunk = start + chunk_size, []
+    if chunk:
+        yield start, tuple(chunk)
@@ -1,33 +1,234 @@
 """Contains functions for manipulating Cartesian coordinates."""
 
-from math import radians, sin, cos
-from matrices.checks import are_numeric, is_numeric
-from matrices import create_vertex, Matrix
+from math import radians, sin, cos, sqrt
+from functools import lru_cache
+from itertools import islice
+from . import checks, instrument, kernel, parallel
+from .checks import are_numeric, is_numeric
+from .pointset import PointSet, check_dtype
+from .quaternion import Quaternion
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ROTATION_CACHE_SIZE = 256
+
+def is_array(points):
+    """Checks if an object is a NumPy array. This is always ``False`` if NumPy
+    is not installed.
+
+    :param points: The object to check.
+    :rtype: ``bool``"""
+
+    return numpy is not None and isinstance(points, numpy.ndarray)
+
+
+def _as_array(points):
+    """Converts a PointSet, an array or a sequence of (x, y, z) coordinates to
+    an (N, 3) float64 array, without copying PointSets or float64 arrays."""
+
+    if isinstance(points, PointSet):
+        return points.as_array().astype(float, copy=False)
+    if is_array(points):
+        return points.astype(float, copy=False)
+    return numpy.array(points, dtype=float).reshape(-1, 3)
+
 
 def accept_objects(func):
     """This decorator can be applied to functions whose first argument is a list
     of x, y, z points. It allows the function to also accept a list of objects
-    which have x(), y() and z() methods instead."""
+    which have x(), y() and z() methods instead, or a list of objects with a
+    coordinates() method which returns all three at once.
 
-    def new_func(objects, *args, **kwargs):
-        try:
-            points = [(x, y, z) for x, y, z in objects]
-        except TypeError:
-            points = [(obj.x(), obj.y(), obj.z()) for obj in objects]
-        return func(points, *args, **kwargs)
+    What kind of collection has been given is worked out once, from its first
+    item, rather than by trying each kind in turn over the whole collection.
+    Lists and tuples of (x, y, z) coordinates are passed on without being
+    copied.
+
+    If NumPy is installed, an (N, 3) array of coordinates can also be given, in
+    which case it is passed on to the function as a float array rather than
+    being unpacked into tuples. :py:class:`.PointSet` objects are also passed
+    on unchanged, and anything else supporting the buffer protocol (such as an
+    ``array("d")``) is passed on as a PointSet sharing its memory.
+
+    The decorated function gains a ``write_back`` keyword argument. If this is
+    ``True``, the function's results are written back to the original input
+    - into its memory for arrays, PointSets and buffers, by item assignment for
+    lists of coordinates, and by calling ``obj.x(x)``, ``obj.y(y)`` and
+    ``obj.z(z)`` or ``obj.coordinates(x, y, z)`` for objects. If the function
+    was called with ``with_bounds=True``, it returns a (result, bounds) pair,
+    and only the result is written back. Only float arrays can be written
+    back to, as the results would otherwise be silently truncated - a
+    ``TypeError`` is raised for any other array before any work is done.
+
+    If instrumentation is turned on (see :py:mod:`.instrument`), calls to
+    decorated public functions are recorded, with the time spent converting
+    the collection counted as ``ingestion``, the rest of the function's own
+    time as ``apply`` (unless it marks phases of its own), and writing back as
+    ``output``."""
+
+    public = not func.__name__.startswith("_")
+
+    def new_func(objects, *args, write_back=False, **kwargs):
+        if instrument.ENABLED and public and not instrument.active():
+            return instrument.call(
+             func.__name__, None, new_func, objects, *args,
+             write_back=write_back, **kwargs
+            )
+        objects, points, kind = _ingest(objects, write_back)
+        if instrument.ENABLED:
+            instrument.phase("ingestion", size=len(points))
+        result = func(points, *args, **kwargs)
+        if instrument.ENABLED:
+            instrument.phase("apply")
+        if write_back:
+            _write_back(objects, points, kind, (
+             result[0] if kwargs.get("with_bounds") else result
+            ))
+        return result
     new_func.__name__ = func.__name__
     new_func.__doc__ = func.__doc__
     return new_func
 
 
 @accept_objects
-def translate(points, x, y, z):
+def _collect(points):
+    """Converts any collection that :py:func:`.accept_objects` accepts into
+    points, for functions which take more than one collection."""
+
+    return points
+
+
+def _ingest(objects, write_back=False):
+    """Converts any of the collections that :py:func:`.accept_objects` accepts
+    into points. The collection (turned into a list if it was some other
+    iterable), the points, and a string describing what kind of collection it
+    was are returned. If the results are to be written back, collections
+    which cannot hold them are rejected before any work is done - arrays
+    which would lose precision, read-only buffers, and coordinates which
+    cannot be changed, such as tuples."""
+
+    if isinstance(objects, PointSet):
+        if write_back:
+            _check_writable(objects)
+        return objects, objects, "pointset"
+    if is_array(objects):
+        if objects.ndim != 2 or objects.shape[1] != 3:
+            raise ValueError(
+             "Coordinate arrays must have shape (N, 3), not %s" % (
+              str(objects.shape)
+             )
+            )
+        if write_back and objects.dtype.kind != "f":
+            raise TypeError(
+             "Can only write back to float arrays, not %s" % objects.dtype
+            )
+        if objects.dtype != numpy.float32:
+            return objects, numpy.asarray(objects, dtype=float), "array"
+        return objects, objects, "array"
+    try:
+        memoryview(objects)
+    except TypeError:
+        pass
+    else:
+        points = PointSet.from_buffer(objects)
+        if write_back:
+            _check_writable(points)
+        return objects, points, "buffer"
+    if not isinstance(objects, (list, tuple)):
+        objects = list(objects)
+    if not objects:
+        return objects, objects, "sequence"
+    kind = _item_kind(objects[0])
+    if kind == "sequence":
+        if write_back:
+            _check_mutable(objects)
+        return objects, objects, kind
+    return objects, _convert(objects, kind), kind
+
+
+def _check_writable(pointset):
+    """Checks that a PointSet's memory can be written back to."""
+
+    if pointset.buffer().readonly:
+        raise TypeError("Can't write back to a read-only buffer")
+
+
+def _check_mutable(coordinates):
+    """Checks that every (x, y, z) coordinate in a sequence can have its
+    values changed, so that results can be written back to them."""
+
+    for coordinate in coordinates:
+        if not hasattr(coordinate, "__setitem__"):
+            raise TypeError("Can't write back to '%s' coordinates" % (
+             type(coordinate).__name__
+            ))
+
+
+def _item_kind(item):
+    """Works out whether an item of a collection is an (x, y, z) coordinate
+    (``"sequence"``), an object with a coordinates() method
+    (``"coordinates"``), or an object with x(), y() and z() methods
+    (``"xyz"``)."""
+
+    try:
+        x, y, z = item
+        return "sequence"
+    except TypeError:
+        pass
+    try:
+        x, y, z = item.coordinates()
+    except (AttributeError, TypeError):
+        return "xyz"
+    return "coordinates"
+
+
+def _convert(objects, kind):
+    """Gets the coordinates of a list of objects, of a kind found by
+    :py:func:`._item_kind`."""
+
+    if kind == "xyz":
+        return [(obj.x(), obj.y(), obj.z()) for obj in objects]
+    return [tuple(obj.coordinates()) for obj in objects]
+
+
+def _write_back(objects, points, kind, result):
+    """Writes the results of a function decorated with
+    :py:func:`.accept_objects` back to the objects it was given."""
+
+    if not isinstance(result, (list, tuple, PointSet)) and not is_array(result):
+        result = PointSet.from_buffer(result)
+    if kind == "array":
+        if isinstance(result, PointSet):
+            result = result.as_array()
+        objects[...] = result
+    elif kind in ("pointset", "buffer"):
+        write_points(result, points.buffer())
+    elif kind == "sequence":
+        for obj, (x, y, z) in zip(objects, result):
+            obj[0], obj[1], obj[2] = x, y, z
+    elif kind == "coordinates":
+        for obj, (x, y, z) in zip(objects, result):
+            obj.coordinates(x, y, z)
+    else:
+        for obj, (x, y, z) in zip(objects, result):
+            obj.x(x)
+            obj.y(y)
+            obj.z(z)
+
+
+@accept_objects
+def translate(points, x, y, z, out=None, workers=None, executor=None,
+              dtype=None, with_bounds=False):
     """Takes a set of coordinates and translates them in three dimensional
     space.
 
     The points must be a list (or tuple, or any collection really) of
     coordinates in the form ``(x, y, z)``, *or* a list (etc.) of objects with
-    x(), y() and z() methods.
+    x(), y() and z() methods. If an (N, 3) NumPy array is given, the whole
+    array is translated in one operation and an array is returned. If a
+    :py:class:`.PointSet` is given, a new PointSet is returned.
 
     An example would be ``translate([(1, 1, 1), (2, 2, 2)], 5, 5, 5)``.
 
@@ -35,65 +236,899 @@ def translate(points, x, y, z):
     :param number x: The distance to move the points in the x direction.
     :param number y: The distance to move the points in the y direction.
     :param number z: The distance to move the points in the z direction.
-    :returns: The translated coordinates."""
+    :param out: A writable buffer of doubles to put the translated coordinates\
+    in, instead of creating a new object - see :py:func:`.write_points`.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points - see :py:func:`.accept_objects`.
+    :param int workers: If given, large sets of points are split into chunks\
+    which are transformed on this many cores - see\
+    :py:func:`.apply_in_parallel`.
+    :param executor: A ``concurrent.futures`` executor to do parallel work on.
+    :param str dtype: The precision to work in and return arrays and\
+    PointSets in - ``"float64"`` or ``"float32"``. By default, arrays are\
+    worked on as float64 and PointSets in their own precision. Other\
+    collections always give Python floats.
+    :param bool with_bounds: If ``True``, the volumes enclosing the translated\
+    points are also found - see :py:func:`.find_bounds`.
+    :returns: The translated coordinates, or if ``with_bounds`` is ``True``,\
+    the translated coordinates and their :py:class:`.Bounds`."""
 
-    if not are_numeric(x, y, z):
-        raise TypeError("Translation parameters must be numeric, not '%s'" % (
-         str((x, y, z))
+    if checks.validating():
+        if not are_numeric(x, y, z):
+            raise TypeError(
+             "Translation parameters must be numeric, not '%s'" % (
+              str((x, y, z))
+             )
+            )
+        if dtype is not None:
+            check_dtype(dtype)
+    if with_bounds:
+        return _with_bounds(translate(
+         points, x, y, z, out=out, workers=workers, executor=executor,
+         dtype=dtype
         ))
+    if instrument.ENABLED:
+        instrument.phase("validation")
+    if out is not None:
+        return _write_transformed(points, Transform.translation(x, y, z), out)
+    if parallel.should_parallelise(points, workers, executor):
+        return parallel.apply_in_parallel(
+         _cast(points, dtype), Transform.translation(x, y, z).rows(),
+         workers, executor
+        )
+    if is_array(points):
+        points = _cast(points, dtype)
+        return points + numpy.array((x, y, z), dtype=points.dtype)
+    if isinstance(points, PointSet):
+        return points.astype(dtype or points.dtype()).translate(x, y, z)
     return tuple([tuple([px + x, py + y, pz + z]) for px, py, pz in points])
 
 
 @accept_objects
-def rotate(points, axis, angle, hand="right"):
-    """Takes a set of coordinates and rotates them around one of the axes by a
-    specified angle. The rotation performed is right-handed, unless specified
-    otherwise.
+def rotate(points, axis, angle, hand="right", pivot=None, out=None,
+           workers=None, executor=None, dtype=None, with_bounds=False):
+    """Takes a set of coordinates and rotates them around an axis by a
+    specified angle. The axis can be one of the x, y or z axes, or any vector,
+    and passes through the origin unless a pivot point is given. The rotation
+    performed is right-handed, unless specified otherwise.
 
     The points must be a list (or tuple, or any collection) of
     coordinates in the form ``(x, y, z)``, *or* a list (etc.) of objects with
-    x(), y() and z() methods.
+    x(), y() and z() methods. If an (N, 3) NumPy array is given, the whole
+    array is rotated in one operation and an array is returned. If a
+    :py:class:`.PointSet` is given, a new PointSet is returned.
 
-    An example would be ``rotate([(1, 1, 1), (2, 2, 2)], "x", 45)``.
+    An example would be ``rotate([(1, 1, 1), (2, 2, 2)], "x", 45)``, or
+    ``rotate([(1, 1, 1), (2, 2, 2)], (1, 1, 0), 45, pivot=(5, 0, 0))``.
 
     :param points: A collection of (x, y, z) coordinates or appropriate objects.
-    :param str axis: The axis to rotate around. Accepted values are `"x"`,\
-    `"y"` or `"z"`.
+    :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`, or\
+    an (x, y, z) vector in any direction.
     :param number angle: The angle in degrees to rotate by.
     :param str hand: specifies whether the rotation should be right-handed or\
     left-handed. The deafult is 'right'.
-    :returns: The rotated coordinates."""
-
-    if not is_numeric:
-        raise TypeError("angle must be numeric, not '%s'" % str(angle))
-    if not isinstance(hand, str):
-        raise TypeError("hand must be str, not '%s'" % str(hand))
-    elif hand not in ("left", "right"):
-        raise ValueError("hand must be 'left' or 'right', not %s" % hand)
-    elif hand == "left":
+    :param pivot: An (x, y, z) point which the axis passes through. By\
+    default, the axis passes through the origin.
+    :param out: A writable buffer of doubles to put the rotated coordinates\
+    in, instead of creating a new object - see :py:func:`.write_points`.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points - see :py:func:`.accept_objects`.
+    :param int workers: If given, large sets of points are split into chunks\
+    which are transformed on this many cores - see\
+    :py:func:`.apply_in_parallel`.
+    :param executor: A ``concurrent.futures`` executor to do parallel work on.
+    :param str dtype: The precision to work in and return arrays and\
+    PointSets in - ``"float64"`` or ``"float32"``. By default, arrays are\
+    worked on as float64 and PointSets in their own precision. Other\
+    collections always give Python floats.
+    :param bool with_bounds: If ``True``, the volumes enclosing the rotated\
+    points are also found - see :py:func:`.find_bounds`.
+    :returns: The rotated coordinates, or if ``with_bounds`` is ``True``, the\
+    rotated coordinates and their :py:class:`.Bounds`."""
+
+    if checks.validating() and dtype is not None:
+        check_dtype(dtype)
+    if with_bounds:
+        return _with_bounds(rotate(
+         points, axis, angle, hand, pivot=pivot, out=out, workers=workers,
+         executor=executor, dtype=dtype
+        ))
+    if out is not None or pivot is not None or parallel.should_parallelise(
+     points, workers, executor
+    ):
+        transform = Transform.rotation(axis, angle, hand, pivot=pivot)
+        if instrument.ENABLED:
+            instrument.phase("matrix")
+        if out is not None:
+            return _write_transformed(points, transform, out)
+        return _apply_transform(
+         points, transform, workers=workers, executor=executor, dtype=dtype
+        )
+    if isinstance(points, PointSet):
+        return points.astype(dtype or points.dtype()).rotate(axis, angle, hand)
+    matrix = rotation_matrix(axis, angle, hand)
+    if instrument.ENABLED:
+        instrument.phase("matrix")
+    if is_array(points):
+        points = _cast(points, dtype)
+        return points @ numpy.array(matrix, dtype=points.dtype).T
+    return kernel.transform_points(points, matrix)
+
+
+@accept_objects
+def scale(points, x, y=None, z=None, pivot=None, out=None, workers=None,
+          executor=None, dtype=None, with_bounds=False):
+    """Takes a set of coordinates and scales them - either by the same factor
+    in every direction, or by a different factor along each axis. A negative
+    factor mirrors the points along that axis.
+
+    An example would be ``scale(points, 2)``, or
+    ``scale(points, 1, 1, 0.5, pivot=(0, 0, 10))``.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param number x: The factor to scale by along the x axis - or if y and z\
+    are not given, in every direction.
+    :param number y: The factor to scale by along the y axis.
+    :param number z: The factor to scale by along the z axis.
+    :param pivot: An (x, y, z) point which stays where it is. By default, the\
+    points are scaled about the origin.
+    :param out: A writable buffer of doubles to put the scaled coordinates\
+    in, instead of creating a new object - see :py:func:`.write_points`.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points - see :py:func:`.accept_objects`.
+    :param int workers: If given, large sets of points are split into chunks\
+    which are transformed on this many cores - see\
+    :py:func:`.apply_in_parallel`.
+    :param executor: A ``concurrent.futures`` executor to do parallel work on.
+    :param str dtype: The precision to work in and return arrays and\
+    PointSets in - see :py:func:`.translate`.
+    :param bool with_bounds: If ``True``, the volumes enclosing the scaled\
+    points are also found - see :py:func:`.find_bounds`.
+    :returns: The scaled coordinates."""
+
+    return _apply_built(
+     points, Transform.scaling(x, y, z, pivot=pivot), out, workers, executor,
+     dtype, with_bounds
+    )
+
+
+@accept_objects
+def reflect(points, normal, point=None, out=None, workers=None,
+            executor=None, dtype=None, with_bounds=False):
+    """Takes a set of coordinates and reflects them across a plane, as in a
+    mirror. The plane is given by the direction it faces (its normal) and a
+    point it passes through.
+
+    An example would be ``reflect(points, "x")``, which reflects the points
+    across the plane x=0, or ``reflect(points, (1, 1, 0), point=(2, 0, 0))``.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param normal: The direction the plane faces - either `"x"`, `"y"` or\
+    `"z"`, or an (x, y, z) vector in any direction.
+    :param point: An (x, y, z) point on the plane. By default, the plane\
+    passes through the origin.
+    :param out: A writable buffer of doubles to put the reflected coordinates\
+    in, instead of creating a new object - see :py:func:`.write_points`.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points - see :py:func:`.accept_objects`.
+    :param int workers: If given, large sets of points are split into chunks\
+    which are transformed on this many cores - see\
+    :py:func:`.apply_in_parallel`.
+    :param executor: A ``concurrent.futures`` executor to do parallel work on.
+    :param str dtype: The precision to work in and return arrays and\
+    PointSets in - see :py:func:`.translate`.
+    :param bool with_bounds: If ``True``, the volumes enclosing the reflected\
+    points are also found - see :py:func:`.find_bounds`.
+    :returns: The reflected coordinates."""
+
+    return _apply_built(
+     points, Transform.reflection(normal, point=point), out, workers,
+     executor, dtype, with_bounds
+    )
+
+
+@accept_objects
+def shear(points, xy=0, xz=0, yx=0, yz=0, zx=0, zy=0, pivot=None, out=None,
+          workers=None, executor=None, dtype=None, with_bounds=False):
+    """Takes a set of coordinates and shears them - each coordinate is moved
+    in proportion to the others. ``xy`` is how far x moves for each unit of
+    y, ``xz`` is how far x moves for each unit of z, and so on.
+
+    An example would be ``shear(points, xz=0.5)``, which slants the points
+    along x as z increases.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param number xy: The change in x for each unit of y.
+    :param number xz: The change in x for each unit of z.
+    :param number yx: The change in y for each unit of x.
+    :param number yz: The change in y for each unit of z.
+    :param number zx: The change in z for each unit of x.
+    :param number zy: The change in z for each unit of y.
+    :param pivot: An (x, y, z) point which stays where it is. By default, the\
+    points are sheared about the origin.
+    :param out: A writable buffer of doubles to put the sheared coordinates\
+    in, instead of creating a new object - see :py:func:`.write_points`.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points - see :py:func:`.accept_objects`.
+    :param int workers: If given, large sets of points are split into chunks\
+    which are transformed on this many cores - see\
+    :py:func:`.apply_in_parallel`.
+    :param executor: A ``concurrent.futures`` executor to do parallel work on.
+    :param str dtype: The precision to work in and return arrays and\
+    PointSets in - see :py:func:`.translate`.
+    :param bool with_bounds: If ``True``, the volumes enclosing the sheared\
+    points are also found - see :py:func:`.find_bounds`.
+    :returns: The sheared coordinates."""
+
+    return _apply_built(
+     points, Transform.shear(xy, xz, yx, yz, zx, zy, pivot=pivot), out,
+     workers, executor, dtype, with_bounds
+    )
+
+
+@accept_objects
+def apply_matrix(points, matrix, pivot=None, out=None, workers=None,
+                 executor=None, dtype=None, with_bounds=False):
+    """Takes a set of coordinates and multiplies them by a matrix of your own -
+    either a 3x3 matrix, or a 4x4 affine matrix whose last column is a
+    translation. See :py:meth:`.Transform.from_matrix`.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param matrix: The matrix's rows, or a NumPy array.
+    :param pivot: An (x, y, z) point which the matrix is applied around. By\
+    default, it is applied around the origin.
+    :param out: A writable buffer of doubles to put the transformed\
+    coordinates in, instead of creating a new object - see\
+    :py:func:`.write_points`.
+    :param bool write_back: If ``True``, the results are also written back to\
+    the original points - see :py:func:`.accept_objects`.
+    :param int workers: If given, large sets of points are split into chunks\
+    which are transformed on this many cores - see\
+    :py:func:`.apply_in_parallel`.
+    :param executor: A ``concurrent.futures`` executor to do parallel work on.
+    :param str dtype: The precision to work in and return arrays and\
+    PointSets in - see :py:func:`.translate`.
+    :param bool with_bounds: If ``True``, the volumes enclosing the\
+    transformed points are also found - see :py:func:`.find_bounds`.
+    :returns: The transformed coordinates."""
+
+    return _apply_built(
+     points, Transform.from_matrix(matrix, pivot=pivot), out, workers,
+     executor, dtype, with_bounds
+    )
+
+
+def _apply_built(points, transform, out, workers, executor, dtype,
+                 with_bounds):
+    """Applies a Transform which one of the transformation functions has just
+    built to its points."""
+
+    if instrument.ENABLED:
+        instrument.phase("matrix")
+    return transform.apply(
+     points, out=out, workers=workers, executor=executor, dtype=dtype,
+     with_bounds=with_bounds
+    )
+
+
+def rotation_matrix(axis, angle, hand="right"):
+    """Creates the 3x3 matrix which rotates coordinates around an axis through
+    the origin by a specified angle. This is the matrix that :py:func:`.rotate`
+    uses.
+
+    Matrices are cached by axis, angle and hand, so asking for the same
+    rotation again does not recalculate anything - see
+    :py:func:`.rotation_cache_info`. Angles which are multiples of 90° produce
+    exact matrices around the x, y and z axes, containing only 0, 1 and -1.
+
+    :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`, or\
+    an (x, y, z) vector in any direction.
+    :param number angle: The angle in degrees to rotate by.
+    :param str hand: specifies whether the rotation should be right-handed or\
+    left-handed. The deafult is 'right'.
+    :returns: The matrix's three rows, as a ``tuple`` of ``tuple``."""
+
+    if checks.validating():
+        if not is_numeric(angle):
+            raise TypeError("angle must be numeric, not '%s'" % str(angle))
+        if not isinstance(hand, str):
+            raise TypeError("hand must be str, not '%s'" % str(hand))
+        elif hand not in ("left", "right"):
+            raise ValueError("hand must be 'left' or 'right', not %s" % hand)
+        unit_axis(axis)
+    if instrument.ENABLED:
+        instrument.phase("validation")
+    if not isinstance(axis, str):
+        axis = tuple(axis)
+    return _build_rotation_matrix(axis, angle, hand)
+
+
+@lru_cache(maxsize=ROTATION_CACHE_SIZE)
+def _build_rotation_matrix(axis, angle, hand):
+    if hand == "left":
         angle = -angle
-    angle = radians(angle)
-    points = [create_vertex(*point) for point in points]
-    matrix = None
+    if angle % 90 == 0:
+        sine, cosine = ((0, 1), (1, 0), (0, -1), (-1, 0))[int(angle // 90) % 4]
+    else:
+        angle = radians(angle)
+        sine, cosine = sin(angle), cos(angle)
     if axis == "x":
-        matrix = Matrix(
+        return (
          (1, 0, 0),
-         (0, cos(angle), -sin(angle)),
-         (0, sin(angle),  cos(angle))
+         (0, cosine, -sine),
+         (0, sine, cosine)
         )
     elif axis == "y":
-        matrix = Matrix(
-         (cos(angle), 0, sin(angle)),
+        return (
+         (cosine, 0, sine),
          (0, 1, 0),
-         (-sin(angle), 0, cos(angle))
+         (-sine, 0, cosine)
         )
     elif axis == "z":
-        matrix = Matrix(
-         (cos(angle), -sin(angle), 0),
-         (sin(angle), cos(angle), 0),
+        return (
+         (cosine, -sine, 0),
+         (sine, cosine, 0),
          (0, 0, 1)
         )
+    x, y, z = unit_axis(axis)
+    versine = 1 - cosine
+    return (
+     (cosine + x * x * versine, x * y * versine - z * sine,
+      x * z * versine + y * sine),
+     (y * x * versine + z * sine, cosine + y * y * versine,
+      y * z * versine - x * sine),
+     (z * x * versine - y * sine, z * y * versine + x * sine,
+      cosine + z * z * versine)
+    )
+
+
+def unit_axis(axis):
+    """Converts a rotation axis to a unit vector. The axis can be `"x"`, `"y"`
+    or `"z"`, or an (x, y, z) vector of any length other than zero.
+
+    :param axis: The axis to convert.
+    :raises ValueError: if the axis is not valid.
+    :rtype: ``tuple``"""
+
+    if isinstance(axis, str):
+        try:
+            return {"x": (1, 0, 0), "y": (0, 1, 0), "z": (0, 0, 1)}[axis]
+        except KeyError:
+            raise ValueError(
+             "axis can only be 'x', 'y', 'z' or a vector, not %s" % axis
+            )
+    try:
+        x, y, z = axis
+    except (TypeError, ValueError):
+        raise ValueError(
+         "axis can only be 'x', 'y', 'z' or a vector, not %s" % str(axis)
+        )
+    if checks.validating() and not are_numeric(x, y, z):
+        raise TypeError("axis vector must be numeric, not '%s'" % str(axis))
+    length = sqrt(x * x + y * y + z * z)
+    if length == 0:
+        raise ValueError("axis vector cannot be (0, 0, 0)")
+    return (x / length, y / length, z / length)
+
+
+def rotation_cache_info():
+    """Returns statistics for the cache of rotation matrices that
+    :py:func:`.rotation_matrix` keeps - the number of hits and misses, the
+    maximum size, and the current size.
+
+    :rtype: ``namedtuple``"""
+
+    return _build_rotation_matrix.cache_info()
+
+
+def clear_rotation_cache():
+    """Empties the cache of rotation matrices, and resets its statistics."""
+
+    _build_rotation_matrix.cache_clear()
+
+
+
+class Transform:
+    """A Transform is an affine transformation of three dimensional space,
+    represented as a homogeneous 4x4 matrix. Transforms can be composed with
+    the ``@`` operator, so that a whole pipeline of translations and rotations
+    becomes one Transform which can then be applied to a set of coordinates in
+    a single pass:
+
+        >>> move = Transform.translation(5, 5, 5)
+        >>> spin = Transform.rotation("x", 90)
+        >>> (move @ spin).apply([(1, 1, 1), (3, 4, -8)])
+        ((6, 4, 6), (8, 13, 9))
+
+    As with matrix multiplication, ``t2 @ t1`` is the Transform which applies
+    ``t1`` first and then ``t2``.
+
+    If no rows are given, the identity Transform is created. Otherwise either
+    three or four rows of four numbers must be given - if three, the fourth is
+    taken to be ``(0, 0, 0, 1)``.
+
+    :param \\*rows: The rows of the matrix.
+    :raises ValueError: if the rows do not describe an affine 4x4 matrix."""
+
+    def __init__(self, *rows):
+        if not rows:
+            rows = (
+             (1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1)
+            )
+        if len(rows) == 3:
+            rows = tuple(rows) + ((0, 0, 0, 1),)
+        if checks.validating():
+            if len(rows) != 4 or any(len(row) != 4 for row in rows):
+                raise ValueError("Transforms need four rows of four values")
+            for row in rows:
+                if not are_numeric(*row):
+                    raise TypeError(
+                     "Transform values must be numeric, not '%s'" % str(row)
+                    )
+            if tuple(rows[3]) != (0, 0, 0, 1):
+                raise ValueError(
+                 "The last row of a Transform must be (0, 0, 0, 1), not %s" % (
+                  str(rows[3])
+                 )
+                )
+        self._rows = tuple([tuple(row) for row in rows])
+
+
+    def __repr__(self):
+        return "<Transform %s>" % str(self._rows)
+
+
+    def __eq__(self, other):
+        return isinstance(other, Transform) and self._rows == other._rows
+
+
+    def __matmul__(self, other):
+        if not isinstance(other, Transform):
+            return NotImplemented
+        return Transform(*kernel.multiply(self._rows, other._rows)[:3])
+
+
+    @staticmethod
+    def translation(x, y, z):
+        """Creates a Transform which translates coordinates, as
+        :py:func:`.translate` does.
+
+        :param number x: The distance to move in the x direction.
+        :param number y: The distance to move in the y direction.
+        :param number z: The distance to move in the z direction.
+        :rtype: ``Transform``"""
+
+        if checks.validating() and not are_numeric(x, y, z):
+            raise TypeError("Translation parameters must be numeric, not '%s'" % (
+             str((x, y, z))
+            ))
+        return Transform((1, 0, 0, x), (0, 1, 0, y), (0, 0, 1, z))
+
+
+    @staticmethod
+    def rotation(axis, angle, hand="right", pivot=None):
+        """Creates a Transform which rotates coordinates around an axis, as
+        :py:func:`.rotate` does.
+
+        :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`,\
+        or an (x, y, z) vector in any direction.
+        :param number angle: The angle in degrees to rotate by.
+        :param str hand: specifies whether the rotation should be right-handed\
+        or left-handed. The deafult is 'right'.
+        :param pivot: An (x, y, z) point which the axis passes through. By\
+        default, the axis passes through the origin.
+        :rtype: ``Transform``"""
+
+        return Transform.from_matrix(
+         rotation_matrix(axis, angle, hand), pivot=pivot
+        )
+
+
+    @staticmethod
+    def scaling(x, y=None, z=None, pivot=None):
+        """Creates a Transform which scales coordinates, as :py:func:`.scale`
+        does.
+
+        :param number x: The factor to scale by along the x axis - or if y and\
+        z are not given, in every direction.
+        :param number y: The factor to scale by along the y axis.
+        :param number z: The factor to scale by along the z axis.
+        :param pivot: An (x, y, z) point which stays where it is.
+        :raises TypeError: if only one of y and z is given.
+        :rtype: ``Transform``"""
+
+        if y is None and z is None:
+            y = z = x
+        if checks.validating():
+            if y is None or z is None:
+                raise TypeError("Give one scale factor, or one for each axis")
+            if not are_numeric(x, y, z):
+                raise TypeError("Scale factors must be numeric, not '%s'" % (
+                 str((x, y, z))
+                ))
+        return Transform.from_matrix(
+         ((x, 0, 0), (0, y, 0), (0, 0, z)), pivot=pivot
+        )
+
+
+    @staticmethod
+    def reflection(normal, point=None):
+        """Creates a Transform which reflects coordinates across a plane, as
+        :py:func:`.reflect` does.
+
+        :param normal: The direction the plane faces - either `"x"`, `"y"` or\
+        `"z"`, or an (x, y, z) vector in any direction.
+        :param point: An (x, y, z) point on the plane.
+        :rtype: ``Transform``"""
+
+        x, y, z = unit_axis(normal)
+        return Transform.from_matrix((
+         (1 - 2 * x * x, -2 * x * y, -2 * x * z),
+         (-2 * y * x, 1 - 2 * y * y, -2 * y * z),
+         (-2 * z * x, -2 * z * y, 1 - 2 * z * z)
+        ), pivot=point)
+
+
+    @staticmethod
+    def shear(xy=0, xz=0, yx=0, yz=0, zx=0, zy=0, pivot=None):
+        """Creates a Transform which shears coordinates, as :py:func:`.shear`
+        does.
+
+        :param number xy: The change in x for each unit of y.
+        :param number xz: The change in x for each unit of z.
+        :param number yx: The change in y for each unit of x.
+        :param number yz: The change in y for each unit of z.
+        :param number zx: The change in z for each unit of x.
+        :param number zy: The change in z for each unit of y.
+        :param pivot: An (x, y, z) point which stays where it is.
+        :rtype: ``Transform``"""
+
+        if checks.validating() and not are_numeric(xy, xz, yx, yz, zx, zy):
+            raise TypeError("Shear factors must be numeric, not '%s'" % (
+             str((xy, xz, yx, yz, zx, zy))
+            ))
+        return Transform.from_matrix(
+         ((1, xy, xz), (yx, 1, yz), (zx, zy, 1)), pivot=pivot
+        )
+
+
+    @staticmethod
+    def from_matrix(matrix, pivot=None):
+        """Creates a Transform from a 3x3 matrix, or from a 4x4 affine matrix
+        (whose last row is (0, 0, 0, 1)), which is applied around a pivot
+        point (the origin by default). NumPy arrays can be given too.
+
+        :param matrix: The matrix's rows.
+        :param pivot: The (x, y, z) point which the matrix is applied around.
+        :raises ValueError: if the matrix is not 3x3 or affine 4x4.
+        :rtype: ``Transform``"""
+
+        if is_array(matrix):
+            matrix = matrix.tolist()
+        if len(matrix) == 4 and all(len(row) == 4 for row in matrix):
+            transform = Transform(*matrix)
+        elif checks.validating() and (
+         len(matrix) != 3 or any(len(row) != 3 for row in matrix)
+        ):
+            raise ValueError("Matrix must be 3x3 or 4x4, not %s" % str(matrix))
+        else:
+            transform = Transform(*[tuple(row) + (0,) for row in matrix])
+        if pivot is None:
+            return transform
+        try:
+            px, py, pz = pivot
+        except (TypeError, ValueError):
+            raise ValueError("pivot must be an (x, y, z) point, not %s" % (
+             str(pivot)
+            ))
+        return (
+         Transform.translation(px, py, pz) @ transform @
+         Transform.translation(-px, -py, -pz)
+        )
+
+
+    @staticmethod
+    def from_quaternion(quaternion, pivot=None):
+        """Creates a Transform which performs the rotation a
+        :py:class:`.Quaternion` represents.
+
+        :param Quaternion quaternion: The rotation.
+        :param pivot: An (x, y, z) point to rotate around. By default, the\
+        rotation is around the origin.
+        :rtype: ``Transform``"""
+
+        if not isinstance(quaternion, Quaternion):
+            raise TypeError("'%s' is not a Quaternion" % str(quaternion))
+        return Transform.from_matrix(quaternion.matrix(), pivot=pivot)
+
+
+    @staticmethod
+    def from_euler(angles, order="xyz", hand="right", pivot=None):
+        """Creates a Transform from Euler angles - rotations around the x, y and
+        z axes, performed one after another around the fixed axes. The rotations
+        are combined into one matrix, so the points are still only gone over
+        once when it is applied.
+
+        An example would be ``Transform.from_euler((30, 0, 45), "xyz")``, which
+        rotates by 30° around x, then 45° around z.
+
+        :param angles: The angles in degrees to rotate by, one per axis.
+        :param str order: The axes to rotate around, in the order to perform\
+        the rotations in. Any combination of `"x"`, `"y"` and `"z"` can be\
+        given, and an axis can be repeated (as in `"zxz"`).
+        :param str hand: specifies whether the rotations should be right-handed\
+        or left-handed. The deafult is 'right'.
+        :param pivot: An (x, y, z) point to rotate around. By default, the\
+        rotation is around the origin.
+        :rtype: ``Transform``"""
+
+        if not isinstance(order, str):
+            raise TypeError("order must be str, not '%s'" % str(order))
+        angles = tuple(angles)
+        if len(angles) != len(order):
+            raise ValueError("%i angles given for %i axes" % (
+             len(angles), len(order)
+            ))
+        transform = Transform()
+        for axis, angle in zip(order, angles):
+            transform = Transform.rotation(axis, angle, hand) @ transform
+        return Transform.from_matrix(
+         [row[:3] for row in transform._rows[:3]], pivot=pivot
+        )
+
+
+    def rows(self):
+        """Returns the Transform's four rows.
+
+        :rtype: ``tuple``"""
+
+        return self._rows
+
+
+    def inverse(self):
+        """Returns the Transform which undoes this one.
+
+        :raises ValueError: if the Transform cannot be inverted.
+        :rtype: ``Transform``"""
+
+        try:
+            return Transform(*kernel.invert_affine(self._rows))
+        except ValueError:
+            raise ValueError("%s cannot be inverted" % str(self))
+
+
+    def apply(self, points, out=None, write_back=False, workers=None,
+              executor=None, dtype=None, with_bounds=False):
+        """Applies the Transform to a set of coordinates, in a single pass.
+
+        The points can be given in any of the forms that :py:func:`.translate`
+        and :py:func:`.rotate` accept.
+
+        :param points: A collection of (x, y, z) coordinates or appropriate\
+        objects.
+        :param out: A writable buffer of doubles to put the transformed\
+        coordinates in, instead of creating a new object - see\
+        :py:func:`.write_points`.
+        :param bool write_back: If ``True``, the results are also written back\
+        to the original points - see :py:func:`.accept_objects`.
+        :param int workers: If given, large sets of points are split into\
+        chunks which are transformed on this many cores - see\
+        :py:func:`.apply_in_parallel`.
+        :param executor: A ``concurrent.futures`` executor to do parallel work\
+        on.
+        :param str dtype: The precision to work in and return arrays and\
+        PointSets in - see :py:func:`.translate`.
+        :param bool with_bounds: If ``True``, the volumes enclosing the\
+        transformed points are also found - see :py:func:`.find_bounds`.
+        :returns: The transformed coordinates, or if ``with_bounds`` is\
+        ``True``, the transformed coordinates and their :py:class:`.Bounds`."""
+
+        if instrument.ENABLED and not instrument.active():
+            return instrument.call(
+             "Transform.apply", None, self.apply, points, out=out,
+             write_back=write_back, workers=workers, executor=executor,
+             dtype=dtype, with_bounds=with_bounds
+            )
+        if checks.validating() and dtype is not None:
+            check_dtype(dtype)
+        if with_bounds:
+            return _with_bounds(self.apply(
+             points, out=out, write_back=write_back, workers=workers,
+             executor=executor, dtype=dtype
+            ))
+        if instrument.ENABLED:
+            instrument.phase("validation")
+        if out is not None:
+            return write_points(
+             points, out, transform=self, write_back=write_back
+            )
+        return _apply_transform(
+         points, self, write_back=write_back, workers=workers,
+         executor=executor, dtype=dtype
+        )
+
+
+    def stream(self, points, chunk_size=None):
+        """Applies the Transform lazily. The points can be any iterable,
+        including a generator or a file reader, and each transformed point is
+        yielded as soon as it is ready, so that the whole set of coordinates
+        never needs to be in memory at once.
+
+        Items can be (x, y, z) coordinates or objects with x(), y() and z()
+        methods.
+
+        :param points: An iterable of (x, y, z) coordinates or appropriate\
+        objects.
+        :param int chunk_size: If given, transformed points are yielded in\
+        tuples of this many points (the last may be shorter) rather than one\
+        at a time.
+        :raises TypeError: if the chunk size is not an integer.
+        :raises ValueError: if the chunk size is not positive.
+        :returns: A generator of transformed coordinates."""
+
+        if chunk_size is not None:
+            if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+                raise TypeError("chunk_size must be int, not '%s'" % (
+                 str(chunk_size)
+                ))
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be positive, not %i" % (
+                 chunk_size
+                ))
+            return _stream_chunks(points, self._rows, chunk_size)
+        return _stream_rows(points, self._rows)
+
+
+
+@accept_objects
+def _apply_transform(points, transform, workers=None, executor=None,
+                     dtype=None):
+    if parallel.should_parallelise(points, workers, executor):
+        return parallel.apply_in_parallel(
+         _cast(points, dtype), transform.rows(), workers, executor
+        )
+    if isinstance(points, PointSet):
+        return points.astype(dtype or points.dtype()).apply(transform)
+    rows = transform.rows()
+    if is_array(points):
+        points = _cast(points, dtype)
+        matrix = numpy.array(rows, dtype=points.dtype)
+        return points @ matrix[:3, :3].T + matrix[:3, 3]
+    return kernel.transform_points(points, rows)
+
+
+@accept_objects
+def write_points(points, out, transform=None):
+    """Writes a set of coordinates into an existing buffer, optionally
+    transforming them on the way. No new objects are created for the
+    coordinates, which makes this useful for reusing one large buffer.
+
+    The buffer can be anything writable which supports the buffer protocol and
+    contains doubles (or raw bytes) - an ``array("d")``, a ``bytearray``, a
+    ``memoryview``, a NumPy float64 array etc. Coordinates are written as
+    x, y, z, x, y, z... and the buffer must be exactly the right size.
+
+    If the buffer is the same memory that the points are stored in (for
+    example, if the points are a :py:class:`.PointSet` made from the buffer
+    with :py:meth:`~.PointSet.from_buffer`) the coordinates are transformed in
+    place.
+
+    This is what the ``out`` parameter of :py:func:`.translate` and
+    :py:func:`.rotate` uses.
+
+    :param points: A collection of (x, y, z) coordinates or appropriate objects.
+    :param out: The buffer to write to.
+    :param Transform transform: A Transform to apply as the points are written.
+    :raises ValueError: if the buffer is the wrong size.
+    :returns: The buffer."""
+
+    return _write_transformed(points, transform, out)
+
+
+def _write_transformed(points, transform, out):
+    target = PointSet.from_buffer(out)
+    if len(target) != len(points):
+        raise ValueError("Buffer holds %i points, but %i were given" % (
+         len(target), len(points)
+        ))
+    data = target.buffer()
+    if data.readonly:
+        raise TypeError("Buffer is read-only")
+    if isinstance(points, PointSet) and points.buffer().format == data.format:
+        data[:] = points.buffer()
+    elif is_array(points):
+        target.as_array()[:] = points
     else:
-        raise ValueError("axis can only be 'x', 'y' or 'z', not %s" % axis)
-    new_points = [matrix * point for point in points]
-    return tuple([point.columns()[0] for point in new_points])
+        for index, (x, y, z) in enumerate(points):
+            index *= 3
+            data[index], data[index + 1], data[index + 2] = x, y, z
+    if transform is not None:
+        target.apply(transform)
+    return out
+
+
+def _with_bounds(result):
+    """Pairs the result of a transformation with the volumes enclosing it."""
+
+    from .bounds import find_bounds
+    return result, find_bounds(result)
+
+
+def _cast(points, dtype):
+    """Converts arrays and PointSets to the precision a transformation should
+    be done in - the dtype asked for, or else float64 for arrays and the
+    PointSet's own precision for PointSets. Other points are returned as they
+    are."""
+
+    if is_array(points):
+        return points.astype(dtype or "float64", copy=False)
+    if isinstance(points, PointSet) and dtype not in (None, points.dtype()):
+        return points.astype(dtype)
+    return points
+
+
+def iter_points(objects):
+    """Lazily converts an iterable of (x, y, z) coordinates, or of objects with
+    x(), y() and z() methods, into (x, y, z) tuples.
+
+    :param objects: The iterable to convert.
+    :returns: A generator of ``tuple``."""
+
+    for obj in objects:
+        try:
+            x, y, z = obj
+        except TypeError:
+            x, y, z = obj.x(), obj.y(), obj.z()
+        yield (x, y, z)
+
+
+def _stream_rows(points, rows):
+    return kernel.iter_transformed(iter_points(points), rows)
+
+
+def _stream_chunks(points, rows, chunk_size):
+    transformed = _stream_rows(points, rows)
+    while True:
+        chunk = tuple(islice(transformed, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def itranslate(points, x, y, z, chunk_size=None):
+    """The lazy version of :py:func:`.translate`. The points can be any
+    iterable, and the translated points are yielded one at a time (or in
+    chunks) as they are read, so memory use stays constant however many points
+    there are.
+
+    An example would be
+    ``for point in itranslate(reader, 5, 5, 5): writer.write(point)``.
+
+    :param points: An iterable of (x, y, z) coordinates or appropriate objects.
+    :param number x: The distance to move the points in the x direction.
+    :param number y: The distance to move the points in the y direction.
+    :param number z: The distance to move the points in the z direction.
+    :param int chunk_size: If given, points are yielded in tuples of this many.
+    :returns: A generator of translated coordinates."""
+
+    return Transform.translation(x, y, z).stream(points, chunk_size=chunk_size)
+
+
+def irotate(points, axis, angle, hand="right", pivot=None, chunk_size=None):
+    """The lazy version of :py:func:`.rotate`. The points can be any iterable,
+    and the rotated points are yielded one at a time (or in chunks) as they are
+    read, so memory use stays constant however many points there are.
+
+    :param points: An iterable of (x, y, z) coordinates or appropriate objects.
+    :param axis: The axis to rotate around - either `"x"`, `"y"` or `"z"`, or\
+    an (x, y, z) vector in any direction.
+    :param number angle: The angle in degrees to rotate by.
+    :param str hand: specifies whether the rotation should be right-handed or\
+    left-handed. The deafult is 'right'.
+    :param pivot: An (x, y, z) point which the axis passes through.
+    :param int chunk_size: If given, points are yielded in tuples of this many.
+    :returns: A generator of rotated coordinates."""
+
+    return Transform.rotation(axis, angle, hand, pivot=pivot).stream(
+     points, chunk_size=chunk_size
+    )
@@ -1,7 +1,19 @@
 """Contains functions for using trigonometry equations."""
 
 from math import radians, degrees, sin, asin, cos, acos, sqrt
-from matrices.checks import is_numeric
+from collections import namedtuple
+from functools import lru_cache
+from .checks import is_numeric, are_numeric
+from . import checks, instrument
+
+numpy = False  # Imported by _numpy() when first needed
+
+TRIANGLE_CACHE_SIZE = 1024
+
+Triangle = namedtuple("Triangle", ("a", "b", "c", "A", "B", "C", "area"))
+Triangle.__doc__ = """A fully solved triangle, as returned by
+:py:func:`.solve_triangle` - its three sides, the angles in degrees opposite
+them, and its area."""
 
 def sine_law(side1=None, angle1=None, side2=None, angle2=None, obtuse=False):
     """The sine law states concerns the fixed ratio between each angle and its
@@ -28,16 +40,34 @@ def sine_law(side1=None, angle1=None, side2=None, angle2=None, obtuse=False):
     :raises TypeError: if you supply all four arguments instead of just three.
     :rtype: ``float``"""
 
-    if side1 is not None and not is_numeric(side1):
-        raise TypeError("side1 must be a number, not '%s'" % str(side1))
-    if side2 is not None and not is_numeric(side2):
-        raise TypeError("side2 must be a number, not '%s'" % str(side2))
-    if angle1 is not None and not is_numeric(angle1):
-        raise TypeError("angle1 must be a number, not '%s'" % str(angle1))
-    if angle2 is not None and not is_numeric(angle2):
-        raise TypeError("angle2 must be a number, not '%s'" % str(angle2))
-    if [side1, angle1, side2, angle2].count(None) != 1:
-        raise TypeError("You must supply exactly three arguments to sine_law()")
+    if instrument.ENABLED and not instrument.active():
+        return instrument.call(
+         "sine_law", 1, sine_law, side1, angle1, side2, angle2, obtuse
+        )
+    if checks.validating():
+        if side1 is not None and not is_numeric(side1):
+            raise TypeError("side1 must be a number, not '%s'" % str(side1))
+        if side2 is not None and not is_numeric(side2):
+            raise TypeError("side2 must be a number, not '%s'" % str(side2))
+        if angle1 is not None and not is_numeric(angle1):
+            raise TypeError("angle1 must be a number, not '%s'" % str(angle1))
+        if angle2 is not None and not is_numeric(angle2):
+            raise TypeError("angle2 must be a number, not '%s'" % str(angle2))
+        if [side1, angle1, side2, angle2].count(None) != 1:
+            raise TypeError(
+             "You must supply exactly three arguments to sine_law()"
+            )
+    if instrument.ENABLED:
+        instrument.phase("validation")
+        result = _solve_sine_law(side1, angle1, side2, angle2, obtuse)
+        instrument.phase("apply")
+        return result
+    return _solve_sine_law(side1, angle1, side2, angle2, obtuse)
+
+
+def _solve_sine_law(side1, angle1, side2, angle2, obtuse):
+    """Does the actual calculation for :py:func:`.sine_law`, once the arguments
+    have been checked."""
 
     angle = None
     if side1 is None:
@@ -70,18 +100,34 @@ def cosine_law(side1, side2, side3=None, angle=None):
     :raises TypeError: if you supply all four arguments instead of just three.
     :rtype: ``float``"""
 
-    if not is_numeric(side1):
-        raise TypeError("side1 must be a number, not '%s'" % str(side1))
-    if not is_numeric(side2):
-        raise TypeError("side2 must be a number, not '%s'" % str(side2))
-    if side3 is not None and not is_numeric(side3):
-        raise TypeError("side3 must be a number, not '%s'" % str(side3))
-    if angle is not None and not is_numeric(angle):
-        raise TypeError("angle must be a number, not '%s'" % str(angle))
-    if side3 is not None and angle is not None:
-        raise TypeError("side3 and angle both supplied")
-    if side3 is None and angle is None:
-        raise TypeError("You must supply either an angle or a side3")
+    if instrument.ENABLED and not instrument.active():
+        return instrument.call(
+         "cosine_law", 1, cosine_law, side1, side2, side3, angle
+        )
+    if checks.validating():
+        if not is_numeric(side1):
+            raise TypeError("side1 must be a number, not '%s'" % str(side1))
+        if not is_numeric(side2):
+            raise TypeError("side2 must be a number, not '%s'" % str(side2))
+        if side3 is not None and not is_numeric(side3):
+            raise TypeError("side3 must be a number, not '%s'" % str(side3))
+        if angle is not None and not is_numeric(angle):
+            raise TypeError("angle must be a number, not '%s'" % str(angle))
+        if side3 is not None and angle is not None:
+            raise TypeError("side3 and angle both supplied")
+        if side3 is None and angle is None:
+            raise TypeError("You must supply either an angle or a side3")
+    if instrument.ENABLED:
+        instrument.phase("validation")
+        result = _solve_cosine_law(side1, side2, side3, angle)
+        instrument.phase("apply")
+        return result
+    return _solve_cosine_law(side1, side2, side3, angle)
+
+
+def _solve_cosine_law(side1, side2, side3, angle):
+    """Does the actual calculation for :py:func:`.cosine_law`, once the
+    arguments have been checked."""
 
     if side3 is None:
         return sqrt(
@@ -91,3 +137,359 @@ def cosine_law(side1, side2, side3=None, angle=None):
         return degrees(acos(
          ((side3 ** 2) - ((side1 ** 2) + (side2 ** 2))) / (-2 * side1 * side2)
         ))
+
+
+def solve_triangle(a=None, b=None, c=None, A=None, B=None, C=None,
+                   obtuse=False, all_solutions=False, cache=True):
+    """Works out every side and angle of a triangle, and its area, from any
+    three of them which pin it down - three sides, two sides and an angle, or
+    one side and two angles. Sides are ``a``, ``b`` and ``c``, and each angle
+    is named after the side opposite it.
+
+    Each angle's sine and cosine is only worked out once, however many of the
+    other values depend on it. When two sides and an angle which is not between
+    them are given, there can be two different triangles (the "ambiguous
+    case") - the one where the unknown angle is acute is returned unless
+    ``obtuse`` is ``True``, and ``all_solutions`` returns both. If only one
+    triangle fits the values, it is returned whatever ``obtuse`` is.
+
+    Results are cached by the values given, so solving the same triangle again
+    does not recalculate anything - see :py:func:`.triangle_cache_info`.
+
+    :param Number a: A side length.
+    :param Number b: A side length.
+    :param Number c: A side length.
+    :param Number A: The angle in degrees opposite side a.
+    :param Number B: The angle in degrees opposite side b.
+    :param Number C: The angle in degrees opposite side c.
+    :param bool obtuse: In the ambiguous case, return the triangle whose\
+    unknown angle is obtuse. If there is only one triangle, it is returned\
+    even if that angle is acute.
+    :param bool all_solutions: If ``True``, a ``tuple`` of every triangle which\
+    fits the values is returned - this is empty if there are none.
+    :param bool cache: If ``False``, the cache is not used.
+    :raises TypeError: if you do not supply exactly three values, including at\
+    least one side.
+    :raises ValueError: if no triangle fits the values.
+    :rtype: ``Triangle``"""
+
+    known = (a, b, c, A, B, C)
+    if checks.validating():
+        for name, value in zip("abcABC", known):
+            if value is not None:
+                if not is_numeric(value):
+                    raise TypeError("%s must be a number, not '%s'" % (
+                     name, str(value)
+                    ))
+                if value <= 0:
+                    raise ValueError("%s must be positive, not %s" % (
+                     name, str(value)
+                    ))
+                if name in "ABC" and value >= 180:
+                    raise ValueError("%s must be less than 180, not %s" % (
+                     name, str(value)
+                    ))
+        if known.count(None) != 3:
+            raise TypeError(
+             "You must supply exactly three arguments to solve_triangle()"
+            )
+        if known[:3].count(None) == 3:
+            raise TypeError("You must supply at least one side")
+    solutions = (
+     _solve_triangle if cache else _solve_triangle.__wrapped__
+    )(known)
+    if all_solutions:
+        return solutions
+    if not solutions:
+        raise ValueError("No triangle has the values %s" % ", ".join([
+         "%s=%s" % (name, value)
+         for name, value in zip("abcABC", known) if value is not None
+        ]))
+    return solutions[-1] if obtuse else solutions[0]
+
+
+@lru_cache(maxsize=TRIANGLE_CACHE_SIZE)
+def _solve_triangle(known):
+    """Does the actual calculation for :py:func:`.solve_triangle`, returning a
+    tuple of every triangle which fits the known values."""
+
+    sides, angles = list(known[:3]), list(known[3:])
+    if any([angle is not None and angle >= 180 for angle in angles]):
+        return ()
+    given = [index for index in range(3) if sides[index] is not None]
+    if len(given) == 3:
+        a, b, c = sides
+        if a >= b + c or b >= a + c or c >= a + b:
+            return ()
+        angles[0] = _angle_from_sides(a, b, c)
+        angles[1] = _angle_from_sides(b, c, a)
+        angles[2] = 180 - angles[0] - angles[1]
+        return (_triangle(sides, angles),)
+    if len(given) == 2:
+        angle = [index for index in range(3) if angles[index] is not None][0]
+        if sides[angle] is None:
+            side1, side2 = given
+            sides[angle] = sqrt(
+             sides[side1] ** 2 + sides[side2] ** 2 -
+             2 * sides[side1] * sides[side2] * cos(radians(angles[angle]))
+            )
+            angles[side1] = _angle_from_sides(
+             sides[side1], sides[side2], sides[angle]
+            )
+            angles[side2] = 180 - angles[angle] - angles[side1]
+            return (_triangle(sides, angles),)
+        other = given[1] if given[0] == angle else given[0]
+        missing = 3 - angle - other
+        sine = sin(radians(angles[angle]))
+        ratio = sides[angle] / sine
+        other_sine = sides[other] / ratio
+        if other_sine > 1:
+            return ()
+        acute = degrees(asin(other_sine))
+        solutions = []
+        for other_angle in (acute, 180 - acute) if acute != 90 else (acute,):
+            if angles[angle] + other_angle < 180:
+                angles[other] = other_angle
+                angles[missing] = 180 - angles[angle] - other_angle
+                sides[missing] = ratio * sin(radians(angles[missing]))
+                solutions.append(_triangle(sides, angles))
+        return tuple(solutions)
+    side = given[0]
+    missing = [index for index in range(3) if angles[index] is None][0]
+    angles[missing] = 180 - sum([
+     angle for angle in angles if angle is not None
+    ])
+    if angles[missing] <= 0:
+        return ()
+    ratio = sides[side] / sin(radians(angles[side]))
+    for index in range(3):
+        if index != side:
+            sides[index] = ratio * sin(radians(angles[index]))
+    return (_triangle(sides, angles),)
+
+
+def _angle_from_sides(side1, side2, side3):
+    """Uses the cosine law to get the angle opposite side1."""
+
+    cosine = (side2 ** 2 + side3 ** 2 - side1 ** 2) / (2 * side2 * side3)
+    return degrees(acos(max(-1, min(1, cosine))))
+
+
+def _triangle(sides, angles):
+    a, b, c = sides
+    return Triangle(
+     a, b, c, *angles, area=a * b * sin(radians(angles[2])) / 2
+    )
+
+
+def triangle_cache_info():
+    """Returns statistics for the cache of triangles that
+    :py:func:`.solve_triangle` keeps - the number of hits and misses, the
+    maximum size, and the current size.
+
+    :rtype: ``namedtuple``"""
+
+    return _solve_triangle.cache_info()
+
+
+def clear_triangle_cache():
+    """Empties the cache of solved triangles, and resets its statistics."""
+
+    _solve_triangle.cache_clear()
+
+
+def _numpy():
+    """Imports NumPy the first time one of the batched functions needs it,
+    rather than when this module is imported, as it takes far longer to import
+    than everything the single-triangle functions need. Returns ``None`` if
+    NumPy is not installed."""
+
+    global numpy
+    if numpy is False:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        numpy = module
+    return numpy
+
+
+def sine_laws(side1=None, angle1=None, side2=None, angle2=None, obtuse=False):
+    """The batched version of :py:func:`.sine_law`, which solves many triangles
+    in one call. Each argument can be a sequence or NumPy array of values (all
+    the same length) or a single number which applies to every triangle.
+
+    The arguments are checked once for the whole batch rather than once per
+    triangle. If NumPy is installed the calculation is vectorised and an array
+    is returned - otherwise a ``tuple`` is returned.
+
+    Triangles which cannot exist (where the sine of the missing angle would be
+    greater than 1) give ``nan`` rather than stopping the whole batch.
+
+    :param side1: Triangle side lengths.
+    :param angle1: Triangle angles in degrees.
+    :param side2: Triangle side lengths.
+    :param angle2: Triangle angles in degrees.
+    :param obtuse: Whether each missing angle is obtuse - either one ``bool``\
+    for the whole batch or a sequence of ``bool``, one per triangle.
+    :raises TypeError: if you do not supply exactly three arguments.
+    :raises ValueError: if the sequences are different lengths."""
+
+    numpy = _numpy()
+    if sum([value is None for value in (side1, angle1, side2, angle2)]) != 1:
+        raise TypeError("You must supply exactly three arguments to sine_laws()")
+    arguments = _batch_arguments(
+     side1=side1, angle1=angle1, side2=side2, angle2=angle2
+    )
+    obtuse = _batch_flags(obtuse, arguments["length"])
+    if numpy is not None:
+        side1, angle1, side2, angle2 = [arguments.get(name) for name in (
+         "side1", "angle1", "side2", "angle2"
+        )]
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            if side1 is None:
+                return (side2 * numpy.sin(numpy.radians(angle1))
+                 ) / numpy.sin(numpy.radians(angle2))
+            elif side2 is None:
+                return (side1 * numpy.sin(numpy.radians(angle2))
+                 ) / numpy.sin(numpy.radians(angle1))
+            elif angle1 is None:
+                angle = numpy.degrees(numpy.arcsin(
+                 (side1 * numpy.sin(numpy.radians(angle2))) / side2
+                ))
+            else:
+                angle = numpy.degrees(numpy.arcsin(
+                 (side2 * numpy.sin(numpy.radians(angle1))) / side1
+                ))
+        flip = (obtuse & (angle < 90)) | (~obtuse & (angle > 90))
+        return numpy.where(flip, 180 - angle, angle)
+    results = []
+    for values in zip(*[arguments.get(name, arguments["nones"]) for name in (
+     "side1", "angle1", "side2", "angle2"
+    )], obtuse):
+        results.append(_unless_impossible(_solve_sine_law, *values))
+    return tuple(results)
+
+
+def cosine_laws(side1, side2, side3=None, angle=None):
+    """The batched version of :py:func:`.cosine_law`, which solves many
+    triangles in one call. Each argument can be a sequence or NumPy array of
+    values (all the same length) or a single number which applies to every
+    triangle.
+
+    The arguments are checked once for the whole batch rather than once per
+    triangle. If NumPy is installed the calculation is vectorised and an array
+    is returned - otherwise a ``tuple`` is returned.
+
+    Triangles which cannot exist give ``nan`` rather than stopping the whole
+    batch.
+
+    :param side1: Triangle side lengths.
+    :param side2: Triangle side lengths.
+    :param side3: The triangle side lengths of interest.
+    :param angle: The angles of interest.
+    :raises TypeError: if you supply both or neither of side3 and angle.
+    :raises ValueError: if the sequences are different lengths."""
+
+    numpy = _numpy()
+    if side3 is not None and angle is not None:
+        raise TypeError("side3 and angle both supplied")
+    if side3 is None and angle is None:
+        raise TypeError("You must supply either an angle or a side3")
+    if side3 is None:
+        arguments = _batch_arguments(side1=side1, side2=side2, angle=angle)
+    else:
+        arguments = _batch_arguments(side1=side1, side2=side2, side3=side3)
+    side1, side2 = arguments["side1"], arguments["side2"]
+    if numpy is not None:
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            if side3 is None:
+                angle = numpy.radians(arguments["angle"])
+                return numpy.sqrt(
+                 ((side1 ** 2) + (side2 ** 2)) -
+                 (2 * side1 * side2 * numpy.cos(angle))
+                )
+            return numpy.degrees(numpy.arccos(
+             ((arguments["side3"] ** 2) - ((side1 ** 2) + (side2 ** 2))) /
+             (-2 * side1 * side2)
+            ))
+    if side3 is None:
+        return tuple([_unless_impossible(
+         _solve_cosine_law, a, b, None, c
+        ) for a, b, c in zip(side1, side2, arguments["angle"])])
+    return tuple([_unless_impossible(
+     _solve_cosine_law, a, b, c, None
+    ) for a, b, c in zip(side1, side2, arguments["side3"])])
+
+
+def _batch_arguments(**arguments):
+    """Checks the arguments given to a batched trig function, and converts them
+    to equal-length arrays (or lists if NumPy is not installed). The returned
+    ``dict`` also has the batch length under ``"length"``, and a list of
+    ``None`` of that length under ``"nones"``."""
+
+    numpy = _numpy()
+    arguments = {
+     name: value for name, value in arguments.items() if value is not None
+    }
+    length = None
+    for name, value in arguments.items():
+        if not is_numeric(value):
+            try:
+                value_length = len(value)
+            except TypeError:
+                raise TypeError(
+                 "%s must be numbers, not '%s'" % (name, str(value))
+                )
+            if length is not None and value_length != length:
+                raise ValueError(
+                 "%s has %i values, but other arguments have %i" % (
+                  name, value_length, length
+                 )
+                )
+            length = value_length
+    length = 1 if length is None else length
+    for name, value in list(arguments.items()):
+        if is_numeric(value):
+            value = [value] * length
+        if numpy is not None:
+            array = numpy.asarray(value)
+            if array.dtype.kind not in "iuf":
+                raise TypeError(
+                 "%s must be numbers, not '%s'" % (name, str(value))
+                )
+            arguments[name] = array.astype(float)
+        else:
+            value = list(value)
+            if not are_numeric(*value):
+                raise TypeError(
+                 "%s must be numbers, not '%s'" % (name, str(value))
+                )
+            arguments[name] = value
+    arguments["length"], arguments["nones"] = length, [None] * length
+    return arguments
+
+
+def _batch_flags(flags, length):
+    """Converts a ``bool`` or sequence of ``bool`` to a sequence of length
+    ``length``."""
+
+    numpy = _numpy()
+    if isinstance(flags, bool):
+        flags = [flags] * length
+    elif len(flags) != length:
+        raise ValueError("obtuse has %i values, but other arguments have %i" % (
+         len(flags), length
+        ))
+    if numpy is not None:
+        return numpy.asarray(flags, dtype=bool)
+    return [bool(flag) for flag in flags]
+
+
+def _unless_impossible(solver, *args):
+    """Calls a trig solver, returning ``nan`` if the triangle cannot exist."""
+
+    try:
+        return solver(*args)
+    except (ValueError, ZeroDivisionError):
+        return float("nan")
@@ -14,15 +14,10 @@ setup(
   "License :: OSI Approved :: MIT License",
   "Topic :: Scientific/Engineering :: Mathematics",
   "Programming Language :: Python :: 3",
-  "Programming Language :: Python :: 3.0",
-  "Programming Language :: Python :: 3.1",
-  "Programming Language :: Python :: 3.2",
-  "Programming Language :: Python :: 3.3",
-  "Programming Language :: Python :: 3.4",
-  "Programming Language :: Python :: 3.5",
-  "Programming Language :: Python :: 3.6",
+  "Programming Language :: Python :: 3.7",
  ],
  keywords="geometry trigonometry coordinates shapes",
  packages=["geometrica"],
- install_requires=["matrices"]
+ python_requires=">=3.7",
+ extras_require={"numpy": ["numpy"]}
 )
@@ -0,0 +1,12 @@
+from unittest import TestCase
+
+class PointsTest(TestCase):
+    """A test case which can compare sequences of points."""
+
+    def assertPointsAlmostEqual(self, points1, points2):
+        points1, points2 = list(points1), list(points2)
+        self.assertEqual(len(points1), len(points2))
+        for point1, point2 in zip(points1, points2):
+            self.assertEqual(len(point1), len(point2), 3)
+            for value1, value2 in zip(point1, point2):
+                self.assertAlmostEqual(value1, value2, delta=0.0005)
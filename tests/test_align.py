@@ -0,0 +1,154 @@
+from random import Random
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from geometrica.align import superpose, superpose_frames, rmsd
+from geometrica.pointset import PointSet
+from geometrica.transform import Transform
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class SuperpositionTest(TestCase):
+
+    def setUp(self):
+        random = Random(7)
+        self.reference = [tuple(
+         random.uniform(-10, 10) for _ in range(3)
+        ) for _ in range(30)]
+        self.transform = Transform.rotation(
+         (1, -2, 0.5), 131, pivot=(3, 1, -4)
+        ) @ Transform.translation(5, -6, 7)
+        self.points = list(self.transform.inverse().apply(self.reference))
+        self.noisy = [tuple(
+         value + random.uniform(-0.1, 0.1) for value in point
+        ) for point in self.points]
+
+
+    def assertTransformsAlmostEqual(self, transform1, transform2):
+        for row1, row2 in zip(transform1.rows(), transform2.rows()):
+            for value1, value2 in zip(row1, row2):
+                self.assertAlmostEqual(value1, value2, delta=1e-9)
+
+
+
+class SuperposeTests(SuperpositionTest):
+
+    def test_can_recover_exact_transform(self):
+        transform, deviation = superpose(self.points, self.reference)
+        self.assertTransformsAlmostEqual(transform, self.transform)
+        self.assertAlmostEqual(deviation, 0, delta=1e-6)
+
+
+    def test_rmsd_matches_superposed_points(self):
+        transform, deviation = superpose(self.noisy, self.reference)
+        self.assertGreater(deviation, 0)
+        self.assertAlmostEqual(
+         deviation, rmsd(transform.apply(self.noisy), self.reference),
+         delta=1e-9
+        )
+        self.assertLess(deviation, rmsd(self.noisy, self.reference))
+
+
+    def test_superposition_is_never_a_reflection(self):
+        mirrored = [(-x, y, z) for x, y, z in self.reference]
+        transform, deviation = superpose(mirrored, self.reference)
+        (a, b, c, _), (d, e, f, _), (g, h, i, _) = transform.rows()[:3]
+        determinant = a * (e * i - f * h) - b * (d * i - f * g) + c * (
+         d * h - e * g
+        )
+        self.assertAlmostEqual(determinant, 1, delta=1e-9)
+        self.assertGreater(deviation, 1)
+
+
+    def test_can_superpose_pointsets(self):
+        transform, deviation = superpose(
+         PointSet(self.points), PointSet(self.reference)
+        )
+        self.assertTransformsAlmostEqual(transform, self.transform)
+
+
+    def test_lengths_must_match(self):
+        with self.assertRaises(ValueError):
+            superpose(self.points[:-1], self.reference)
+        with self.assertRaises(ValueError):
+            superpose([], [])
+
+
+
+class SuperposeFramesTests(SuperpositionTest):
+
+    def test_can_superpose_many_frames(self):
+        frames = [self.points, self.noisy, self.reference]
+        transforms, deviations = superpose_frames(frames, self.reference)
+        self.assertEqual(len(transforms), 3)
+        self.assertEqual(len(deviations), 3)
+        for frame, transform, deviation in zip(frames, transforms, deviations):
+            single = superpose(frame, self.reference)
+            self.assertTransformsAlmostEqual(transform, single[0])
+            self.assertAlmostEqual(deviation, single[1], delta=1e-9)
+        self.assertTransformsAlmostEqual(transforms[2], Transform())
+
+
+    def test_frames_must_match_reference(self):
+        with self.assertRaises(ValueError):
+            superpose_frames([self.points, self.points[:-1]], self.reference)
+
+
+
+
+class ArraySuperpositionTests(SuperpositionTest):
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_superpose_array_of_frames(self):
+        frames = numpy.array([self.points, self.noisy])
+        transforms, deviations = superpose_frames(frames, self.reference)
+        self.assertIsInstance(deviations, numpy.ndarray)
+        self.assertTransformsAlmostEqual(transforms[0], self.transform)
+        with self.assertRaises(ValueError):
+            superpose_frames(frames[:, :-1], self.reference)
+
+
+
+class RmsdTests(SuperpositionTest):
+
+    def test_can_get_rmsd(self):
+        self.assertAlmostEqual(
+         rmsd([(0, 0, 0), (1, 1, 1)], [(0, 0, 1), (1, 1, 4)]),
+         5 ** 0.5, delta=1e-12
+        )
+
+
+    def test_lengths_must_match(self):
+        with self.assertRaises(ValueError):
+            rmsd([(0, 0, 0)], [(0, 0, 0), (1, 1, 1)])
+
+
+
+class PurePythonSuperposeTests(SuperposeTests):
+
+    def setUp(self):
+        SuperposeTests.setUp(self)
+        patcher = patch("geometrica.align.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class PurePythonSuperposeFramesTests(SuperposeFramesTests):
+
+    def setUp(self):
+        SuperposeFramesTests.setUp(self)
+        patcher = patch("geometrica.align.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class PurePythonRmsdTests(RmsdTests):
+
+    def setUp(self):
+        RmsdTests.setUp(self)
+        patcher = patch("geometrica.align.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
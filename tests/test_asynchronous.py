@@ -0,0 +1,211 @@
+import asyncio
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipIf
+from unittest.mock import patch
+from geometrica.asynchronous import atranslate, arotate, atransform
+from geometrica.pointset import PointSet
+from geometrica.transform import translate, rotate, Transform
+from .base import PointsTest
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class AsyncTest(PointsTest):
+
+    def setUp(self):
+        self.points = [(n, n * 2, n * 3) for n in range(25)]
+
+
+    def run_async(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+
+
+class AsyncTransformationTests(AsyncTest):
+
+    def test_can_translate(self):
+        result = self.run_async(atranslate(self.points, 1, 2, 3, chunk_size=10))
+        self.assertIsInstance(result, tuple)
+        self.assertEqual(result, translate(self.points, 1, 2, 3))
+
+
+    def test_can_rotate(self):
+        result = self.run_async(
+         arotate(self.points, (1, 1, 0), 30, pivot=(1, 0, 0), chunk_size=7)
+        )
+        self.assertPointsAlmostEqual(
+         result, rotate(self.points, (1, 1, 0), 30, pivot=(1, 0, 0))
+        )
+
+
+    def test_can_apply_transform(self):
+        transform = Transform.rotation("z", 90) @ Transform.translation(1, 0, 0)
+        result = self.run_async(atransform(self.points, transform, chunk_size=4))
+        self.assertPointsAlmostEqual(result, transform.apply(self.points))
+
+
+    def test_can_transform_pointsets(self):
+        points = PointSet(self.points)
+        result = self.run_async(atranslate(points, 1, 2, 3, chunk_size=10))
+        self.assertIsInstance(result, PointSet)
+        self.assertEqual(result, PointSet(translate(self.points, 1, 2, 3)))
+        self.assertEqual(points, PointSet(self.points))
+
+
+    def test_can_transform_buffers_and_write_back(self):
+        values = array("d", [1, 2, 3, 4, 5, 6])
+        self.run_async(atranslate(values, 1, 1, 1, write_back=True))
+        self.assertEqual(list(values), [2, 3, 4, 5, 6, 7])
+
+
+    def test_can_transform_objects(self):
+        class Atom:
+            def __init__(self, x, y, z):
+                self._coordinates = [x, y, z]
+            def coordinates(self, *values):
+                if values:
+                    self._coordinates = list(values)
+                return self._coordinates
+
+        atoms = [Atom(*point) for point in self.points]
+        self.run_async(atranslate(atoms, 1, 1, 1, chunk_size=3, write_back=True))
+        self.assertEqual(atoms[24].coordinates(), [25, 49, 73])
+
+
+    def test_cannot_write_back_to_tuples(self):
+        points = [[1, 2, 3], (4, 5, 6)]
+        with self.assertRaises(TypeError):
+            self.run_async(atranslate(points, 1, 1, 1, write_back=True))
+        self.assertEqual(points, [[1, 2, 3], (4, 5, 6)])
+
+
+    def test_can_transform_nothing(self):
+        self.assertEqual(self.run_async(atranslate([], 1, 1, 1)), ())
+
+
+    def test_can_use_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = self.run_async(atranslate(
+             self.points, 1, 2, 3, chunk_size=10, executor=executor
+            ))
+        self.assertEqual(result, translate(self.points, 1, 2, 3))
+
+
+    def test_progress_reported_after_each_chunk(self):
+        progress = []
+        self.run_async(atranslate(
+         self.points, 1, 2, 3, chunk_size=10,
+         progress=lambda done, total: progress.append((done, total))
+        ))
+        self.assertEqual(progress, [(10, 25), (20, 25), (25, 25)])
+
+
+    def test_event_loop_runs_between_chunks(self):
+        events = []
+
+        async def other_task():
+            for _ in range(3):
+                events.append("other")
+                await asyncio.sleep(0)
+
+        async def main():
+            await asyncio.gather(atranslate(
+             self.points, 1, 2, 3, chunk_size=10,
+             progress=lambda done, total: events.append(done)
+            ), other_task())
+
+        self.run_async(main())
+        self.assertEqual(events, ["other", 10, "other", 20, "other", 25])
+
+
+    def test_event_loop_runs_while_converting_objects(self):
+        calls = {"get": 0, "set": 0}
+        seen = []
+
+        class Atom:
+            def __init__(self, x, y, z):
+                self._coordinates = [x, y, z]
+            def coordinates(self, *values):
+                calls["set" if values else "get"] += 1
+                if values:
+                    self._coordinates = list(values)
+                return self._coordinates
+
+        async def other_task():
+            for _ in range(20):
+                seen.append((calls["get"], calls["set"]))
+                await asyncio.sleep(0)
+
+        async def main():
+            await asyncio.gather(atranslate(
+             [Atom(*point) for point in self.points], 1, 2, 3, chunk_size=10,
+             write_back=True
+            ), other_task())
+
+        self.run_async(main())
+        self.assertTrue(any([0 < read < 25 for read, written in seen]))
+        self.assertTrue(any([0 < written < 25 for read, written in seen]))
+        self.assertEqual(calls["set"], 25)
+
+
+    def test_can_cancel(self):
+        points = [list(point) for point in self.points]
+        progress = []
+
+        async def main():
+            task = asyncio.ensure_future(atranslate(
+             points, 1, 2, 3, chunk_size=5, write_back=True,
+             progress=lambda done, total: progress.append(done)
+            ))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.run_async(main())
+        self.assertLess(len(progress), 5)
+        self.assertEqual(points, [list(point) for point in self.points])
+
+
+    def test_chunk_size_must_be_positive_int(self):
+        with self.assertRaises(TypeError):
+            self.run_async(atranslate(self.points, 1, 2, 3, chunk_size=1.5))
+        with self.assertRaises(ValueError):
+            self.run_async(atranslate(self.points, 1, 2, 3, chunk_size=0))
+
+
+    def test_transform_must_be_transform(self):
+        with self.assertRaises(TypeError):
+            self.run_async(atransform(self.points, "transform"))
+
+
+
+class PurePythonAsyncTransformationTests(AsyncTransformationTests):
+
+    def setUp(self):
+        AsyncTransformationTests.setUp(self)
+        for module in ("asynchronous", "pointset", "transform"):
+            patcher = patch("geometrica.%s.numpy" % module, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+
+@skipIf(numpy is None, "NumPy not installed")
+class ArrayAsyncTransformationTests(AsyncTest):
+
+    def test_can_transform_arrays(self):
+        points = numpy.array(self.points, dtype=float)
+        result = self.run_async(
+         arotate(points, "x", 45, chunk_size=6, dtype="float32")
+        )
+        self.assertEqual(result.dtype, numpy.float32)
+        self.assertPointsAlmostEqual(result, rotate(points, "x", 45))
+        self.assertEqual(points.tolist(), [list(p) for p in self.points])
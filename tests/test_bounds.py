@@ -0,0 +1,195 @@
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from geometrica.bounds import find_bounds, inside_box, inside_sphere
+from geometrica.bounds import inside_planes, Bounds, Box, OrientedBox, Sphere
+from geometrica.pointset import PointSet
+from geometrica.transform import translate, rotate, Transform
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class BoundsTest(TestCase):
+
+    def setUp(self):
+        self.points = [
+         (x, y, z) for x in (0, 4) for y in (0, 2) for z in (0, 1)
+        ] + [(2, 1, 0.5)]
+
+
+    def assertValuesAlmostEqual(self, values1, values2, delta=1e-9):
+        self.assertEqual(len(values1), len(values2))
+        for value1, value2 in zip(values1, values2):
+            self.assertAlmostEqual(value1, value2, delta=delta)
+
+
+
+class BoundsFindingTests(BoundsTest):
+
+    def test_can_find_box(self):
+        bounds = find_bounds(self.points)
+        self.assertIsInstance(bounds, Bounds)
+        self.assertEqual(bounds.box, Box((0, 0, 0), (4, 2, 1)))
+
+
+    def test_can_find_sphere(self):
+        sphere = find_bounds(self.points).sphere
+        self.assertValuesAlmostEqual(sphere.centre, (2, 1, 0.5))
+        self.assertAlmostEqual(sphere.radius, 21 ** 0.5 / 2, delta=1e-9)
+
+
+    def test_can_find_oriented_box_of_aligned_points(self):
+        box = find_bounds(self.points).oriented_box
+        self.assertValuesAlmostEqual(box.centre, (2, 1, 0.5))
+        self.assertValuesAlmostEqual(sorted(box.extents), (0.5, 1, 2))
+        for axis in box.axes:
+            self.assertAlmostEqual(max(abs(value) for value in axis), 1)
+
+
+    def test_oriented_box_turns_with_points(self):
+        transform = Transform.rotation((1, 2, 3), 40)
+        box = find_bounds(transform.apply(self.points)).oriented_box
+        self.assertValuesAlmostEqual(
+         box.centre, transform.apply([(2, 1, 0.5)])[0]
+        )
+        self.assertValuesAlmostEqual(sorted(box.extents), (0.5, 1, 2))
+        long_axis = box.axes[box.extents.index(max(box.extents))]
+        direction = transform.apply([(1, 0, 0)])[0]
+        self.assertAlmostEqual(abs(sum(
+         a * b for a, b in zip(long_axis, direction)
+        )), 1, delta=1e-9)
+
+
+    def test_can_find_bounds_of_one_point(self):
+        bounds = find_bounds([(1, 2, 3)])
+        self.assertEqual(bounds.box, Box((1, 2, 3), (1, 2, 3)))
+        self.assertEqual(bounds.sphere.radius, 0)
+        self.assertValuesAlmostEqual(bounds.oriented_box.extents, (0, 0, 0))
+
+
+    def test_can_find_bounds_of_pointset(self):
+        bounds = find_bounds(PointSet(self.points))
+        self.assertEqual(bounds.box, Box((0, 0, 0), (4, 2, 1)))
+
+
+    def test_need_points(self):
+        with self.assertRaises(ValueError):
+            find_bounds([])
+
+
+
+class ContainmentTests(BoundsTest):
+
+    def test_can_check_box(self):
+        self.assertEqual(tuple(inside_box(
+         self.points, Box((0, 0, 0), (2, 2, 1))
+        )), (True,) * 4 + (False,) * 4 + (True,))
+
+
+    def test_points_inside_their_own_bounds(self):
+        points = rotate(self.points, (1, 2, 3), 40)
+        bounds = find_bounds(points)
+        for volume, check in (
+         (bounds.box, inside_box), (bounds.oriented_box, inside_box),
+         (bounds.sphere, inside_sphere)
+        ):
+            self.assertTrue(all(check(points, volume)))
+
+
+    def test_can_check_oriented_box(self):
+        root = 2 ** -0.5
+        box = OrientedBox(
+         (0, 0, 0), ((root, root, 0), (-root, root, 0), (0, 0, 1)), (2, 0.5, 1)
+        )
+        self.assertEqual(tuple(inside_box(
+         [(1, 1, 0), (1, -1, 0), (0.5, 0.5, 1.5), (-1.2, -1.2, -1)], box
+        )), (True, False, False, True))
+
+
+    def test_can_check_sphere(self):
+        self.assertEqual(tuple(inside_sphere(
+         self.points, Sphere((0, 0, 0), 2)
+        )), (True, True, True, False, False, False, False, False, False))
+
+
+    def test_can_check_planes(self):
+        planes = [((1, 0, 0), (1, 0, 0)), ((3, 0, 0), (-1, 0, 0))]
+        self.assertEqual(tuple(inside_planes(
+         [(0, 5, 5), (1, 0, 0), (2, 9, 9), (3, 0, 0), (3.5, 0, 0)], planes
+        )), (False, True, True, True, False))
+
+
+    def test_no_planes_contain_everything(self):
+        self.assertEqual(tuple(inside_planes(self.points, [])), (True,) * 9)
+
+
+
+class BoundsWithTransformationTests(BoundsTest):
+
+    def test_can_translate_with_bounds(self):
+        points, bounds = translate(self.points, 1, 1, 1, with_bounds=True)
+        self.assertEqual(points, translate(self.points, 1, 1, 1))
+        self.assertEqual(bounds.box, Box((1, 1, 1), (5, 3, 2)))
+
+
+    def test_can_rotate_with_bounds(self):
+        points, bounds = rotate(self.points, "z", 90, with_bounds=True)
+        self.assertEqual(bounds.box, Box((-2, 0, 0), (0, 4, 1)))
+
+
+    def test_can_apply_with_bounds(self):
+        transform = Transform.translation(0, 0, -1)
+        points, bounds = transform.apply(
+         PointSet(self.points), with_bounds=True
+        )
+        self.assertIsInstance(points, PointSet)
+        self.assertEqual(bounds.box, Box((0, 0, -1), (4, 2, 0)))
+
+
+    def test_write_back_with_bounds(self):
+        points = [list(point) for point in self.points]
+        result, bounds = translate(
+         points, 1, 0, 0, with_bounds=True, write_back=True
+        )
+        self.assertEqual(points[-1], [3, 1, 0.5])
+        self.assertEqual(bounds.box.maximum, (5, 2, 1))
+
+
+
+class PurePythonBoundsFindingTests(BoundsFindingTests):
+
+    def setUp(self):
+        BoundsFindingTests.setUp(self)
+        patcher = patch("geometrica.bounds.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class PurePythonContainmentTests(ContainmentTests):
+
+    def setUp(self):
+        ContainmentTests.setUp(self)
+        patcher = patch("geometrica.bounds.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+@skipIf(numpy is None, "NumPy not installed")
+class ArrayBoundsTests(BoundsTest):
+
+    def test_masks_are_arrays(self):
+        points = numpy.array(self.points)
+        mask = inside_sphere(points, find_bounds(points).sphere)
+        self.assertEqual(mask.dtype, bool)
+        self.assertEqual(len(points[mask]), 9)
+
+
+    def test_can_transform_arrays_with_bounds(self):
+        points, bounds = rotate(
+         numpy.array(self.points), "x", 90, with_bounds=True, dtype="float32"
+        )
+        self.assertEqual(points.dtype, numpy.float32)
+        self.assertValuesAlmostEqual(bounds.box.minimum, (0, -1, 0), 1e-6)
+        self.assertValuesAlmostEqual(bounds.box.maximum, (4, 0, 2), 1e-6)
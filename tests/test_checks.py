@@ -0,0 +1,144 @@
+import asyncio
+from array import array
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import patch
+from geometrica import checks
+from geometrica.checks import set_validation, trusted_inputs, validating
+from geometrica.checks import is_numeric, are_numeric
+from geometrica.trig import sine_law, cosine_law
+from geometrica.transform import translate, rotate, rotation_matrix
+from geometrica.transform import clear_rotation_cache, Transform
+from geometrica.transform import scale, reflect, shear, apply_matrix
+
+class NumericCheckTests(TestCase):
+
+    def test_ints_and_floats_are_numeric(self):
+        self.assertTrue(is_numeric(1))
+        self.assertTrue(is_numeric(-1.5))
+        self.assertTrue(are_numeric(1, 2.0, -3))
+
+
+    def test_other_objects_are_not_numeric(self):
+        for value in (True, False, "1", None, 1j, [1]):
+            self.assertFalse(is_numeric(value))
+        self.assertFalse(are_numeric(1, 2, True))
+
+
+
+class ValidationSwitchTests(TestCase):
+
+    def tearDown(self):
+        checks.VALIDATE = True
+
+
+    def test_validation_is_on_by_default(self):
+        self.assertIs(checks.VALIDATE, True)
+        self.assertIs(validating(), True)
+
+
+    def test_can_turn_validation_off_and_on(self):
+        set_validation(False)
+        self.assertIs(validating(), False)
+        set_validation(True)
+        self.assertIs(validating(), True)
+
+
+    def test_setting_must_be_bool(self):
+        with self.assertRaises(TypeError):
+            set_validation(0)
+
+
+    def test_context_manager_restores_setting(self):
+        with trusted_inputs():
+            self.assertIs(validating(), False)
+        self.assertIs(validating(), True)
+        set_validation(False)
+        with trusted_inputs():
+            pass
+        self.assertIs(validating(), False)
+
+
+    def test_context_manager_restores_setting_after_error(self):
+        with self.assertRaises(ZeroDivisionError):
+            with trusted_inputs():
+                1 / 0
+        self.assertIs(validating(), True)
+
+
+    def test_context_manager_does_not_affect_other_threads(self):
+        seen = []
+        with trusted_inputs():
+            thread = Thread(target=lambda: seen.append(validating()))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [True])
+
+
+    def test_context_manager_does_not_affect_other_tasks(self):
+        seen = []
+
+        async def trusting():
+            with trusted_inputs():
+                await asyncio.sleep(0)
+                seen.append(validating())
+
+        async def checking():
+            seen.append(validating())
+
+        async def main():
+            await asyncio.gather(trusting(), checking())
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+        self.assertEqual(seen, [True, False])
+
+
+
+class TrustedInputTests(TestCase):
+
+    @patch("geometrica.trig.is_numeric")
+    def test_trig_functions_skip_checks(self, mock_check):
+        with trusted_inputs():
+            self.assertAlmostEqual(
+             sine_law(side1=2, angle1=30, angle2=105), 3.86, delta=0.005
+            )
+            self.assertAlmostEqual(
+             cosine_law(side1=12, side2=9, angle=87), 14.6, delta=0.05
+            )
+        self.assertFalse(mock_check.called)
+        sine_law(side1=2, angle1=30, angle2=105)
+        self.assertTrue(mock_check.called)
+
+
+    @patch("geometrica.transform.are_numeric")
+    @patch("geometrica.transform.is_numeric")
+    def test_transform_functions_skip_checks(self, mock_check, mock_checks):
+        clear_rotation_cache()
+        with trusted_inputs():
+            self.assertEqual(translate([(1, 1, 1)], 1, 2, 3), ((2, 3, 4),))
+            self.assertEqual(rotation_matrix("x", 90)[1], (0, 0, -1))
+            rotate([(1, 1, 1)], "y", 90)
+        self.assertFalse(mock_check.called)
+        self.assertFalse(mock_checks.called)
+
+
+    @patch("geometrica.transform.are_numeric")
+    def test_built_transforms_skip_checks(self, mock_checks):
+        points = [(1, 1, 1)]
+        with trusted_inputs():
+            self.assertEqual(scale(points, 2), ((2, 2, 2),))
+            self.assertEqual(reflect(points, (0, 0, 2)), ((1, 1, -1),))
+            self.assertEqual(shear(points, xy=1), ((2, 1, 1),))
+            self.assertEqual(apply_matrix(
+             points, ((0, -1, 0), (1, 0, 0), (0, 0, 1))
+            ), ((-1, 1, 1),))
+            self.assertEqual(translate(
+             points, 1, 2, 3, out=array("d", [0] * 3)
+            ), array("d", [2, 3, 4]))
+            rotate(points, "y", 90, pivot=(1, 0, 0))
+            Transform.translation(1, 2, 3) @ Transform.rotation("x", 30)
+        self.assertFalse(mock_checks.called)
@@ -0,0 +1,153 @@
+import os
+import struct
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from geometrica.files import load_points, save_points, transform_file
+from geometrica.pointset import PointSet
+from geometrica.transform import Transform, translate, itranslate, rotate
+from .base import PointsTest
+
+class FileTest(PointsTest):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "points.xyz")
+        self.points = [(1, 2, 3), (4, 5, 6), (7, 8, 9)]
+
+
+
+class SavingTests(FileTest):
+
+    def test_can_save_raw_file(self):
+        self.assertEqual(save_points(self.path, self.points, header=False), 3)
+        with open(self.path, "rb") as f:
+            self.assertEqual(
+             f.read(), struct.pack("<9d", *[v for p in self.points for v in p])
+            )
+
+
+    def test_can_save_headed_file(self):
+        save_points(self.path, self.points)
+        with open(self.path, "rb") as f:
+            self.assertEqual(
+             f.read(16), b"GXYZ\x01d\x00\x00" + struct.pack("<Q", 3)
+            )
+            self.assertEqual(len(f.read()), 72)
+
+
+    def test_can_save_float32(self):
+        save_points(self.path, self.points, dtype="float32", header=False)
+        self.assertEqual(os.path.getsize(self.path), 36)
+
+
+    def test_can_save_in_chunks_from_generator(self):
+        points = itranslate((point for point in self.points), 1, 1, 1)
+        self.assertEqual(save_points(self.path, points, chunk_size=2), 3)
+        self.assertEqual(
+         load_points(self.path).points(), ((2, 3, 4), (5, 6, 7), (8, 9, 10))
+        )
+
+
+    def test_dtype_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            save_points(self.path, self.points, dtype="int32")
+
+
+
+class LoadingTests(FileTest):
+
+    def test_can_load_headed_file(self):
+        save_points(self.path, PointSet(self.points))
+        points = load_points(self.path)
+        self.assertIsInstance(points, PointSet)
+        self.assertEqual(points.points(), tuple(self.points))
+
+
+    def test_can_load_raw_file(self):
+        save_points(self.path, self.points, header=False)
+        self.assertEqual(load_points(self.path).points(), tuple(self.points))
+
+
+    def test_loaded_points_are_read_only_by_default(self):
+        save_points(self.path, self.points)
+        points = load_points(self.path)
+        with self.assertRaises(TypeError):
+            points.translate(1, 1, 1)
+        self.assertEqual(translate(points, 1, 1, 1)[0], (2, 3, 4))
+
+
+    def test_can_write_to_mapped_file(self):
+        save_points(self.path, self.points)
+        points = load_points(self.path, writable=True)
+        points.translate(1, 1, 1)
+        del points
+        self.assertEqual(load_points(self.path)[0], (2, 3, 4))
+
+
+    def test_can_load_empty_file(self):
+        open(self.path, "wb").close()
+        self.assertEqual(len(load_points(self.path)), 0)
+        self.assertEqual(load_points(self.path, dtype="float32").dtype(), (
+         "float32"
+        ))
+
+
+    def test_file_must_be_whole_points(self):
+        with open(self.path, "wb") as f:
+            f.write(struct.pack("<4d", 1, 2, 3, 4))
+        with self.assertRaises(ValueError):
+            load_points(self.path)
+
+
+    def test_header_count_must_match(self):
+        with open(self.path, "wb") as f:
+            f.write(b"GXYZ\x01d\x00\x00" + struct.pack("<Q", 2))
+            f.write(struct.pack("<3d", 1, 2, 3))
+        with self.assertRaises(ValueError):
+            load_points(self.path)
+
+
+    def test_float32_files_load_as_pointsets(self):
+        save_points(self.path, self.points, dtype="float32")
+        points = load_points(self.path)
+        self.assertIsInstance(points, PointSet)
+        self.assertEqual(points.dtype(), "float32")
+        self.assertEqual(points.points(), tuple(self.points))
+
+
+    def test_float32_files_load_as_pointsets_without_numpy(self):
+        save_points(self.path, self.points, dtype="float32", header=False)
+        with patch("geometrica.files.numpy", None):
+            points = load_points(self.path, dtype="float32")
+        self.assertIsInstance(points, PointSet)
+        self.assertEqual(points.points(), tuple(self.points))
+
+
+class FileTransformationTests(FileTest):
+
+    def test_can_transform_file(self):
+        save_points(self.path, self.points)
+        output = os.path.join(self.directory.name, "output.xyz")
+        transform = Transform.rotation("x", 37)
+        self.assertEqual(
+         transform_file(self.path, output, transform, chunk_size=2), 3
+        )
+        self.assertPointsAlmostEqual(
+         load_points(output), rotate(self.points, "x", 37)
+        )
+
+
+    def test_can_transform_float32_file(self):
+        save_points(self.path, self.points, dtype="float32", header=False)
+        output = os.path.join(self.directory.name, "output.xyz")
+        transform_file(
+         self.path, output, Transform.translation(1, 1, 1), dtype="float32"
+        )
+        self.assertEqual(os.path.getsize(output), 16 + 36)
+
+
+    def test_transform_must_be_transform(self):
+        save_points(self.path, self.points)
+        with self.assertRaises(TypeError):
+            transform_file(self.path, self.path + "2", "rotate")
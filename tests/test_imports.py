@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 from unittest import TestCase
 import geometrica
 
@@ -13,6 +16,16 @@ class TrigFunctionsImportTests(TestCase):
         self.assertIs(cosine_law, geometrica.cosine_law)
 
 
+    def test_sine_laws_imported(self):
+        from geometrica.trig import sine_laws
+        self.assertIs(sine_laws, geometrica.sine_laws)
+
+
+    def test_cosine_laws_imported(self):
+        from geometrica.trig import cosine_laws
+        self.assertIs(cosine_laws, geometrica.cosine_laws)
+
+
 
 class TransformationImportTests(TestCase):
 
@@ -24,3 +37,68 @@ class TransformationImportTests(TestCase):
     def test_rotate_imported(self):
         from geometrica.transform import rotate
         self.assertIs(rotate, geometrica.rotate)
+
+
+    def test_transform_imported(self):
+        from geometrica.transform import Transform
+        self.assertIs(Transform, geometrica.Transform)
+
+
+    def test_itranslate_imported(self):
+        from geometrica.transform import itranslate
+        self.assertIs(itranslate, geometrica.itranslate)
+
+
+    def test_irotate_imported(self):
+        from geometrica.transform import irotate
+        self.assertIs(irotate, geometrica.irotate)
+
+
+
+class QuaternionImportTests(TestCase):
+
+    def test_quaternion_imported(self):
+        from geometrica.quaternion import Quaternion
+        self.assertIs(Quaternion, geometrica.Quaternion)
+
+
+    def test_slerp_imported(self):
+        from geometrica.quaternion import slerp
+        self.assertIs(slerp, geometrica.slerp)
+
+
+
+class LazyImportTests(TestCase):
+
+    def test_sine_law_does_not_import_transformations(self):
+        output = subprocess.run([sys.executable, "-c", (
+         "import sys, geometrica; geometrica.sine_law; print(sorted(m for m in "
+         "sys.modules if m.startswith(('geometrica', 'matrices'))))"
+        )], stdout=subprocess.PIPE, universal_newlines=True, check=True,
+         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout
+        self.assertEqual(output.strip(), str([
+         "geometrica", "geometrica.checks", "geometrica.instrument",
+         "geometrica.trig"
+        ]))
+
+
+    def test_sine_law_does_not_import_numpy(self):
+        output = subprocess.run([sys.executable, "-c", (
+         "import sys, geometrica; geometrica.sine_law(5, 30, None, 90); "
+         "print('numpy' in sys.modules)"
+        )], stdout=subprocess.PIPE, universal_newlines=True, check=True,
+         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout
+        self.assertEqual(output.strip(), "False")
+
+
+    def test_unknown_names_raise_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            geometrica.sine_lawz
+
+
+    def test_lazy_names_are_listed(self):
+        for name in geometrica.__all__:
+            self.assertIn(name, dir(geometrica))
+            self.assertTrue(hasattr(geometrica, name))
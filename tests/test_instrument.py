@@ -0,0 +1,186 @@
+from unittest import TestCase, skipIf
+from geometrica import instrument
+from geometrica.instrument import set_instrumentation, stats, reset_stats
+from geometrica.instrument import cache_stats, add_callback, remove_callback
+from geometrica.trig import sine_law, cosine_law, solve_triangle
+from geometrica.trig import clear_triangle_cache
+from geometrica.transform import translate, rotate, Transform
+from geometrica.transform import clear_rotation_cache
+from geometrica.pointset import PointSet
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class InstrumentationTest(TestCase):
+
+    def setUp(self):
+        reset_stats()
+        set_instrumentation(True)
+
+
+    def tearDown(self):
+        set_instrumentation(False)
+        reset_stats()
+
+
+
+class InstrumentationSwitchTests(TestCase):
+
+    def tearDown(self):
+        set_instrumentation(False)
+        reset_stats()
+
+
+    def test_instrumentation_is_off_by_default(self):
+        self.assertIs(instrument.ENABLED, False)
+
+
+    def test_can_turn_instrumentation_on_and_off(self):
+        set_instrumentation(True)
+        self.assertIs(instrument.ENABLED, True)
+        set_instrumentation(False)
+        self.assertIs(instrument.ENABLED, False)
+
+
+    def test_switch_must_be_bool(self):
+        with self.assertRaises(TypeError):
+            set_instrumentation(1)
+
+
+    def test_nothing_recorded_when_off(self):
+        translate([(1, 2, 3)], 1, 1, 1)
+        sine_law(side1=5, angle1=30, angle2=60)
+        self.assertEqual(stats(), {})
+
+
+
+class CallRecordingTests(InstrumentationTest):
+
+    def test_calls_and_sizes_recorded(self):
+        translate([(1, 2, 3), (4, 5, 6)], 1, 1, 1)
+        translate([(1, 2, 3)], 1, 1, 1)
+        record = stats()["translate"]
+        self.assertEqual(record["calls"], 2)
+        self.assertEqual(record["size"], 3)
+
+
+    def test_translation_phases(self):
+        translate([(1, 2, 3)], 1, 1, 1)
+        record = stats()["translate"]
+        self.assertEqual(
+         set(record["phases"]), {"ingestion", "validation", "apply", "output"}
+        )
+        self.assertAlmostEqual(
+         sum(record["phases"].values()), record["time"], delta=1e-4
+        )
+
+
+    def test_rotation_phases(self):
+        rotate([(1, 2, 3)], "x", 30)
+        record = stats()["rotate"]
+        self.assertEqual(set(record["phases"]), {
+         "ingestion", "validation", "matrix", "apply", "output"
+        })
+
+
+    def test_inner_calls_count_towards_outer_call(self):
+        rotate([(1, 2, 3)], "x", 30, pivot=(1, 1, 1))
+        self.assertEqual(set(stats()), {"rotate"})
+        self.assertEqual(stats()["rotate"]["size"], 1)
+
+
+    def test_transform_apply_recorded(self):
+        Transform.translation(1, 2, 3).apply(PointSet([(1, 2, 3)] * 4))
+        self.assertEqual(set(stats()), {"Transform.apply"})
+        self.assertEqual(stats()["Transform.apply"]["size"], 4)
+
+
+    def test_write_back_counted_as_output(self):
+        points = [[1, 2, 3]]
+        translate(points, 1, 1, 1, write_back=True)
+        self.assertEqual(points, [[2, 3, 4]])
+        self.assertIn("output", stats()["translate"]["phases"])
+
+
+    def test_trig_functions_recorded(self):
+        self.assertAlmostEqual(
+         sine_law(side1=5, angle1=30, angle2=60), 8.660254037844, delta=0.0001
+        )
+        cosine_law(5, 6, angle=30)
+        cosine_law(5, 6, angle=60)
+        self.assertEqual(stats()["sine_law"]["calls"], 1)
+        self.assertEqual(stats()["cosine_law"]["calls"], 2)
+        self.assertEqual(stats()["cosine_law"]["size"], 2)
+        self.assertEqual(set(stats()["sine_law"]["phases"]), {
+         "validation", "apply", "output"
+        })
+
+
+    def test_failed_calls_not_recorded(self):
+        with self.assertRaises(TypeError):
+            translate([(1, 2, 3)], "1", 1, 1)
+        self.assertEqual(stats(), {})
+        self.assertFalse(instrument.active())
+
+
+    def test_can_reset_stats(self):
+        translate([(1, 2, 3)], 1, 1, 1)
+        reset_stats()
+        self.assertEqual(stats(), {})
+
+
+    def test_stats_are_copies(self):
+        translate([(1, 2, 3)], 1, 1, 1)
+        stats()["translate"]["phases"].clear()
+        self.assertTrue(stats()["translate"]["phases"])
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_array_sizes_recorded(self):
+        rotate(numpy.zeros((100, 3)), "z", 45)
+        self.assertEqual(stats()["rotate"]["size"], 100)
+
+
+
+class CallbackTests(InstrumentationTest):
+
+    def test_callbacks_get_each_call(self):
+        calls = []
+        callback = lambda name, record: calls.append((name, record))
+        add_callback(callback)
+        try:
+            translate([(1, 2, 3)], 1, 1, 1)
+            sine_law(side1=5, angle1=30, angle2=60)
+        finally:
+            remove_callback(callback)
+        self.assertEqual([call[0] for call in calls], ["translate", "sine_law"])
+        self.assertEqual(calls[0][1]["size"], 1)
+        self.assertEqual(set(calls[0][1]), {"size", "time", "phases"})
+        translate([(1, 2, 3)], 1, 1, 1)
+        self.assertEqual(len(calls), 2)
+
+
+    def test_callback_must_be_callable(self):
+        with self.assertRaises(TypeError):
+            add_callback("callback")
+
+
+
+class CacheStatsTests(TestCase):
+
+    def setUp(self):
+        clear_rotation_cache()
+        clear_triangle_cache()
+
+
+    def test_cache_hit_rates(self):
+        self.assertIsNone(cache_stats()["rotation"]["hit_rate"])
+        for _ in range(4):
+            rotate([(1, 2, 3)], "x", 30)
+        solve_triangle(a=3, b=4, c=5)
+        caches = cache_stats()
+        self.assertEqual(caches["rotation"], {
+         "hits": 3, "misses": 1, "size": 1, "hit_rate": 0.75
+        })
+        self.assertEqual(caches["triangle"]["hit_rate"], 0)
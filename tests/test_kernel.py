@@ -0,0 +1,96 @@
+from unittest import TestCase
+from array import array
+from geometrica import kernel
+
+class MultiplicationTests(TestCase):
+
+    def test_can_multiply_3x3_matrices(self):
+        self.assertEqual(kernel.multiply(
+         ((1, 2, 3), (4, 5, 6), (7, 8, 9)), ((0, 1, 0), (1, 0, 0), (0, 0, 2))
+        ), ((2, 1, 6), (5, 4, 12), (8, 7, 18)))
+
+
+    def test_can_multiply_4x4_matrices(self):
+        move = ((1, 0, 0, 1), (0, 1, 0, 2), (0, 0, 1, 3), (0, 0, 0, 1))
+        self.assertEqual(kernel.multiply(move, move), (
+         (1, 0, 0, 2), (0, 1, 0, 4), (0, 0, 1, 6), (0, 0, 0, 1)
+        ))
+
+
+
+class PointTransformationTests(TestCase):
+
+    def setUp(self):
+        self.points = [(1, 2, 3), (-4, 0.5, 6)]
+
+
+    def test_can_apply_3x3_matrix(self):
+        self.assertEqual(kernel.transform_points(
+         self.points, ((0, -1, 0), (1, 0, 0), (0, 0, 1))
+        ), ((-2, 1, 3), (-0.5, -4, 6)))
+
+
+    def test_can_apply_4x4_matrix(self):
+        self.assertEqual(kernel.transform_points(
+         self.points, ((1, 0, 0, 1), (0, 1, 0, 2), (0, 0, 1, 3), (0, 0, 0, 1))
+        ), ((2, 4, 6), (-3, 2.5, 9)))
+
+
+    def test_can_transform_lazily(self):
+        points = iter(self.points)
+        transformed = kernel.iter_transformed(
+         points, ((2, 0, 0), (0, 2, 0), (0, 0, 2))
+        )
+        self.assertEqual(next(transformed), (2, 4, 6))
+        self.assertEqual(next(points), (-4, 0.5, 6))
+
+
+    def test_can_transform_flat_values_in_place(self):
+        values = array("d", [1, 2, 3, -4, 0.5, 6])
+        kernel.transform_values(values, ((0, -1, 0), (1, 0, 0), (0, 0, 1)))
+        self.assertEqual(list(values), [-2, 1, 3, -0.5, -4, 6])
+        kernel.transform_values(
+         values, ((1, 0, 0, 1), (0, 1, 0, 1), (0, 0, 1, 1), (0, 0, 0, 1))
+        )
+        self.assertEqual(list(values), [-1, 2, 4, 0.5, -3, 7])
+
+
+
+class InversionTests(TestCase):
+
+    def test_can_invert_affine_matrix(self):
+        matrix = ((0, -2, 0, 1), (2, 0, 0, 2), (0, 0, 2, 3), (0, 0, 0, 1))
+        inverse = kernel.invert_affine(matrix)
+        self.assertEqual(inverse, (
+         (0, 0.5, 0, -1), (-0.5, 0, 0, 0.5), (0, 0, 0.5, -1.5)
+        ))
+
+
+    def test_singular_matrix_cannot_be_inverted(self):
+        with self.assertRaises(ValueError):
+            kernel.invert_affine(
+             ((1, 0, 0, 0), (1, 0, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))
+            )
+
+
+
+class EigenTests(TestCase):
+
+    def test_can_get_eigenvalues_and_vectors(self):
+        matrix = ((2, 1, 0, 0), (1, 2, 0, 0), (0, 0, 5, 0), (0, 0, 0, -1))
+        values, vectors = kernel.symmetric_eigen(matrix)
+        for value, expected in zip(values, (-1, 1, 3, 5)):
+            self.assertAlmostEqual(value, expected, delta=1e-12)
+        for value, vector in zip(values, vectors):
+            product = [sum([a * b for a, b in zip(row, vector)]) for row in matrix]
+            for value1, value2 in zip(product, vector):
+                self.assertAlmostEqual(value1, value * value2, delta=1e-12)
+            self.assertAlmostEqual(
+             sum([value ** 2 for value in vector]), 1, delta=1e-12
+            )
+
+
+    def test_diagonal_matrix_is_unchanged(self):
+        values, vectors = kernel.symmetric_eigen(((3, 0), (0, 1)))
+        self.assertEqual(values, (1, 3))
+        self.assertEqual(vectors, ((0, 1), (1, 0)))
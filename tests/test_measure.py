@@ -0,0 +1,189 @@
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from geometrica.measure import distances, angles, dihedrals, distance_matrix
+from geometrica.pointset import PointSet
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class MeasurementTest(TestCase):
+
+    def setUp(self):
+        self.chain = [(1, 0, 0), (0, 0, 0), (0, 1, 0), (1, 1, 0), (0, 1, 1)]
+
+
+    def assertValuesAlmostEqual(self, values1, values2, delta=1e-9):
+        self.assertEqual(len(values1), len(values2))
+        for value1, value2 in zip(values1, values2):
+            self.assertAlmostEqual(value1, value2, delta=delta)
+
+
+
+class DistanceTests(MeasurementTest):
+
+    def test_can_measure_along_chain(self):
+        self.assertValuesAlmostEqual(
+         distances(self.chain), [1, 1, 1, 2 ** 0.5]
+        )
+
+
+    def test_can_measure_between_pairs(self):
+        self.assertValuesAlmostEqual(
+         distances(self.chain, [(0, 4), (2, 2), (3, 1)]), [3 ** 0.5, 0, 2 ** 0.5]
+        )
+
+
+    def test_can_measure_pointset(self):
+        self.assertValuesAlmostEqual(
+         distances(PointSet(self.chain), [(0, 4)]), [3 ** 0.5]
+        )
+
+
+    def test_pairs_must_have_two_indices(self):
+        with self.assertRaises(ValueError):
+            distances(self.chain, [(0, 1, 2)])
+
+
+    def test_short_chains_have_no_measurements(self):
+        self.assertEqual(len(distances(self.chain[:1])), 0)
+        self.assertEqual(len(distances(self.chain, [])), 0)
+
+
+
+class AngleTests(MeasurementTest):
+
+    def test_can_measure_along_chain(self):
+        self.assertValuesAlmostEqual(angles(self.chain), [90, 90, 45])
+
+
+    def test_can_measure_triples(self):
+        self.assertValuesAlmostEqual(
+         angles(self.chain, [(0, 1, 3), (0, 1, 0), (0, 2, 4)]), [45, 0, 90]
+        )
+
+
+    def test_triples_must_have_three_indices(self):
+        with self.assertRaises(ValueError):
+            angles(self.chain, [(0, 1)])
+
+
+
+class DihedralTests(MeasurementTest):
+
+    def test_can_measure_along_chain(self):
+        self.assertValuesAlmostEqual(dihedrals(self.chain), [0, -90])
+
+
+    def test_can_measure_quads(self):
+        self.assertValuesAlmostEqual(dihedrals(self.chain, [
+         (0, 1, 2, 4), (4, 2, 1, 0), (0, 1, 2, 3)
+        ]), [-90, -90, 0])
+
+
+    def test_trans_dihedral_is_180(self):
+        self.assertValuesAlmostEqual(
+         [abs(value) for value in dihedrals(
+          [(1, 0, 0), (0, 0, 0), (0, 1, 0), (-1, 1, 0)]
+         )], [180]
+        )
+
+
+    def test_mirror_image_changes_sign(self):
+        mirrored = [(x, y, -z) for x, y, z in self.chain]
+        self.assertValuesAlmostEqual(dihedrals(mirrored), [0, 90])
+
+
+    def test_quads_must_have_four_indices(self):
+        with self.assertRaises(ValueError):
+            dihedrals(self.chain, [(0, 1, 2)])
+
+
+
+class DistanceMatrixTests(MeasurementTest):
+
+    def test_can_get_distance_matrix(self):
+        matrix = distance_matrix(self.chain[:3])
+        self.assertEqual(len(matrix), 3)
+        for row, expected in zip(matrix, [
+         [0, 1, 2 ** 0.5], [1, 0, 1], [2 ** 0.5, 1, 0]
+        ]):
+            self.assertValuesAlmostEqual(row, expected)
+
+
+    def test_can_measure_to_other_points(self):
+        matrix = distance_matrix(self.chain[:2], [(0, 0, 2)])
+        self.assertValuesAlmostEqual([row[0] for row in matrix], [5 ** 0.5, 2])
+
+
+    def test_can_get_matrix_in_chunks(self):
+        whole = distance_matrix(self.chain)
+        chunks = list(distance_matrix(self.chain, chunk_size=2))
+        self.assertEqual([start for start, rows in chunks], [0, 2, 4])
+        self.assertEqual([len(rows) for start, rows in chunks], [2, 2, 1])
+        for start, rows in chunks:
+            for index, row in enumerate(rows):
+                self.assertValuesAlmostEqual(row, whole[start + index])
+
+
+    def test_chunk_size_must_be_positive_int(self):
+        with self.assertRaises(TypeError):
+            distance_matrix(self.chain, chunk_size=2.5)
+        with self.assertRaises(ValueError):
+            distance_matrix(self.chain, chunk_size=0)
+
+
+
+class ArrayMeasurementTests(MeasurementTest):
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_arrays_are_returned(self):
+        self.assertIsInstance(distances(self.chain), numpy.ndarray)
+        self.assertIsInstance(distance_matrix(self.chain), numpy.ndarray)
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_use_arrays_of_points_and_indices(self):
+        self.assertValuesAlmostEqual(angles(
+         numpy.array(self.chain), numpy.array([[0, 1, 3], [0, 2, 4]])
+        ), [45, 90])
+
+
+
+class PurePythonDistanceTests(DistanceTests):
+
+    def setUp(self):
+        DistanceTests.setUp(self)
+        patcher = patch("geometrica.measure.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class PurePythonAngleTests(AngleTests):
+
+    def setUp(self):
+        AngleTests.setUp(self)
+        patcher = patch("geometrica.measure.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class PurePythonDihedralTests(DihedralTests):
+
+    def setUp(self):
+        DihedralTests.setUp(self)
+        patcher = patch("geometrica.measure.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class PurePythonDistanceMatrixTests(DistanceMatrixTests):
+
+    def setUp(self):
+        DistanceMatrixTests.setUp(self)
+        patcher = patch("geometrica.measure.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
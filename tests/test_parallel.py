@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from unittest import skipIf
+from unittest.mock import patch, Mock
+from geometrica.parallel import should_parallelise, chunk_bounds
+from geometrica.pointset import PointSet
+from geometrica.transform import translate, rotate, Transform
+from .base import PointsTest
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class ParallelTest(PointsTest):
+
+    def setUp(self):
+        self.points = [(n, n * 2, n * 3) for n in range(20)]
+        patcher = patch("geometrica.parallel.PARALLEL_THRESHOLD", 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class ParallelDecisionTests(ParallelTest):
+
+    def test_serial_unless_asked(self):
+        self.assertFalse(should_parallelise(self.points))
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_serial_below_threshold(self):
+        self.assertFalse(should_parallelise(self.points[:9], workers=2))
+        self.assertTrue(should_parallelise(self.points[:10], workers=2))
+        self.assertTrue(should_parallelise(self.points, executor=Mock()))
+
+
+    def test_serial_without_numpy(self):
+        with patch("geometrica.parallel.numpy", None):
+            self.assertFalse(should_parallelise(self.points, workers=2))
+
+
+    def test_workers_checked_below_threshold(self):
+        with self.assertRaises(TypeError):
+            should_parallelise(self.points[:2], workers="four")
+        with self.assertRaises(TypeError):
+            translate(self.points[:2], 1, 2, 3, workers="four")
+        with self.assertRaises(ValueError):
+            should_parallelise(self.points[:2], workers=0)
+
+
+    def test_chunk_bounds(self):
+        self.assertEqual(chunk_bounds(10, 3), [(0, 4), (4, 7), (7, 10)])
+        self.assertEqual(chunk_bounds(2, 4), [(0, 1), (1, 2)])
+        self.assertEqual(chunk_bounds(0, 4), [(0, 0)])
+
+
+
+class ParallelApplicationTests(ParallelTest):
+
+    def test_can_translate_list_in_parallel(self):
+        result = translate(self.points, 1, 2, 3, workers=2)
+        self.assertIsInstance(result, tuple)
+        self.assertIsInstance(result[0], tuple)
+        self.assertEqual(result, translate(self.points, 1, 2, 3))
+
+
+    def test_can_rotate_with_executor(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            result = rotate(self.points, (1, 2, 3), 37, executor=executor)
+        self.assertPointsAlmostEqual(result, rotate(self.points, (1, 2, 3), 37))
+
+
+    def test_can_rotate_pointset_in_parallel(self):
+        pointset = PointSet(self.points)
+        result = rotate(pointset, "y", 37, workers=3)
+        self.assertIsInstance(result, PointSet)
+        self.assertPointsAlmostEqual(result, rotate(self.points, "y", 37))
+        self.assertEqual(pointset.points(), tuple(self.points))
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_transform_array_in_threads(self):
+        transform = Transform.translation(1, 2, 3) @ Transform.rotation("x", 20)
+        points = numpy.array(self.points, dtype=float)
+        result = transform.apply(points, workers=4)
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertPointsAlmostEqual(result.tolist(), transform.apply(self.points))
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_transform_arrays_with_process_pool(self):
+        points = numpy.array(self.points, dtype=float)
+        pointset = PointSet(self.points)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            array = translate(points, 1, 2, 3, executor=executor)
+            pointset = rotate(pointset, "z", 30, executor=executor)
+        self.assertEqual(array.tolist(), translate(points, 1, 2, 3).tolist())
+        self.assertIsInstance(pointset, PointSet)
+        self.assertPointsAlmostEqual(pointset, rotate(self.points, "z", 30))
+
+
+    @patch("geometrica.parallel.apply_in_parallel")
+    def test_transformed_serially_without_numpy(self, mock_apply):
+        with patch("geometrica.parallel.numpy", None):
+            result = translate(PointSet(self.points), 1, 2, 3, workers=2)
+            listed = translate(self.points, 1, 2, 3, workers=2)
+        self.assertFalse(mock_apply.called)
+        self.assertIsInstance(result, PointSet)
+        self.assertEqual(result.points(), translate(self.points, 1, 2, 3))
+        self.assertEqual(listed, translate(self.points, 1, 2, 3))
+
+
+    def test_workers_must_be_positive_int(self):
+        with self.assertRaises(TypeError):
+            translate(self.points, 1, 2, 3, workers=2.5)
+        with self.assertRaises(ValueError):
+            translate(self.points, 1, 2, 3, workers=0)
@@ -0,0 +1,238 @@
+from array import array
+from unittest import skipIf
+from unittest.mock import Mock, patch
+from geometrica.pointset import PointSet
+from geometrica.transform import translate, rotate, Transform
+from .base import PointsTest
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class PointSetTest(PointsTest):
+
+    def setUp(self):
+        self.points = [(1, 1, 1), (2, 1, 1), (3, 1, 1), (4, 1, 1), (5, 1, 1)]
+
+
+
+class PointSetCreationTests(PointSetTest):
+
+    def test_can_create_pointset(self):
+        pointset = PointSet(self.points)
+        self.assertEqual(len(pointset), 5)
+        self.assertEqual(pointset.buffer().format, "d")
+        self.assertEqual(pointset.buffer().nbytes, 5 * 24)
+
+
+    def test_can_create_empty_pointset(self):
+        pointset = PointSet()
+        self.assertEqual(len(pointset), 0)
+        self.assertEqual(list(pointset), [])
+
+
+    def test_can_create_pointset_from_objects(self):
+        obj = Mock()
+        obj.x.return_value, obj.y.return_value, obj.z.return_value = 1, 2, 3
+        self.assertEqual(PointSet([obj]).points(), ((1, 2, 3),))
+
+
+    def test_pointsets_use_slots(self):
+        with self.assertRaises(AttributeError):
+            PointSet().x = 10
+
+
+    def test_pointset_repr(self):
+        self.assertEqual(str(PointSet(self.points)), "<PointSet (5 points)>")
+        self.assertEqual(str(PointSet([(1, 1, 1)])), "<PointSet (1 point)>")
+
+
+    def test_can_create_from_buffer_without_copying(self):
+        data = array("d", [1, 2, 3, 4, 5, 6])
+        pointset = PointSet.from_buffer(data)
+        data[0] = 100
+        self.assertEqual(pointset.points(), ((100, 2, 3), (4, 5, 6)))
+
+
+    def test_can_create_from_bytes(self):
+        data = bytearray(array("d", [1, 2, 3]).tobytes())
+        self.assertEqual(PointSet.from_buffer(data).points(), ((1, 2, 3),))
+
+
+    def test_buffer_must_be_multiple_of_three(self):
+        with self.assertRaises(ValueError):
+            PointSet.from_buffer(array("d", [1, 2, 3, 4]))
+
+
+    def test_can_create_float32_pointset(self):
+        pointset = PointSet(self.points, dtype="float32")
+        self.assertEqual(pointset.dtype(), "float32")
+        self.assertEqual(pointset.buffer().nbytes, 5 * 12)
+        self.assertEqual(pointset.points(), tuple(self.points))
+        self.assertEqual(PointSet(self.points).dtype(), "float64")
+        with self.assertRaises(ValueError):
+            PointSet(self.points, dtype="float16")
+
+
+    def test_can_create_float32_pointset_from_buffer(self):
+        pointset = PointSet.from_buffer(array("f", [1, 2, 3]))
+        self.assertEqual(pointset.dtype(), "float32")
+        data = bytearray(array("f", [1, 2, 3]).tobytes())
+        pointset = PointSet.from_buffer(data, dtype="float32")
+        self.assertEqual(pointset.points(), ((1, 2, 3),))
+        with self.assertRaises(TypeError):
+            PointSet.from_buffer(array("f", [1, 2, 3]), dtype="float64")
+
+
+    def test_can_convert_dtype(self):
+        pointset = PointSet([(1, 2, 3.1)])
+        converted = pointset.astype("float32")
+        self.assertEqual(converted.dtype(), "float32")
+        self.assertAlmostEqual(converted[0][2], 3.1, delta=1e-6)
+        self.assertNotEqual(converted[0][2], 3.1)
+        self.assertEqual(converted.astype("float64").dtype(), "float64")
+        copy = pointset.astype("float64")
+        copy.translate(1, 1, 1)
+        self.assertEqual(pointset.points(), ((1, 2, 3.1),))
+
+
+    def test_converting_without_numpy(self):
+        with patch("geometrica.pointset.numpy", None):
+            converted = PointSet(self.points).astype("float32")
+        self.assertEqual(converted.dtype(), "float32")
+        self.assertEqual(converted.points(), tuple(self.points))
+
+
+
+class PointSetContainerTests(PointSetTest):
+
+    def test_iteration_yields_tuples(self):
+        self.assertEqual(list(PointSet(self.points)), self.points)
+
+
+    def test_can_index(self):
+        pointset = PointSet(self.points)
+        self.assertEqual(pointset[1], (2, 1, 1))
+        self.assertEqual(pointset[-1], (5, 1, 1))
+        with self.assertRaises(IndexError):
+            pointset[5]
+
+
+    def test_slices_share_memory(self):
+        pointset = PointSet(self.points)
+        sliced = pointset[1:3]
+        self.assertEqual(sliced.points(), ((2, 1, 1), (3, 1, 1)))
+        sliced.translate(10, 0, 0)
+        self.assertEqual(pointset[1], (12, 1, 1))
+        self.assertEqual(pointset[0], (1, 1, 1))
+        self.assertEqual(len(pointset[4:1]), 0)
+
+
+    def test_stepped_slices_are_copies(self):
+        pointset = PointSet(self.points)
+        sliced = pointset[::2]
+        self.assertEqual(sliced.points(), ((1, 1, 1), (3, 1, 1), (5, 1, 1)))
+        sliced.translate(10, 0, 0)
+        self.assertEqual(pointset[0], (1, 1, 1))
+
+
+    def test_equality(self):
+        self.assertEqual(PointSet(self.points), PointSet(self.points))
+        self.assertNotEqual(PointSet(self.points), PointSet(self.points[1:]))
+
+
+    def test_copy_has_own_memory(self):
+        pointset = PointSet(self.points)
+        copy = pointset.copy()
+        self.assertEqual(copy, pointset)
+        copy.translate(1, 1, 1)
+        self.assertNotEqual(copy, pointset)
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_view_as_array(self):
+        pointset = PointSet(self.points, dtype="float32")
+        values = pointset.as_array()
+        self.assertEqual(values.shape, (5, 3))
+        self.assertEqual(values.dtype, numpy.float32)
+        values[0] = (9, 9, 9)
+        self.assertEqual(pointset[0], (9, 9, 9))
+
+
+
+class PointSetTransformationTests(PointSetTest):
+
+    def test_float32_pointsets_stay_float32(self):
+        pointset = PointSet(self.points, dtype="float32")
+        self.assertEqual(pointset.copy().dtype(), "float32")
+        self.assertEqual(pointset[::2].dtype(), "float32")
+        pointset.rotate("x", 90).translate(1, 1, 1)
+        self.assertEqual(pointset.dtype(), "float32")
+        self.assertPointsAlmostEqual(
+         pointset, translate(rotate(self.points, "x", 90), 1, 1, 1)
+        )
+
+
+    def test_float32_pointsets_without_numpy(self):
+        pointset = PointSet(self.points, dtype="float32")
+        with patch("geometrica.pointset.numpy", None):
+            pointset.rotate("x", 90)
+        self.assertPointsAlmostEqual(pointset, rotate(self.points, "x", 90))
+
+
+    def test_can_translate_in_place(self):
+        pointset = PointSet(self.points)
+        data = pointset.buffer()
+        self.assertIs(pointset.translate(3, -2, 8), pointset)
+        self.assertIs(pointset.buffer(), data)
+        self.assertEqual(pointset.points(), translate(self.points, 3, -2, 8))
+
+
+    def test_can_rotate_in_place(self):
+        pointset = PointSet(self.points)
+        self.assertIs(pointset.rotate("y", 37, "left"), pointset)
+        self.assertPointsAlmostEqual(
+         pointset, rotate(self.points, "y", 37, "left")
+        )
+
+
+    def test_can_rotate_in_place_without_numpy(self):
+        pointset = PointSet(self.points)
+        with patch("geometrica.pointset.numpy", None):
+            pointset.rotate("z", 37)
+        self.assertPointsAlmostEqual(pointset, rotate(self.points, "z", 37))
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_large_pointsets_are_rotated_in_chunks(self):
+        pointset = PointSet(self.points)
+        with patch("geometrica.pointset.CHUNK_SIZE", 2):
+            pointset.rotate("x", 37)
+        self.assertPointsAlmostEqual(pointset, rotate(self.points, "x", 37))
+
+
+    def test_cannot_transform_read_only_buffer(self):
+        pointset = PointSet.from_buffer(array("d", [1, 2, 3]).tobytes())
+        with self.assertRaises(TypeError):
+            pointset.translate(1, 1, 1)
+
+
+    def test_functions_return_new_pointsets(self):
+        pointset = PointSet(self.points)
+        for result, expected in (
+         (translate(pointset, 3, -2, 8), translate(self.points, 3, -2, 8)),
+         (rotate(pointset, "x", 90), rotate(self.points, "x", 90)),
+         (Transform.rotation("x", 20).apply(pointset),
+          Transform.rotation("x", 20).apply(self.points))
+        ):
+            self.assertIsInstance(result, PointSet)
+            self.assertPointsAlmostEqual(result, expected)
+        self.assertEqual(pointset.points(), tuple(self.points))
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_wrap_numpy_array(self):
+        values = numpy.array(self.points, dtype=float)
+        pointset = PointSet.from_buffer(values)
+        pointset.translate(1, 0, 0)
+        self.assertEqual(values[0].tolist(), [2, 1, 1])
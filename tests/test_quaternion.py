@@ -0,0 +1,133 @@
+from unittest import TestCase
+from geometrica.quaternion import Quaternion, slerp
+from geometrica.transform import Transform, rotate, rotation_matrix
+
+class QuaternionTest(TestCase):
+
+    def assertValuesAlmostEqual(self, values1, values2):
+        self.assertEqual(len(values1), len(values2))
+        for value1, value2 in zip(values1, values2):
+            self.assertAlmostEqual(value1, value2, delta=0.0005)
+
+
+
+class QuaternionCreationTests(QuaternionTest):
+
+    def test_can_create_quaternion(self):
+        quaternion = Quaternion(1, 2, 3, 4)
+        self.assertEqual(quaternion.values(), (1, 2, 3, 4))
+        self.assertEqual(str(quaternion), "<Quaternion (1, 2, 3, 4)>")
+
+
+    def test_values_must_be_numeric(self):
+        with self.assertRaises(TypeError):
+            Quaternion(1, 2, "3", 4)
+
+
+    def test_can_create_from_axis_angle(self):
+        self.assertValuesAlmostEqual(
+         Quaternion.from_axis_angle("z", 90).values(), (0.7071, 0, 0, 0.7071)
+        )
+        self.assertValuesAlmostEqual(
+         Quaternion.from_axis_angle((0, 0, 2), 90, hand="left").values(),
+         (0.7071, 0, 0, -0.7071)
+        )
+        with self.assertRaises(ValueError):
+            Quaternion.from_axis_angle("a", 90)
+        with self.assertRaises(ValueError):
+            Quaternion.from_axis_angle((0, 0, 0), 90)
+
+
+
+class QuaternionArithmeticTests(QuaternionTest):
+
+    def test_can_multiply(self):
+        self.assertEqual(
+         Quaternion(1, 2, 3, 4) * Quaternion(5, 6, 7, 8),
+         Quaternion(-60, 12, 30, 24)
+        )
+
+
+    def test_multiplication_combines_rotations(self):
+        first = Quaternion.from_axis_angle("x", 90)
+        second = Quaternion.from_axis_angle("y", 90)
+        combined = Transform.from_quaternion(second * first)
+        self.assertValuesAlmostEqual(
+         combined.apply([(0, 1, 0)])[0],
+         rotate(rotate([(0, 1, 0)], "x", 90), "y", 90)[0]
+        )
+
+
+    def test_magnitude_and_normalising(self):
+        quaternion = Quaternion(0, 3, 0, 4)
+        self.assertEqual(quaternion.magnitude(), 5)
+        self.assertEqual(quaternion.normalised(), Quaternion(0, 0.6, 0, 0.8))
+        with self.assertRaises(ValueError):
+            Quaternion(0, 0, 0, 0).normalised()
+
+
+    def test_conjugate_undoes_rotation(self):
+        quaternion = Quaternion.from_axis_angle((1, 2, 3), 40)
+        self.assertValuesAlmostEqual(
+         (quaternion * quaternion.conjugate()).values(), (1, 0, 0, 0)
+        )
+
+
+    def test_matrix_matches_rotation_matrix(self):
+        for axis in ("x", "y", "z", (1, 2, 3)):
+            matrix = Quaternion.from_axis_angle(axis, 37).matrix()
+            for row1, row2 in zip(matrix, rotation_matrix(axis, 37)):
+                self.assertValuesAlmostEqual(row1, row2)
+
+
+
+class SlerpTests(QuaternionTest):
+
+    def setUp(self):
+        self.start = Quaternion(1, 0, 0, 0)
+        self.end = Quaternion.from_axis_angle("z", 90)
+
+
+    def test_ends_are_start_and_end(self):
+        self.assertValuesAlmostEqual(
+         slerp(self.start, self.end, 0).values(), self.start.values()
+        )
+        self.assertValuesAlmostEqual(
+         slerp(self.start, self.end, 1).values(), self.end.values()
+        )
+
+
+    def test_halfway_is_half_the_angle(self):
+        self.assertValuesAlmostEqual(
+         slerp(self.start, self.end, 0.5).values(),
+         Quaternion.from_axis_angle("z", 45).values()
+        )
+
+
+    def test_can_interpolate_many_frames(self):
+        frames = slerp(self.start, self.end, [0, 0.25, 0.5])
+        self.assertEqual(len(frames), 3)
+        self.assertValuesAlmostEqual(
+         frames[1].values(), Quaternion.from_axis_angle("z", 22.5).values()
+        )
+
+
+    def test_takes_shortest_path(self):
+        self.assertValuesAlmostEqual(
+         Transform.from_quaternion(
+          slerp(self.start, Quaternion(-1, 0, 0, 0), 0.5)
+         ).apply([(1, 0, 0)])[0], (1, 0, 0)
+        )
+
+
+    def test_identical_orientations(self):
+        self.assertValuesAlmostEqual(
+         slerp(self.end, self.end, 0.3).values(), self.end.values()
+        )
+
+
+    def test_arguments_must_be_quaternions(self):
+        with self.assertRaises(TypeError):
+            slerp(self.start, (1, 0, 0, 0), 0.5)
+        with self.assertRaises(TypeError):
+            slerp(self.start, self.end, "0.5")
@@ -0,0 +1,148 @@
+from random import Random
+from unittest import TestCase, skipIf
+from geometrica.spatial import KDTree
+from geometrica.pointset import PointSet
+from geometrica.transform import Transform, translate, rotate
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class KDTreeTest(TestCase):
+
+    def setUp(self):
+        random = Random(3)
+        self.points = [tuple(
+         random.uniform(-20, 20) for _ in range(3)
+        ) for _ in range(500)]
+        self.locations = [tuple(
+         random.uniform(-25, 25) for _ in range(3)
+        ) for _ in range(20)]
+
+
+    def distances(self, points, location):
+        return [sum(
+         (a - b) ** 2 for a, b in zip(point, location)
+        ) ** 0.5 for point in points]
+
+
+    def assertMatchesSearch(self, tree, points):
+        for location in self.locations:
+            distances = self.distances(points, location)
+            self.assertEqual(tree.within(location, 6), tuple([
+             index for index, distance in enumerate(distances) if distance <= 6
+            ]))
+            nearest = tree.nearest(location, k=4)
+            expected = sorted(enumerate(distances), key=lambda p: p[1])[:4]
+            self.assertEqual([p[0] for p in nearest], [p[0] for p in expected])
+            for found, distance in zip(nearest, expected):
+                self.assertAlmostEqual(found[1], distance[1], delta=1e-9)
+
+
+
+class KDTreeCreationTests(KDTreeTest):
+
+    def test_can_create_tree(self):
+        tree = KDTree(self.points)
+        self.assertEqual(len(tree), 500)
+        self.assertEqual(repr(tree), "<KDTree (500 points)>")
+        self.assertEqual(tree.points(), tuple(self.points))
+
+
+    def test_can_create_tree_from_pointset(self):
+        tree = KDTree(PointSet(self.points))
+        self.assertEqual(tree.points(), tuple(self.points))
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_create_tree_from_array(self):
+        tree = KDTree(numpy.array(self.points))
+        self.assertEqual(tree.points(), tuple(self.points))
+
+
+    def test_can_create_tree_from_objects(self):
+        class Atom:
+            def __init__(self, x, y, z):
+                self._x, self._y, self._z = x, y, z
+            def x(self): return self._x
+            def y(self): return self._y
+            def z(self): return self._z
+        tree = KDTree([Atom(*point) for point in self.points[:5]])
+        self.assertEqual(tree.points(), tuple(self.points[:5]))
+
+
+    def test_can_create_empty_tree(self):
+        tree = KDTree([])
+        self.assertEqual(tree.within((0, 0, 0), 10), ())
+        self.assertEqual(tree.nearest((0, 0, 0), 3), ())
+
+
+    def test_leaf_size_must_be_positive_int(self):
+        with self.assertRaises(TypeError):
+            KDTree(self.points, leaf_size=1.5)
+        with self.assertRaises(ValueError):
+            KDTree(self.points, leaf_size=0)
+
+
+
+class KDTreeQueryTests(KDTreeTest):
+
+    def test_queries_match_exhaustive_search(self):
+        self.assertMatchesSearch(KDTree(self.points), self.points)
+
+
+    def test_queries_work_with_any_leaf_size(self):
+        for leaf_size in (1, 2, 1000):
+            self.assertMatchesSearch(
+             KDTree(self.points, leaf_size=leaf_size), self.points
+            )
+
+
+    def test_nearest_returns_all_points_if_fewer_than_k(self):
+        tree = KDTree([(0, 0, 0), (3, 4, 0)])
+        self.assertEqual(tree.nearest((0, 0, 0), k=5), ((0, 0), (1, 5)))
+
+
+    def test_query_arguments_are_checked(self):
+        tree = KDTree(self.points)
+        with self.assertRaises(TypeError):
+            tree.within((0, 0), 5)
+        with self.assertRaises(TypeError):
+            tree.within((0, 0, "0"), 5)
+        with self.assertRaises(ValueError):
+            tree.within((0, 0, 0), -1)
+        with self.assertRaises(TypeError):
+            tree.nearest((0, 0, 0), k=1.0)
+        with self.assertRaises(ValueError):
+            tree.nearest((0, 0, 0), k=0)
+
+
+
+class KDTreeMovementTests(KDTreeTest):
+
+    def test_can_move_tree_rigidly(self):
+        tree = KDTree(self.points)
+        tree.translate(3, -2, 8).rotate((1, 2, 3), 37, pivot=(1, 1, 1))
+        moved = rotate(
+         translate(self.points, 3, -2, 8), (1, 2, 3), 37, pivot=(1, 1, 1)
+        )
+        for point1, point2 in zip(tree.points(), moved):
+            for value1, value2 in zip(point1, point2):
+                self.assertAlmostEqual(value1, value2, delta=1e-9)
+        self.assertMatchesSearch(tree, moved)
+
+
+    def test_can_reflect_tree(self):
+        tree = KDTree(self.points)
+        tree.apply(Transform((-1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0)))
+        self.assertMatchesSearch(
+         tree, [(-x, y, z) for x, y, z in self.points]
+        )
+
+
+    def test_tree_cannot_be_stretched(self):
+        tree = KDTree(self.points)
+        with self.assertRaises(ValueError):
+            tree.apply(Transform((2, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0)))
+        with self.assertRaises(TypeError):
+            tree.apply("transform")
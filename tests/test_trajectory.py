@@ -0,0 +1,212 @@
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from geometrica.pointset import PointSet
+from geometrica.trajectory import transform_frames
+from geometrica.transform import Transform
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TrajectoryTest(TestCase):
+
+    def setUp(self):
+        self.frames = [
+         [(frame, point, 0) for point in range(4)] for frame in range(5)
+        ]
+        self.transforms = [
+         Transform.rotation("z", 90 * frame) @ Transform.translation(1, 0, 0)
+         for frame in range(5)
+        ]
+
+
+    def assertFramesAlmostEqual(self, frames1, frames2):
+        frames1, frames2 = list(frames1), list(frames2)
+        self.assertEqual(len(frames1), len(frames2))
+        for frame1, frame2 in zip(frames1, frames2):
+            frame1, frame2 = list(frame1), list(frame2)
+            self.assertEqual(len(frame1), len(frame2))
+            for point1, point2 in zip(frame1, frame2):
+                for value1, value2 in zip(point1, point2):
+                    self.assertAlmostEqual(value1, value2, delta=1e-9)
+
+
+
+class FrameTransformationTests(TrajectoryTest):
+
+    def test_can_apply_one_transform_to_all_frames(self):
+        result = transform_frames(self.frames, Transform.translation(0, 0, 5))
+        self.assertIsInstance(result, tuple)
+        self.assertEqual(result[3][2], (3, 2, 5))
+        self.assertEqual(len(result), 5)
+
+
+    def test_can_apply_one_transform_per_frame(self):
+        result = transform_frames(self.frames, self.transforms)
+        self.assertFramesAlmostEqual(result, [
+         transform.apply(frame)
+         for frame, transform in zip(self.frames, self.transforms)
+        ])
+        self.assertFramesAlmostEqual([[result[1][0]]], [[(0, 2, 0)]])
+
+
+    def test_can_transform_generator_of_frames(self):
+        result = transform_frames(
+         (frame for frame in self.frames), iter(self.transforms)
+        )
+        self.assertFramesAlmostEqual(
+         result, transform_frames(self.frames, self.transforms)
+        )
+
+
+    def test_frames_keep_their_form(self):
+        result = transform_frames(
+         [PointSet(frame) for frame in self.frames], self.transforms[0]
+        )
+        self.assertIsInstance(result[0], PointSet)
+
+
+    def test_can_stream_chunks_of_frames(self):
+        chunks = list(transform_frames(
+         (frame for frame in self.frames), self.transforms, chunk_size=2
+        ))
+        self.assertEqual([start for start, frames in chunks], [0, 2, 4])
+        self.assertEqual([len(frames) for start, frames in chunks], [2, 2, 1])
+        self.assertFramesAlmostEqual(
+         [frame for start, frames in chunks for frame in frames],
+         transform_frames(self.frames, self.transforms)
+        )
+
+
+    def test_need_one_transform_per_frame(self):
+        with self.assertRaises(ValueError):
+            transform_frames(self.frames, self.transforms[:4])
+        with self.assertRaises(ValueError):
+            transform_frames(
+             (frame for frame in self.frames), iter(self.transforms[:4])
+            )
+
+
+    def test_transforms_must_be_transforms(self):
+        with self.assertRaises(TypeError):
+            transform_frames(self.frames, ["transform"] * 5)
+
+
+    def test_chunk_size_must_be_positive_int(self):
+        with self.assertRaises(TypeError):
+            transform_frames(self.frames, self.transforms, chunk_size=2.5)
+        with self.assertRaises(ValueError):
+            transform_frames(self.frames, self.transforms, chunk_size=0)
+
+
+    def test_out_needs_array_of_frames(self):
+        with self.assertRaises(TypeError):
+            transform_frames(self.frames, self.transforms, out=[])
+
+
+
+class PurePythonFrameTransformationTests(FrameTransformationTests):
+
+    def setUp(self):
+        FrameTransformationTests.setUp(self)
+        for module in ("trajectory", "transform", "pointset"):
+            patcher = patch("geometrica.%s.numpy" % module, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+
+@skipIf(numpy is None, "NumPy not installed")
+class ArrayFrameTransformationTests(TrajectoryTest):
+
+    def setUp(self):
+        TrajectoryTest.setUp(self)
+        self.array = numpy.array(self.frames, dtype=float)
+        self.expected = transform_frames(self.frames, self.transforms)
+
+
+    def test_can_transform_array_of_frames(self):
+        result = transform_frames(self.array, self.transforms)
+        self.assertEqual(result.shape, (5, 4, 3))
+        self.assertFramesAlmostEqual(result, self.expected)
+
+
+    def test_can_use_array_of_matrices(self):
+        matrices = numpy.array([
+         transform.rows() for transform in self.transforms
+        ])
+        self.assertFramesAlmostEqual(
+         transform_frames(self.array, matrices), self.expected
+        )
+        self.assertFramesAlmostEqual(
+         transform_frames(self.array, matrices[:, :3]), self.expected
+        )
+        self.assertFramesAlmostEqual(
+         transform_frames(self.frames, matrices), self.expected
+        )
+
+
+    def test_can_apply_one_transform_to_array(self):
+        result = transform_frames(self.array, Transform.translation(0, 0, 5))
+        self.assertEqual(result[3, 2].tolist(), [3, 2, 5])
+
+
+    def test_can_chunk_array_of_frames(self):
+        chunks = list(transform_frames(
+         self.array, self.transforms, chunk_size=2
+        ))
+        self.assertEqual([start for start, frames in chunks], [0, 2, 4])
+        self.assertFramesAlmostEqual(
+         numpy.concatenate([frames for start, frames in chunks]),
+         self.expected
+        )
+
+
+    def test_can_write_to_out(self):
+        out = numpy.zeros((5, 4, 3), dtype=numpy.float32)
+        result = transform_frames(
+         self.array, self.transforms, out=out, chunk_size=2
+        )
+        self.assertIs(result, out)
+        self.assertFramesAlmostEqual(out.astype(float), self.expected)
+        self.assertEqual(self.array[1, 0].tolist(), [1, 0, 0])
+
+
+    def test_out_must_match_frames(self):
+        with self.assertRaises(ValueError):
+            transform_frames(
+             self.array, self.transforms, out=numpy.zeros((5, 3, 3))
+            )
+
+
+    def test_can_choose_dtype(self):
+        result = transform_frames(self.array, self.transforms, dtype="float32")
+        self.assertEqual(result.dtype, numpy.float32)
+
+
+    def test_frames_must_be_three_dimensional(self):
+        with self.assertRaises(ValueError):
+            transform_frames(numpy.zeros((4, 3)), self.transforms[0])
+
+
+    def test_need_one_matrix_per_frame(self):
+        with self.assertRaises(ValueError):
+            transform_frames(self.array, self.transforms[:4])
+        with self.assertRaises(ValueError):
+            transform_frames(self.array, numpy.zeros((5, 2, 4)))
+        matrices = numpy.array([
+         transform.rows() for transform in self.transforms * 2
+        ])
+        with self.assertRaises(ValueError):
+            transform_frames(self.frames, matrices)
+
+
+    def test_matrices_must_be_affine(self):
+        matrices = numpy.array([
+         transform.rows() for transform in self.transforms
+        ])
+        matrices[2, 3] = (0, 0, 1, 1)
+        with self.assertRaises(ValueError):
+            transform_frames(self.array, matrices)
+        with self.assertRaises(ValueError):
+            transform_frames(self.frames, matrices)
@@ -1,6 +1,17 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from unittest.mock import Mock
-from geometrica.transform import translate, rotate, accept_objects
+from geometrica.transform import translate, rotate, accept_objects, Transform
+from geometrica.transform import scale, reflect, shear, apply_matrix
+from geometrica.transform import rotation_matrix, rotation_cache_info
+from geometrica.transform import clear_rotation_cache, itranslate, irotate
+from geometrica.transform import write_points
+from geometrica.pointset import PointSet
+from geometrica.quaternion import Quaternion
+from array import array
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class TransformationTest(TestCase):
 
@@ -28,6 +39,26 @@ class TranslationTests(TransformationTest):
         )
 
 
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_translate_array(self):
+        points = numpy.array(self.points, dtype=float)
+        translated = translate(points, 3, -2, 8)
+        self.assertIsInstance(translated, numpy.ndarray)
+        self.assertEqual(translated.shape, (5, 3))
+        self.assertPointsAlmostEqual(
+         translated.tolist(),
+         ((4, -1, 9), (5, -1, 9), (6, -1, 9), (7, -1, 9), (8, -1, 9))
+        )
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_arrays_must_be_n_by_3(self):
+        with self.assertRaises(ValueError):
+            translate(numpy.zeros((5, 2)), 3, -2, 8)
+        with self.assertRaises(ValueError):
+            translate(numpy.zeros(15), 3, -2, 8)
+
+
     def translation_directions_must_be_numeric(self):
         with self.assertRaises(TypeError):
             translate(self.points, "3", -2, 8)
@@ -89,11 +120,53 @@ class RotationTests(TransformationTest):
         )
 
 
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_rotate_array(self):
+        points = numpy.array(self.points, dtype=float)
+        for axis in "xyz":
+            for angle in (30, 90, 180, -45):
+                rotated = rotate(points, axis, angle, hand="left")
+                self.assertIsInstance(rotated, numpy.ndarray)
+                self.assertPointsAlmostEqual(
+                 rotated.tolist(), rotate(self.points, axis, angle, hand="left")
+                )
+
+
+    def test_can_rotate_around_vector(self):
+        self.assertPointsAlmostEqual(
+         rotate(self.points, (0, 0, 3), 90), rotate(self.points, "z", 90)
+        )
+        self.assertPointsAlmostEqual(
+         rotate([(1, 0, 0)], (1, 1, 1), 120), ((0, 1, 0),)
+        )
+        self.assertPointsAlmostEqual(
+         rotate([(1, 0, 0)], [1, 1, 1], 120, hand="left"), ((0, 0, 1),)
+        )
+
+
+    def test_can_rotate_around_pivot(self):
+        self.assertPointsAlmostEqual(
+         rotate(self.points, "z", 90, pivot=(1, 1, 1)),
+         ((1, 1, 1), (1, 2, 1), (1, 3, 1), (1, 4, 1), (1, 5, 1))
+        )
+        with self.assertRaises(ValueError):
+            rotate(self.points, "z", 90, pivot=(1, 1))
+
+
     def test_axis_must_be_x_or_y_or_z(self):
         with self.assertRaises(ValueError):
             rotate(self.points, "a", 90)
 
 
+    def test_axis_vector_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            rotate(self.points, (1, 1), 90)
+        with self.assertRaises(ValueError):
+            rotate(self.points, (0, 0, 0), 90)
+        with self.assertRaises(TypeError):
+            rotate(self.points, (0, "1", 0), 90)
+
+
     def test_angle_must_be_numeric(self):
         with self.assertRaises(TypeError):
             rotate(self.points, "x", "90")
@@ -110,6 +183,384 @@ class RotationTests(TransformationTest):
 
 
 
+class RotationMatrixTests(TestCase):
+
+    def setUp(self):
+        clear_rotation_cache()
+
+
+    def test_right_angles_are_exact(self):
+        self.assertEqual(
+         rotation_matrix("x", 90), ((1, 0, 0), (0, 0, -1), (0, 1, 0))
+        )
+        self.assertEqual(
+         rotation_matrix("z", -180), ((-1, 0, 0), (0, -1, 0), (0, 0, 1))
+        )
+        self.assertEqual(
+         rotation_matrix("y", 90, hand="left"), ((0, 0, -1), (0, 1, 0), (1, 0, 0))
+        )
+        self.assertEqual(
+         rotate([(1, 1, 1), (3, 4, -8)], "x", 90), ((1, -1, 1), (3, 8, 4))
+        )
+
+
+    def test_matrices_are_cached(self):
+        first = rotation_matrix("x", 37)
+        self.assertIs(rotation_matrix("x", 37), first)
+        self.assertIsNot(rotation_matrix("x", 37, hand="left"), first)
+        self.assertIsNot(rotation_matrix("y", 37), first)
+        info = rotation_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 3, 3))
+
+
+    def test_can_clear_cache(self):
+        rotation_matrix("x", 37)
+        clear_rotation_cache()
+        info = rotation_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+
+    def test_invalid_arguments_are_not_cached(self):
+        with self.assertRaises(ValueError):
+            rotation_matrix("a", 37)
+        with self.assertRaises(ValueError):
+            rotation_matrix(["x"], 37)
+        self.assertEqual(rotation_cache_info().misses, 0)
+
+
+
+class LinearMapTests(TransformationTest):
+
+    def test_can_scale_uniformly(self):
+        self.assertEqual(scale(self.points[:2], 2), ((2, 2, 2), (4, 2, 2)))
+
+
+    def test_can_scale_each_axis(self):
+        self.assertEqual(
+         scale(self.points[:2], 2, 3, -1), ((2, 3, -1), (4, 3, -1))
+        )
+        with self.assertRaises(TypeError):
+            scale(self.points, 2, 3)
+        with self.assertRaises(TypeError):
+            scale(self.points, "2")
+
+
+    def test_can_scale_around_pivot(self):
+        self.assertEqual(
+         scale(self.points[:2], 2, pivot=(1, 1, 1)), ((1, 1, 1), (3, 1, 1))
+        )
+
+
+    def test_can_reflect_across_axis_planes(self):
+        self.assertEqual(reflect([(1, 2, 3)], "x"), ((-1, 2, 3),))
+        self.assertEqual(reflect([(1, 2, 3)], "z", point=(0, 0, 1)), (
+         (1, 2, -1),
+        ))
+
+
+    def test_can_reflect_across_any_plane(self):
+        self.assertPointsAlmostEqual(
+         reflect([(1, 0, 0), (1, 1, 0)], (1, 1, 0)), ((0, -1, 0), (-1, -1, 0))
+        )
+        with self.assertRaises(ValueError):
+            reflect(self.points, (0, 0, 0))
+
+
+    def test_reflecting_twice_restores_points(self):
+        self.assertPointsAlmostEqual(reflect(reflect(
+         self.points, (1, 2, 3), point=(4, 5, 6)
+        ), (1, 2, 3), point=(4, 5, 6)), self.points)
+
+
+    def test_can_shear(self):
+        self.assertEqual(
+         shear([(1, 2, 3)], xz=0.5, zy=-1), ((2.5, 2, 1),)
+        )
+        self.assertEqual(
+         shear([(1, 2, 3)], xy=1, pivot=(0, 1, 0)), ((2, 2, 3),)
+        )
+        with self.assertRaises(TypeError):
+            shear(self.points, xy="1")
+
+
+    def test_can_apply_matrix(self):
+        self.assertEqual(apply_matrix(
+         [(1, 2, 3)], ((0, 1, 0), (1, 0, 0), (0, 0, 1))
+        ), ((2, 1, 3),))
+        self.assertEqual(apply_matrix(
+         [(1, 2, 3)],
+         ((2, 0, 0, 1), (0, 2, 0, 1), (0, 0, 2, 1), (0, 0, 0, 1))
+        ), ((3, 5, 7),))
+        with self.assertRaises(ValueError):
+            apply_matrix(self.points, ((1, 0), (0, 1)))
+
+
+    def test_maps_can_be_fused_with_other_transforms(self):
+        transform = (
+         Transform.translation(1, 0, 0) @ Transform.shear(xy=2) @
+         Transform.reflection("y") @ Transform.scaling(3)
+        )
+        self.assertPointsAlmostEqual(
+         transform.apply(self.points),
+         translate(shear(reflect(scale(self.points, 3), "y"), xy=2), 1, 0, 0)
+        )
+
+
+    def test_maps_accept_objects_and_write_back(self):
+        points = [[1, 2, 3]]
+        result, bounds = scale(points, 2, write_back=True, with_bounds=True)
+        self.assertEqual(points, [[2, 4, 6]])
+        self.assertEqual(bounds.box.maximum, (2, 4, 6))
+        buffer = array("d", [1, 2, 3])
+        reflect(PointSet.from_buffer(buffer), "y", write_back=True)
+        self.assertEqual(list(buffer), [1, -2, 3])
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_maps_work_on_arrays(self):
+        points = numpy.array(self.points, dtype=float)
+        matrix = numpy.diag([1.0, 2.0, 3.0, 1.0])
+        self.assertEqual(apply_matrix(points, matrix)[1].tolist(), [2, 2, 3])
+        self.assertEqual(
+         scale(points, 2, dtype="float32").dtype, numpy.float32
+        )
+
+
+
+class TransformTests(TransformationTest):
+
+    def test_default_transform_is_identity(self):
+        self.assertEqual(Transform().apply(self.points), tuple(self.points))
+
+
+    def test_three_rows_are_padded(self):
+        transform = Transform((1, 0, 0, 1), (0, 1, 0, 2), (0, 0, 1, 3))
+        self.assertEqual(transform.rows()[3], (0, 0, 0, 1))
+
+
+    def test_rows_must_be_affine(self):
+        with self.assertRaises(ValueError):
+            Transform((1, 0, 0), (0, 1, 0), (0, 0, 1))
+        with self.assertRaises(ValueError):
+            Transform((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 1, 1))
+        with self.assertRaises(TypeError):
+            Transform((1, 0, 0, "0"), (0, 1, 0, 0), (0, 0, 1, 0))
+
+
+    def test_translation_matches_translate(self):
+        self.assertPointsAlmostEqual(
+         Transform.translation(3, -2, 8).apply(self.points),
+         translate(self.points, 3, -2, 8)
+        )
+
+
+    def test_rotation_matches_rotate(self):
+        for axis in "xyz":
+            for hand in ("left", "right"):
+                self.assertPointsAlmostEqual(
+                 Transform.rotation(axis, 37, hand).apply(self.points),
+                 rotate(self.points, axis, 37, hand)
+                )
+        with self.assertRaises(ValueError):
+            Transform.rotation("a", 90)
+
+
+    def test_composition_applies_right_first(self):
+        move = Transform.translation(3, -2, 8)
+        spin = Transform.rotation("z", 90)
+        self.assertPointsAlmostEqual(
+         (move @ spin).apply(self.points),
+         translate(rotate(self.points, "z", 90), 3, -2, 8)
+        )
+        self.assertPointsAlmostEqual(
+         (spin @ move).apply(self.points),
+         rotate(translate(self.points, 3, -2, 8), "z", 90)
+        )
+
+
+    def test_can_invert(self):
+        transform = Transform.translation(3, -2, 8) @ Transform.rotation("y", 20)
+        self.assertPointsAlmostEqual(
+         transform.inverse().apply(transform.apply(self.points)), self.points
+        )
+
+
+    def test_can_create_from_matrix(self):
+        transform = Transform.from_matrix(((2, 0, 0), (0, 1, 0), (0, 0, 1)))
+        self.assertEqual(transform.apply([(1, 1, 1)]), ((2, 1, 1),))
+        with self.assertRaises(ValueError):
+            Transform.from_matrix(((2, 0, 0), (0, 1, 0)))
+
+
+    def test_can_create_from_affine_matrix(self):
+        matrix = ((1, 0, 0, 5), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))
+        self.assertEqual(Transform.from_matrix(matrix), Transform(*matrix))
+        self.assertEqual(Transform.from_matrix(
+         ((2, 0, 0), (0, 1, 0), (0, 0, 1)), pivot=(1, 0, 0)
+        ), Transform((2, 0, 0, -1), (0, 1, 0, 0), (0, 0, 1, 0)))
+        with self.assertRaises(ValueError):
+            Transform.from_matrix(matrix[:3] + ((0, 0, 1, 1),))
+
+
+    def test_can_create_from_quaternion(self):
+        quaternion = Quaternion.from_axis_angle((1, 2, 3), 37)
+        self.assertPointsAlmostEqual(
+         Transform.from_quaternion(quaternion, pivot=(1, 0, 0)).apply(
+          self.points
+         ), rotate(self.points, (1, 2, 3), 37, pivot=(1, 0, 0))
+        )
+        with self.assertRaises(TypeError):
+            Transform.from_quaternion((1, 0, 0, 0))
+
+
+    def test_can_create_from_euler_angles(self):
+        self.assertPointsAlmostEqual(
+         Transform.from_euler((30, 40, 50), "xyz").apply(self.points),
+         rotate(rotate(rotate(self.points, "x", 30), "y", 40), "z", 50)
+        )
+        self.assertPointsAlmostEqual(
+         Transform.from_euler((30, 40, 50), "zxz", hand="left").apply(
+          self.points
+         ),
+         rotate(rotate(rotate(
+          self.points, "z", 30, "left"), "x", 40, "left"), "z", 50, "left"
+         )
+        )
+        with self.assertRaises(ValueError):
+            Transform.from_euler((30, 40), "xyz")
+        with self.assertRaises(ValueError):
+            Transform.from_euler((30, 40, 50), "xya")
+
+
+    def test_singular_transform_cannot_be_inverted(self):
+        with self.assertRaises(ValueError):
+            Transform((1, 0, 0, 0), (0, 0, 0, 0), (0, 0, 1, 0)).inverse()
+
+
+    def test_can_apply_to_objects(self):
+        obj = Mock()
+        obj.x.return_value, obj.y.return_value, obj.z.return_value = 1, 2, 3
+        self.assertEqual(
+         Transform.translation(1, 1, 1).apply([obj]), ((2, 3, 4),)
+        )
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_apply_to_array(self):
+        transform = Transform.translation(3, -2, 8) @ Transform.rotation("x", 33)
+        result = transform.apply(numpy.array(self.points, dtype=float))
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertPointsAlmostEqual(result.tolist(), transform.apply(self.points))
+
+
+
+class StreamingTests(TransformationTest):
+
+    def test_itranslate_is_lazy(self):
+        points = (point for point in self.points)
+        translated = itranslate(points, 3, -2, 8)
+        self.assertEqual(next(translated), (4, -1, 9))
+        self.assertEqual(next(points), (2, 1, 1))
+        self.assertEqual(tuple(translated), ((6, -1, 9), (7, -1, 9), (8, -1, 9)))
+
+
+    def test_irotate_matches_rotate(self):
+        self.assertPointsAlmostEqual(
+         tuple(irotate(iter(self.points), "y", 33, hand="left")),
+         rotate(self.points, "y", 33, hand="left")
+        )
+
+
+    def test_can_stream_in_chunks(self):
+        chunks = list(itranslate(iter(self.points), 1, 1, 1, chunk_size=2))
+        self.assertEqual(chunks, [
+         ((2, 2, 2), (3, 2, 2)), ((4, 2, 2), (5, 2, 2)), ((6, 2, 2),)
+        ])
+
+
+    def test_can_stream_objects(self):
+        obj = Mock()
+        obj.x.return_value, obj.y.return_value, obj.z.return_value = 1, 2, 3
+        self.assertEqual(tuple(itranslate([obj], 1, 1, 1)), ((2, 3, 4),))
+
+
+    def test_arguments_are_checked_immediately(self):
+        with self.assertRaises(TypeError):
+            itranslate(self.points, "3", -2, 8)
+        with self.assertRaises(ValueError):
+            irotate(self.points, "a", 90)
+        with self.assertRaises(TypeError):
+            itranslate(self.points, 3, -2, 8, chunk_size=2.5)
+        with self.assertRaises(ValueError):
+            itranslate(self.points, 3, -2, 8, chunk_size=0)
+
+
+
+class OutputBufferTests(TransformationTest):
+
+    def test_can_translate_into_array(self):
+        out = array("d", [0] * 15)
+        self.assertIs(translate(self.points, 3, -2, 8, out=out), out)
+        self.assertEqual(
+         list(PointSet.from_buffer(out)), list(translate(self.points, 3, -2, 8))
+        )
+
+
+    def test_can_rotate_into_bytearray(self):
+        out = bytearray(15 * 8)
+        self.assertIs(rotate(self.points, "x", 37, out=out), out)
+        self.assertPointsAlmostEqual(
+         list(PointSet.from_buffer(out)), rotate(self.points, "x", 37)
+        )
+
+
+    def test_can_apply_transform_into_memoryview(self):
+        out = memoryview(array("d", [0] * 15))
+        transform = Transform.rotation("y", 37) @ Transform.translation(1, 2, 3)
+        self.assertIs(transform.apply(self.points, out=out), out)
+        self.assertPointsAlmostEqual(
+         list(PointSet.from_buffer(out)), transform.apply(self.points)
+        )
+
+
+    def test_can_transform_buffer_in_place(self):
+        data = array("d", [1, 1, 1, 2, 1, 1])
+        rotate(PointSet.from_buffer(data), "z", 90, out=data)
+        self.assertEqual(list(data), [-1, 1, 1, -1, 2, 1])
+
+
+    def test_can_write_points_without_transforming(self):
+        out = array("d", [0] * 6)
+        write_points([(1, 2, 3), (4, 5, 6)], out)
+        self.assertEqual(list(out), [1, 2, 3, 4, 5, 6])
+
+
+    def test_buffer_must_be_right_size(self):
+        with self.assertRaises(ValueError):
+            translate(self.points, 3, -2, 8, out=array("d", [0] * 12))
+
+
+    def test_buffer_must_be_writable(self):
+        with self.assertRaises(TypeError):
+            translate(self.points, 3, -2, 8, out=bytes(15 * 8))
+
+
+    def test_buffer_must_contain_doubles(self):
+        with self.assertRaises(TypeError):
+            translate(self.points, 3, -2, 8, out=array("i", [0] * 15))
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_rotate_array_into_array(self):
+        points = numpy.array(self.points, dtype=float)
+        out = numpy.zeros((5, 3))
+        self.assertIs(rotate(points, "z", 37, out=out), out)
+        self.assertPointsAlmostEqual(out.tolist(), rotate(self.points, "z", 37))
+        rotate(points, "z", 37, out=points)
+        self.assertPointsAlmostEqual(points.tolist(), rotate(self.points, "z", 37))
+
+
+
 class ObjectAcceptanceDecoratorTests(TestCase):
 
     def setUp(self):
@@ -129,3 +580,203 @@ class ObjectAcceptanceDecoratorTests(TestCase):
     def test_decorator_ignores_already_fine_points(self):
         new_func = accept_objects(self.func)
         self.assertEqual(new_func([(1, 1, 1), (2, 2, 2)], 3, 4, 5), [(4, 5, 6), (5, 6, 7)])
+
+
+    def test_decorator_does_not_copy_lists_of_points(self):
+        new_func = accept_objects(lambda points: points)
+        points = [(1, 1, 1), (2, 2, 2)]
+        self.assertIs(new_func(points), points)
+
+
+    def test_decorator_checks_kind_once(self):
+        class Atom:
+            def __init__(self, value):
+                self.value, self.calls = value, 0
+            def x(self):
+                self.calls += 1
+                return self.value
+            y = z = x
+        atoms = [Atom(1), Atom(2)]
+        self.assertEqual(translate(atoms, 1, 1, 1), ((2, 2, 2), (3, 3, 3)))
+        self.assertEqual([atom.calls for atom in atoms], [3, 3])
+
+
+    def test_decorator_accepts_coordinates_method(self):
+        obj1, obj2 = Mock(), Mock()
+        obj1.coordinates.return_value = (1, 1, 1)
+        obj2.coordinates.return_value = (2, 2, 2)
+        new_func = accept_objects(self.func)
+        self.assertEqual(new_func([obj1, obj2], 3, 4, 5), [(4, 5, 6), (5, 6, 7)])
+        self.assertFalse(obj1.x.called)
+
+
+    def test_decorator_accepts_generators(self):
+        new_func = accept_objects(self.func)
+        points = ((n, n, n) for n in (1, 2))
+        self.assertEqual(new_func(points, 3, 4, 5), [(4, 5, 6), (5, 6, 7)])
+
+
+    def test_decorator_accepts_buffers(self):
+        data = array("d", [1, 1, 1, 2, 2, 2])
+        result = translate(data, 3, 4, 5)
+        self.assertIsInstance(result, PointSet)
+        self.assertEqual(result.points(), ((4, 5, 6), (5, 6, 7)))
+        self.assertEqual(list(data), [1, 1, 1, 2, 2, 2])
+
+
+
+class WriteBackTests(TransformationTest):
+
+    def test_can_write_back_to_lists(self):
+        points = [[1, 1, 1], [2, 2, 2]]
+        translate(points, 1, 2, 3, write_back=True)
+        self.assertEqual(points, [[2, 3, 4], [3, 4, 5]])
+
+
+    def test_cannot_write_back_to_tuples(self):
+        with self.assertRaises(TypeError):
+            translate(self.points, 1, 2, 3, write_back=True)
+
+
+    def test_mixed_coordinates_rejected_before_writing(self):
+        points = [[1, 2, 3], (4, 5, 6)]
+        with self.assertRaises(TypeError):
+            translate(points, 1, 1, 1, write_back=True)
+        self.assertEqual(points, [[1, 2, 3], (4, 5, 6)])
+
+
+    def test_cannot_write_back_to_read_only_buffers(self):
+        with self.assertRaises(TypeError):
+            translate(bytes(24), 1, 1, 1, write_back=True)
+
+
+    def test_can_write_back_to_xyz_objects(self):
+        obj = Mock()
+        obj.x.return_value, obj.y.return_value, obj.z.return_value = 1, 1, 1
+        rotate([obj], "x", 90, write_back=True)
+        obj.x.assert_called_with(1)
+        obj.y.assert_called_with(-1)
+        obj.z.assert_called_with(1)
+
+
+    def test_can_write_back_to_coordinates_objects(self):
+        obj = Mock()
+        obj.coordinates.return_value = (1, 1, 1)
+        translate((obj for _ in range(1)), 1, 2, 3, write_back=True)
+        obj.coordinates.assert_called_with(2, 3, 4)
+
+
+    def test_can_write_back_to_pointsets_and_buffers(self):
+        data = array("d", [1, 1, 1])
+        translate(data, 1, 2, 3, write_back=True)
+        self.assertEqual(list(data), [2, 3, 4])
+        pointset = PointSet([(1, 1, 1)])
+        Transform.rotation("z", 90).apply(pointset, write_back=True)
+        self.assertEqual(pointset.points(), ((-1, 1, 1),))
+
+
+    def test_can_write_back_from_output_buffer(self):
+        obj = Mock()
+        obj.coordinates.return_value = (1, 1, 1)
+        out = array("d", [0, 0, 0])
+        translate([obj], 1, 2, 3, out=out, write_back=True)
+        obj.coordinates.assert_called_with(2, 3, 4)
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_write_back_to_arrays(self):
+        points = numpy.array([(1, 1, 1), (2, 2, 2)], dtype=float)
+        translate(points, 1, 2, 3, write_back=True)
+        self.assertEqual(points.tolist(), [[2, 3, 4], [3, 4, 5]])
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_cannot_write_back_to_integer_arrays(self):
+        points = numpy.array([(1, 1, 1), (2, 2, 2)])
+        with self.assertRaises(TypeError):
+            rotate(points, "x", 45, write_back=True)
+        self.assertEqual(points.tolist(), [[1, 1, 1], [2, 2, 2]])
+
+
+
+class PrecisionTests(TransformationTest):
+
+    def setUp(self):
+        TransformationTest.setUp(self)
+        self.transform = Transform.rotation(
+         (1, 2, 3), 37, pivot=(100, -50, 20)
+        ) @ Transform.translation(300, 20, -10)
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_arrays_can_be_transformed_in_float32(self):
+        points = numpy.random.default_rng(1).uniform(-1000, 1000, (500, 3))
+        expected = self.transform.apply(points)
+        result = self.transform.apply(points, dtype="float32")
+        self.assertEqual(result.dtype, numpy.float32)
+        translation = max(abs(value) for value in numpy.array(
+         self.transform.rows()
+        )[:3, 3])
+        for point, row1, row2 in zip(points, result, expected):
+            scale = abs(point).max() + translation
+            self.assertLessEqual(abs(row1 - row2).max(), 6e-7 * scale)
+        self.assertEqual(
+         translate(points, 1, 2, 3, dtype="float32").dtype, numpy.float32
+        )
+        self.assertEqual(
+         rotate(points, "x", 30, dtype="float32").dtype, numpy.float32
+        )
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_float32_arrays_are_float64_by_default(self):
+        points = numpy.array(self.points, dtype=numpy.float32)
+        self.assertEqual(translate(points, 1, 2, 3).dtype, numpy.float64)
+        self.assertEqual(rotate(points, "x", 30).dtype, numpy.float64)
+        self.assertEqual(
+         translate(points, 1, 2, 3, dtype="float32").dtype, numpy.float32
+        )
+
+
+    def test_pointsets_can_be_transformed_in_float32(self):
+        pointset = PointSet(self.points)
+        result = self.transform.apply(pointset, dtype="float32")
+        self.assertEqual(result.dtype(), "float32")
+        self.assertEqual(pointset.dtype(), "float64")
+        self.assertPointsAlmostEqual(
+         result.points(), self.transform.apply(self.points)
+        )
+        self.assertEqual(
+         translate(pointset, 1, 2, 3, dtype="float32").dtype(), "float32"
+        )
+        self.assertEqual(rotate(
+         result, "x", 30, pivot=(1, 1, 1), dtype="float64"
+        ).dtype(), "float64")
+
+
+    def test_can_write_to_float32_buffer(self):
+        out = array("f", [0] * 15)
+        translate(self.points, 1, 2, 3, out=out)
+        self.assertEqual(list(out[:3]), [2, 3, 4])
+        out = array("f", [0] * 15)
+        translate(PointSet(self.points), 1, 2, 3, out=out)
+        self.assertEqual(list(out[:3]), [2, 3, 4])
+
+
+    def test_dtype_must_be_valid(self):
+        with self.assertRaises(ValueError):
+            translate(self.points, 1, 2, 3, dtype="float16")
+        with self.assertRaises(ValueError):
+            rotate(self.points, "x", 30, dtype=float)
+        with self.assertRaises(ValueError):
+            Transform().apply(self.points, dtype="int")
+
+
+    @skipIf(numpy is None, "NumPy not installed")
+    def test_can_write_back_to_float32_arrays(self):
+        points = numpy.array(self.points, dtype=numpy.float32)
+        rotate(points, "z", 90, write_back=True, dtype="float32")
+        self.assertEqual(points.dtype, numpy.float32)
+        self.assertPointsAlmostEqual(
+         points.tolist(), rotate(self.points, "z", 90)
+        )
@@ -1,5 +1,14 @@
-from unittest import TestCase
-from geometrica.trig import sine_law, cosine_law
+from math import isnan
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from geometrica.trig import sine_law, cosine_law, sine_laws, cosine_laws
+from geometrica.trig import solve_triangle, triangle_cache_info
+from geometrica.trig import clear_triangle_cache
+from geometrica.checks import trusted_inputs
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class SineLawTests(TestCase):
 
@@ -110,3 +119,275 @@ class CosineLawTests(TestCase):
     def test_need_to_supply_angle_or_side3(self):
         with self.assertRaises(TypeError):
             cosine_law(side1=60, side2=50)
+
+
+
+class BatchedLawTest(TestCase):
+
+    def assertValuesAlmostEqual(self, values1, values2, delta=0.005):
+        self.assertEqual(len(values1), len(values2))
+        for value1, value2 in zip(values1, values2):
+            if isnan(value2):
+                self.assertTrue(isnan(value1))
+            else:
+                self.assertAlmostEqual(value1, value2, delta=delta)
+
+
+
+class SineLawsTests(BatchedLawTest):
+
+    def test_can_get_sides(self):
+        self.assertValuesAlmostEqual(
+         sine_laws(side1=[2, 7], angle1=[30, 35], angle2=[105, 105]),
+         [3.86, 11.79]
+        )
+        self.assertValuesAlmostEqual(
+         sine_laws(side2=[2, 7], angle2=[30, 35], angle1=105), [3.86, 11.79]
+        )
+
+
+    def test_can_get_angles(self):
+        self.assertValuesAlmostEqual(
+         sine_laws(angle1=[40, 35], side1=[30, 7], side2=[40, 11.8]),
+         [58.99, 75.21]
+        )
+        self.assertValuesAlmostEqual(
+         sine_laws(angle2=[40, 35], side2=[30, 7], side1=[40, 11.8]),
+         [58.99, 75.21]
+        )
+
+
+    def test_obtuse_can_be_per_triangle(self):
+        self.assertValuesAlmostEqual(
+         sine_laws(angle1=33, side1=6, side2=[10, 10], obtuse=[False, True]),
+         [65.2, 114.8], delta=0.05
+        )
+        self.assertValuesAlmostEqual(
+         sine_laws(angle1=33, side1=6, side2=[10, 10], obtuse=True),
+         [114.8, 114.8], delta=0.05
+        )
+
+
+    def test_impossible_triangles_give_nan(self):
+        self.assertValuesAlmostEqual(
+         sine_laws(angle1=[40, 80], side1=[30, 1], side2=[40, 100]),
+         [58.99, float("nan")]
+        )
+
+
+    def test_matches_scalar_version(self):
+        self.assertValuesAlmostEqual(
+         sine_laws(side1=[7], angle1=[35], side2=[11.8], obtuse=[True]),
+         [sine_law(side1=7, angle1=35, side2=11.8, obtuse=True)], delta=1e-9
+        )
+
+
+    def test_arguments_must_be_numeric(self):
+        with self.assertRaises(TypeError):
+            sine_laws(side1=["2"], angle1=[30], angle2=[105])
+        with self.assertRaises(TypeError):
+            sine_laws(side1=[2], angle1=[True], angle2=[105])
+        with self.assertRaises(TypeError):
+            sine_laws(side1="2", angle1=[30], angle2=[105])
+
+
+    def test_lengths_must_match(self):
+        with self.assertRaises(ValueError):
+            sine_laws(side1=[2, 3], angle1=[30], angle2=[105])
+        with self.assertRaises(ValueError):
+            sine_laws(side1=[2, 3], angle1=30, angle2=105, obtuse=[True])
+
+
+    def test_three_arguments_must_be_supplied(self):
+        with self.assertRaises(TypeError):
+            sine_laws(angle1=[100], angle2=[90])
+        with self.assertRaises(TypeError):
+            sine_laws(angle1=[100], angle2=[90], side1=[20], side2=[100])
+
+
+
+class CosineLawsTests(BatchedLawTest):
+
+    def test_can_get_sides(self):
+        self.assertValuesAlmostEqual(
+         cosine_laws([12, 5], [9, 9], angle=[87, 62.2]), [14.6, 8.0], delta=0.05
+        )
+
+
+    def test_can_get_angles(self):
+        self.assertValuesAlmostEqual(
+         cosine_laws([60, 1], [50, 1], side3=[20, 5]), [18.2, float("nan")], delta=0.05
+        )
+
+
+    def test_arguments_must_be_numeric(self):
+        with self.assertRaises(TypeError):
+            cosine_laws(["12"], [9], angle=[87])
+        with self.assertRaises(TypeError):
+            cosine_laws([12], [9], side3=[None])
+
+
+    def test_lengths_must_match(self):
+        with self.assertRaises(ValueError):
+            cosine_laws([12, 13], [9], angle=[87, 88])
+
+
+    def test_need_exactly_one_of_angle_and_side3(self):
+        with self.assertRaises(TypeError):
+            cosine_laws([60], [50])
+        with self.assertRaises(TypeError):
+            cosine_laws([60], [50], side3=[20], angle=[100])
+
+
+
+class PurePythonSineLawsTests(SineLawsTests):
+
+    def setUp(self):
+        patcher = patch("geometrica.trig.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+class PurePythonCosineLawsTests(CosineLawsTests):
+
+    def setUp(self):
+        patcher = patch("geometrica.trig.numpy", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+
+@skipIf(numpy is None, "NumPy not installed")
+class ArrayLawsTests(BatchedLawTest):
+
+    def test_sine_laws_accept_arrays(self):
+        self.assertValuesAlmostEqual(sine_laws(
+         numpy.array([2., 7.]), numpy.array([30., 35.]), None,
+         numpy.array([105., 105.])
+        ), [3.86, 11.79])
+        self.assertValuesAlmostEqual(sine_laws(
+         numpy.array([30., 7.]), numpy.array([40., 35.]),
+         numpy.array([40., 11.8])
+        ), [58.99, 75.21])
+
+
+    def test_cosine_laws_accept_arrays(self):
+        self.assertValuesAlmostEqual(cosine_laws(
+         numpy.array([3., 5.]), numpy.array([4., 9.]),
+         angle=numpy.array([90., 62.182])
+        ), [5, 8])
+
+
+
+class SolveTriangleTests(BatchedLawTest):
+
+    def setUp(self):
+        clear_triangle_cache()
+        self.expected = (5, 9, 8, 33.557, 84.261, 62.182, 19.900)
+
+
+    def test_can_solve_from_three_sides(self):
+        self.assertValuesAlmostEqual(
+         solve_triangle(a=5, b=9, c=8), self.expected
+        )
+
+
+    def test_can_solve_from_two_sides_and_their_angle(self):
+        self.assertValuesAlmostEqual(
+         solve_triangle(b=9, c=8, A=33.557), self.expected
+        )
+        self.assertValuesAlmostEqual(
+         solve_triangle(a=5, b=9, C=62.182), self.expected
+        )
+
+
+    def test_can_solve_from_side_and_two_angles(self):
+        self.assertValuesAlmostEqual(
+         solve_triangle(a=5, A=33.557, B=84.261), self.expected
+        )
+        self.assertValuesAlmostEqual(
+         solve_triangle(c=8, A=33.557, B=84.261), self.expected
+        )
+
+
+    def test_can_solve_ambiguous_case(self):
+        acute = (7, 9, 10.836, 40, 55.735, 84.265, 31.342)
+        obtuse = (7, 9, 2.953, 40, 124.265, 15.735, 8.542)
+        self.assertValuesAlmostEqual(solve_triangle(a=7, b=9, A=40), acute)
+        self.assertValuesAlmostEqual(
+         solve_triangle(a=7, b=9, A=40, obtuse=True), obtuse
+        )
+        solutions = solve_triangle(a=7, b=9, A=40, all_solutions=True)
+        self.assertEqual(len(solutions), 2)
+        self.assertValuesAlmostEqual(solutions[0], acute)
+        self.assertValuesAlmostEqual(solutions[1], obtuse)
+
+
+    def test_ambiguous_case_can_have_one_solution(self):
+        self.assertEqual(
+         len(solve_triangle(a=9, b=7, A=40, all_solutions=True)), 1
+        )
+        self.assertValuesAlmostEqual(
+         solve_triangle(a=1, b=2, A=30), (1, 2, 1.732, 30, 90, 60, 0.866)
+        )
+        self.assertEqual(
+         solve_triangle(a=9, b=7, A=40, obtuse=True),
+         solve_triangle(a=9, b=7, A=40)
+        )
+
+
+    def test_results_are_named(self):
+        triangle = solve_triangle(a=3, b=4, c=5)
+        self.assertEqual(triangle.C, 90)
+        self.assertEqual(triangle.area, 6)
+
+
+    def test_impossible_triangles(self):
+        for known in (
+         {"a": 1, "b": 2, "c": 4}, {"a": 1, "b": 5, "A": 30},
+         {"a": 1, "A": 100, "B": 80}
+        ):
+            with self.assertRaises(ValueError):
+                solve_triangle(**known)
+            self.assertEqual(solve_triangle(all_solutions=True, **known), ())
+
+
+    def test_values_must_be_positive_numbers(self):
+        with self.assertRaises(TypeError):
+            solve_triangle(a="5", b=9, c=8)
+        with self.assertRaises(TypeError):
+            solve_triangle(a=True, b=9, c=8)
+        with self.assertRaises(ValueError):
+            solve_triangle(a=-5, b=9, c=8)
+
+
+    def test_angles_must_be_less_than_180(self):
+        for known in (
+         {"a": 3, "b": 4, "C": 200}, {"a": 3, "b": 4, "A": 200},
+         {"a": 3, "b": 4, "C": 180}, {"a": 3, "B": 180, "C": 10}
+        ):
+            with self.assertRaises(ValueError):
+                solve_triangle(**known)
+            with trusted_inputs():
+                self.assertEqual(solve_triangle(all_solutions=True, **known), ())
+
+
+    def test_three_values_including_a_side_must_be_supplied(self):
+        with self.assertRaises(TypeError):
+            solve_triangle(a=5, b=9)
+        with self.assertRaises(TypeError):
+            solve_triangle(a=5, b=9, c=8, A=33)
+        with self.assertRaises(TypeError):
+            solve_triangle(A=60, B=60, C=60)
+
+
+    def test_triangles_are_cached(self):
+        first = solve_triangle(a=5, b=9, c=8)
+        self.assertIs(solve_triangle(a=5, b=9, c=8), first)
+        info = triangle_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertEqual(solve_triangle(a=5, b=9, c=8, cache=False), first)
+        self.assertEqual(triangle_cache_info().hits, 1)
+        clear_triangle_cache()
+        self.assertEqual(triangle_cache_info().currsize, 0)